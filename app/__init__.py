@@ -1,4 +1,15 @@
-from sqlalchemy.ext.declarative import declarative_base
+"""Paquet applicatif Epic Events.
 
-# Base pour toutes les tables
-Base = declarative_base()
+Aucun import lourd n’est effectué ici : la base déclarative partagée par
+les modèles reste accessible sous ``app.Base`` mais n’est chargée
+(avec SQLAlchemy) qu’au premier accès.
+"""
+
+
+def __getattr__(name: str):
+    """Résout paresseusement ``app.Base`` (cf. :mod:`app.models.base`)."""
+    if name == "Base":
+        from app.models.base import Base
+
+        return Base
+    raise AttributeError(f"module 'app' has no attribute {name!r}")
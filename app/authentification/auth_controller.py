@@ -5,7 +5,8 @@ jetons **JWT** pour l’application EpicEvents.
 
 Fonctions :
     • register_user()  – création d’un collaborateur (hash Argon2)
-    • authenticate_user()  – vérification e‑mail / mot de passe
+    • authenticate_user()  – vérification e‑mail / mot de passe, précédée
+                             d’une limitation du débit (cf. login_throttle)
     • generate_token()  – génération d’un JWT signé et horodaté
     • verify_token()    – décodage + contrôles d’intégrité / expiration
     • is_authorized()   – test d’appartenance à un ou plusieurs rôles
@@ -14,37 +15,51 @@ from __future__ import annotations
 
 import datetime as dt
 import os
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
-import jwt
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from app.authentification.login_throttle import (
+    LoginThrottle,
+    default_source,
+    throttle_from_env,
+)
+from app.config.env import load_env
 from app.models.user import User
 
+
 # --------------------------------------------------------------------------- #
-# Chargement des variables d’environnement                                    #
+# Lecture des variables d’environnement (à la première instanciation)         #
 # --------------------------------------------------------------------------- #
-_JWT_SECRET: str | None = os.getenv("JWT_SECRET")          # obligatoire
-if not _JWT_SECRET:
-    raise RuntimeError(
-        "Variable d’environnement JWT_SECRET manquante; "
-        "merci de la renseigner dans .env ou votre gestionnaire de secrets."
+def _jwt_settings() -> Tuple[str, str, int]:
+    """Renvoie ``(secret, algorithme, durée)`` après lecture du `.env`."""
+    load_env()
+    secret: str | None = os.getenv("JWT_SECRET")          # obligatoire
+    if not secret:
+        raise RuntimeError(
+            "Variable d’environnement JWT_SECRET manquante; "
+            "merci de la renseigner dans .env ou votre gestionnaire de secrets."
+        )
+    return (
+        secret,
+        os.getenv("JWT_ALGORITHM"),
+        int(os.getenv("JWT_EXPIRATION_MINUTES")),
     )
 
-_JWT_ALGO: str = os.getenv("JWT_ALGORITHM")
-_JWT_EXP_MIN: int = int(os.getenv("JWT_EXPIRATION_MINUTES"))
-
 
 class AuthController:
     """Contrôleur d’authentification et d’autorisation (JWT)."""
 
-    def __init__(self) -> None:
+    def __init__(self, throttle: LoginThrottle | None = None) -> None:
+        (
+            self.jwt_secret,
+            self.jwt_algorithm,
+            self.jwt_expiration_minutes,
+        ) = _jwt_settings()
         self.hasher: PasswordHasher = PasswordHasher()
-        self.jwt_secret: str = _JWT_SECRET
-        self.jwt_algorithm: str = _JWT_ALGO
-        self.jwt_expiration_minutes: int = _JWT_EXP_MIN
+        self.throttle: LoginThrottle = throttle or throttle_from_env()
 
     # ------------------------------------------------------------------ #
     # CRUD UTILISATEUR                                                   #
@@ -76,23 +91,43 @@ class AuthController:
     # AUTHENTIFICATION                                                   #
     # ------------------------------------------------------------------ #
     def authenticate_user(
-        self, session: Session, email: str, password: str
+        self,
+        session: Session,
+        email: str,
+        password: str,
+        source: str | None = None,
     ) -> User | None:
-        """Retourne l’objet User si les identifiants sont valides, sinon None."""
-        user: User | None = session.query(User).filter_by(email=email).first()
+        """
+        Retourne l’objet User si les identifiants sont valides, sinon None.
+
+        La tentative passe d’abord par :attr:`throttle` : si le seau de
+        l’e‑mail ou de la *source* (``utilisateur@hôte`` par défaut) est
+        vide, :class:`TooManyAttemptsError` est levée **avant** tout
+        hachage Argon2.
+        """
+        source = source or default_source()
+        self.throttle.acquire(session, email, source)
+
+        # Rôle chargé d’emblée : lu après fermeture de la session (login).
+        user: User | None = (session.query(User)
+                             .options(joinedload(User.role))
+                             .filter_by(email=email).first())
         if user is None:
             return None
         try:
             self.hasher.verify(user.password_hash, password)
-            return user
         except VerifyMismatchError:
             return None
+        self.throttle.release(session, email, source)
+        return user
 
     # ------------------------------------------------------------------ #
     # JWT                                                                 #
     # ------------------------------------------------------------------ #
     def generate_token(self, user: User) -> str:
         """Génère un JWT signé contenant id, e‑mail, rôle et date d’expiration."""
+        import jwt
+
         payload: Dict[str, Any] = {
             "user_id": user.id,
             "email": user.email,
@@ -105,6 +140,8 @@ class AuthController:
 
     def verify_token(self, token: str) -> dict:
         """Décode un JWT et lève une Exception explicite s’il est invalide."""
+        import jwt
+
         try:
             return jwt.decode(
                 token, self.jwt_secret, algorithms=[self.jwt_algorithm]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Limitation du débit des tentatives de connexion
+===============================================
+
+Chaque échec d’authentification coûte une vérification **Argon2**
+complète ; un script de *credential stuffing* peut donc saturer tous les
+cœurs du poste.  Ce module place deux seaux à jetons (*token buckets*)
+devant :meth:`AuthController.authenticate_user` :
+
+* un seau **par e‑mail** (protège un compte ciblé) ;
+* un seau **par source** (protège la machine contre un balayage de
+  nombreux comptes depuis la même origine).
+
+Une tentative consomme un jeton dans chacun des deux seaux *avant* tout
+hachage ; si l’un d’eux est vide, :class:`TooManyAttemptsError` est levée
+immédiatement.  Une connexion réussie restitue les jetons : seuls les
+échecs comptent réellement.
+
+Deux stockages sont proposés :
+
+* :class:`InMemoryThrottleStore` – par défaut, local au processus ;
+* :class:`SqlThrottleStore`      – table ``login_throttle`` partagée entre
+  plusieurs processus / postes.
+
+Variables d’environnement reconnues
+-----------------------------------
+
+``LOGIN_THROTTLE_BACKEND``            ``memory`` (défaut) ou ``sql``
+``LOGIN_THROTTLE_EMAIL_BURST``        jetons max. par e‑mail (5)
+``LOGIN_THROTTLE_EMAIL_PER_MINUTE``   recharge par minute et par e‑mail (5)
+``LOGIN_THROTTLE_SOURCE_BURST``       jetons max. par source (20)
+``LOGIN_THROTTLE_SOURCE_PER_MINUTE``  recharge par minute et par source (30)
+"""
+from __future__ import annotations
+
+import getpass
+import math
+import os
+import socket
+import threading
+import time
+from typing import Dict, Tuple
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.login_throttle import LoginThrottleBucket
+
+
+class TooManyAttemptsError(PermissionError):
+    """Levée lorsqu’une tentative de connexion est refusée par le limiteur."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            "Trop de tentatives de connexion ; réessayez dans "
+            f"{max(1, math.ceil(retry_after))} s."
+        )
+
+
+class BucketPolicy:
+    """Paramètres d’un seau : capacité et vitesse de recharge."""
+
+    def __init__(self, burst: float, per_minute: float) -> None:
+        self.burst = float(burst)
+        self.rate = float(per_minute) / 60.0  # jetons par seconde
+
+    def refill(self, tokens: float, updated_at: float, now: float) -> float:
+        """Renvoie le nombre de jetons disponibles à l’instant *now*."""
+        elapsed = max(0.0, now - updated_at)
+        return min(self.burst, tokens + elapsed * self.rate)
+
+    def wait_for_token(self, tokens: float) -> float:
+        """Délai (s) avant qu’un jeton entier soit de nouveau disponible."""
+        if self.rate <= 0:
+            return math.inf
+        return max(0.0, (1.0 - tokens) / self.rate)
+
+
+# --------------------------------------------------------------------------- #
+# Stockages                                                                   #
+# --------------------------------------------------------------------------- #
+class InMemoryThrottleStore:
+    """Seaux conservés dans un dictionnaire protégé par un verrou."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, bind, key: str, policy: BucketPolicy, now: float) -> float:
+        """
+        Consomme un jeton du seau *key*.
+
+        Returns
+        -------
+        float
+            ``0.0`` si le jeton a été pris, sinon le délai d’attente (s).
+        """
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (policy.burst, now))
+            tokens = policy.refill(tokens, updated, now)
+            if tokens < 1.0:
+                self._buckets[key] = (tokens, now)
+                return policy.wait_for_token(tokens)
+            self._buckets[key] = (tokens - 1.0, now)
+            return 0.0
+
+    def give_back(self, bind, key: str, policy: BucketPolicy,
+                  now: float) -> None:
+        """Restitue un jeton au seau *key* (sans dépasser la capacité)."""
+        with self._lock:
+            if key not in self._buckets:
+                return
+            tokens, updated = self._buckets[key]
+            tokens = policy.refill(tokens, updated, now)
+            self._buckets[key] = (min(policy.burst, tokens + 1.0), now)
+
+
+def _is_deadlock(exc: OperationalError) -> bool:
+    """Deadlock MySQL (1213) : le serveur a annulé la transaction."""
+    args = getattr(exc.orig, "args", ())
+    return bool(args) and args[0] == 1213
+
+
+class SqlThrottleStore:
+    """
+    Seaux stockés dans la table ``login_throttle``.
+
+    Chaque opération ouvre sa **propre** session (sur le même *bind* que
+    la session d’authentification) afin de ne jamais valider ni annuler la
+    transaction de l’appelant.
+    """
+
+    def take(self, bind, key: str, policy: BucketPolicy, now: float) -> float:
+        """Équivalent SQL de :meth:`InMemoryThrottleStore.take`."""
+        for _attempt in range(2):
+            with Session(bind=bind) as sess:
+                try:
+                    row = sess.get(LoginThrottleBucket, key,
+                                   with_for_update=True)
+                    if row is None:
+                        row = LoginThrottleBucket(
+                            key=key, tokens=policy.burst, updated_at=now)
+                        sess.add(row)
+                    tokens = policy.refill(row.tokens, row.updated_at, now)
+                    wait = 0.0
+                    if tokens < 1.0:
+                        wait = policy.wait_for_token(tokens)
+                    else:
+                        tokens -= 1.0
+                    row.tokens, row.updated_at = tokens, now
+                    sess.commit()
+                except IntegrityError:
+                    # Un autre processus vient de créer le seau : on relit.
+                    sess.rollback()
+                    continue
+                except OperationalError as exc:
+                    # Deux premières tentatives simultanées (verrous de
+                    # « gap » MySQL) : même course, même traitement.
+                    if not _is_deadlock(exc):
+                        raise
+                    sess.rollback()
+                    continue
+                return wait
+        # Course perdue deux fois : on refuse (délai d’un jeton entier)
+        # plutôt que de laisser passer la tentative sans décompte.
+        return policy.wait_for_token(0.0)
+
+    def give_back(self, bind, key: str, policy: BucketPolicy,
+                  now: float) -> None:
+        """Équivalent SQL de :meth:`InMemoryThrottleStore.give_back`."""
+        with Session(bind=bind) as sess:
+            row = sess.get(LoginThrottleBucket, key, with_for_update=True)
+            if row is None:
+                return
+            tokens = policy.refill(row.tokens, row.updated_at, now)
+            row.tokens = min(policy.burst, tokens + 1.0)
+            row.updated_at = now
+            sess.commit()
+
+
+# --------------------------------------------------------------------------- #
+# Limiteur                                                                    #
+# --------------------------------------------------------------------------- #
+def default_source() -> str:
+    """Identifie la source locale d’une tentative (``utilisateur@hôte``)."""
+    try:
+        user = getpass.getuser()
+    except Exception:                 # pragma: no cover — environnement exotique
+        user = "inconnu"
+    return f"{user}@{socket.gethostname()}"
+
+
+class LoginThrottle:
+    """Combine un seau *par e‑mail* et un seau *par source*."""
+
+    def __init__(
+        self,
+        store=None,
+        email_policy: BucketPolicy | None = None,
+        source_policy: BucketPolicy | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        self.store = store if store is not None else InMemoryThrottleStore()
+        self.email_policy = email_policy or BucketPolicy(5, 5)
+        self.source_policy = source_policy or BucketPolicy(20, 30)
+        self._clock = clock
+
+    # ------------------------------------------------------------------ #
+    def _keys(self, email: str, source: str) -> Tuple[str, str]:
+        """Clés de seau normalisées pour *email* et *source*."""
+        return f"email:{email.strip().lower()}", f"source:{source}"
+
+    def acquire(self, session: Session, email: str, source: str) -> None:
+        """
+        Réserve un jeton e‑mail et un jeton source, ou lève
+        :class:`TooManyAttemptsError` sans rien consommer.
+        """
+        bind = session.get_bind()
+        email_key, source_key = self._keys(email, source)
+        now = self._clock()
+
+        wait = self.store.take(bind, email_key, self.email_policy, now)
+        if wait:
+            raise TooManyAttemptsError(wait)
+        wait = self.store.take(bind, source_key, self.source_policy, now)
+        if wait:
+            self.store.give_back(bind, email_key, self.email_policy, now)
+            raise TooManyAttemptsError(wait)
+
+    def release(self, session: Session, email: str, source: str) -> None:
+        """Restitue les jetons après une authentification réussie."""
+        bind = session.get_bind()
+        email_key, source_key = self._keys(email, source)
+        now = self._clock()
+        self.store.give_back(bind, email_key, self.email_policy, now)
+        self.store.give_back(bind, source_key, self.source_policy, now)
+
+
+def throttle_from_env() -> LoginThrottle:
+    """Construit un limiteur à partir des variables ``LOGIN_THROTTLE_*``."""
+    backend = os.getenv("LOGIN_THROTTLE_BACKEND", "memory").lower()
+    if backend == "sql":
+        store = SqlThrottleStore()
+        clock = time.time          # horloge partagée entre processus
+    else:
+        store = InMemoryThrottleStore()
+        clock = time.monotonic
+    return LoginThrottle(
+        store,
+        BucketPolicy(
+            float(os.getenv("LOGIN_THROTTLE_EMAIL_BURST", "5")),
+            float(os.getenv("LOGIN_THROTTLE_EMAIL_PER_MINUTE", "5")),
+        ),
+        BucketPolicy(
+            float(os.getenv("LOGIN_THROTTLE_SOURCE_BURST", "20")),
+            float(os.getenv("LOGIN_THROTTLE_SOURCE_PER_MINUTE", "30")),
+        ),
+        clock,
+    )
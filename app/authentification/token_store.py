@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Persistance du jeton JWT entre deux appels de la CLI non interactive.
+
+Après ``python -m main login``, le jeton est écrit dans un fichier lisible
+par le seul utilisateur (``0600``) ; les commandes suivantes le relisent
+et le vérifient (signature + expiration) sans nouvelle saisie ni
+hachage Argon2.
+
+Emplacement : ``EPIC_TOKEN_FILE`` ou, à défaut,
+``~/.epic_events/token``.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+class TokenStore:
+    """Lecture / écriture du jeton dans un fichier privé."""
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = Path(
+            path
+            or os.getenv("EPIC_TOKEN_FILE")
+            or Path.home() / ".epic_events" / "token"
+        )
+
+    def save(self, token: str) -> None:
+        """Enregistre *token* (fichier créé en ``0600``)."""
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(token)
+
+    def load(self) -> str | None:
+        """Renvoie le jeton enregistré, ou ``None``."""
+        try:
+            token = self.path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return token or None
+
+    def clear(self) -> None:
+        """Supprime le jeton enregistré (déconnexion)."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,100 @@
+# app/config/async_database.py
+# -*- coding: utf-8 -*-
+"""
+Connexion **asynchrone** à la base (extension ``sqlalchemy.ext.asyncio``).
+
+:class:`AsyncDatabaseConnection` est le pendant asyncio de
+:class:`~app.config.database.DatabaseConnection` : même configuration
+(:class:`~app.config.database.DatabaseConfig`), même pool, mêmes pragmas
+SQLite, mais des :class:`AsyncSession` servies par ``aiomysql`` ou
+``aiosqlite``.
+
+Ces pilotes (et ``greenlet``) ne sont importés qu’à la création de
+l’*engine* ; la CLI synchrone n’en dépend pas.
+"""
+from __future__ import annotations
+
+from app.config.database import DatabaseConfig
+
+
+class AsyncDatabaseConnection:
+    """
+    Fabrique d’*engine* et de sessions asynchrones.
+
+    Exemple d’utilisation
+    ---------------------
+    >>> db = AsyncDatabaseConnection(DatabaseConfig())
+    >>> async with db.create_session() as session:
+    ...     await session.execute(...)
+    >>> await db.dispose()
+    """
+
+    def __init__(self, config: DatabaseConfig) -> None:
+        self.config = config
+        self._engine = None
+        self._session_factory = None
+        self.pool_metrics = None
+        self.sql_instrumentation = None
+
+    # ------------------------------------------------------------------
+    # Création différée
+    # ------------------------------------------------------------------
+    @property
+    def engine(self):
+        """*AsyncEngine* créé au premier accès."""
+        if self._engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            from app.observability.pool_metrics import PoolMetrics
+            from app.observability.sql_instrumentation import (
+                install_sql_instrumentation,
+            )
+
+            self._engine = create_async_engine(
+                self.config.async_database_url(),
+                echo=False,
+                **self.config.engine_options(),
+            )
+            # Les écouteurs d’événements se posent sur l’engine synchrone.
+            sync_engine = self._engine.sync_engine
+            if self.config.is_sqlite:
+                from app.config.sqlite import install_sqlite_pragmas
+
+                install_sqlite_pragmas(sync_engine, self.config)
+            self.pool_metrics = PoolMetrics(sync_engine)
+            self.sql_instrumentation = install_sql_instrumentation(
+                sync_engine)
+        return self._engine
+
+    @property
+    def SessionLocal(self):
+        """Fabrique d’:class:`AsyncSession`."""
+        if self._session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            # Pas d’expiration au commit : un attribut expiré ne peut être
+            # rechargé implicitement hors de la boucle d’événements.
+            self._session_factory = async_sessionmaker(
+                self.engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._session_factory
+
+    # ------------------------------------------------------------------
+    # API public
+    # ------------------------------------------------------------------
+    def create_session(self):
+        """Nouvelle :class:`AsyncSession` (à utiliser avec ``async with``)."""
+        return self.SessionLocal()
+
+    async def dispose(self) -> None:
+        """Ferme toutes les connexions du pool."""
+        if self._engine is not None:
+            await self._engine.dispose()
+
+    def pool_stats(self) -> dict:
+        """Statistiques du pool ; vide tant que l’*engine* n’existe pas."""
+        if self.pool_metrics is None:
+            return {}
+        return self.pool_metrics.snapshot()
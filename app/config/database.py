@@ -9,18 +9,18 @@ Ce module lit les variables d’environnement définies dans le fichier
 * **DatabaseConfig** – objet léger qui stocke la configuration.
 * **DatabaseConnection** – fabrique d’engine et de sessions SQLAlchemy.
 
+Le fichier ``.env`` n’est lu qu’à la construction de la configuration et
+l’*engine* n’est créé qu’à la première session : importer ce module ne
+coûte donc (presque) rien au démarrage de la CLI.
+
 Aucune trace de débogage n’est laissée afin de garder le module propre pour
 la production.
 """
 from __future__ import annotations
 
 import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-# Charge immédiatement les variables d'environnement depuis `.env`
-load_dotenv()
+from app.config.env import load_env
 
 
 class DatabaseConfig:
@@ -37,11 +37,38 @@ class DatabaseConfig:
     * **DB_NAME**     – nom de la base  
     * **SENTRY_DSN**  – (optionnel) DSN Sentry, lu ici pour information
 
+    Réglages (optionnels) du pool de connexions :
+
+    * **DB_POOL_SIZE**      – connexions conservées ouvertes (5)
+    * **DB_MAX_OVERFLOW**   – connexions supplémentaires temporaires (10)
+    * **DB_POOL_TIMEOUT**   – attente max. d’une connexion libre, en s (30)
+    * **DB_POOL_RECYCLE**   – âge max. d’une connexion, en s (1800) ; à
+      garder sous le ``wait_timeout`` de MySQL
+    * **DB_POOL_PRE_PING**  – teste la connexion avant emprunt (true)
+    * **DB_POOL_WARMUP**    – connexions ouvertes dès la création de
+      l’*engine* (1)
+
+    Avec ``DB_ENGINE=sqlite``, seul **DB_NAME** est lu : chemin du fichier
+    de base (créé au besoin) ou ``:memory:`` pour une base en mémoire.  Les
+    *pragmas* appliqués à chaque connexion (cf. :mod:`app.config.sqlite`)
+    se règlent via :
+
+    * **SQLITE_MMAP_SIZE**     – octets projetés en mémoire (256 Mio)
+    * **SQLITE_CACHE_SIZE**    – cache de pages ; négatif = Kio (-65536)
+    * **SQLITE_BUSY_TIMEOUT**  – attente d’un verrou, en ms (5000)
+
     Un attribut supplémentaire ``sqlalchemy_database_url`` est construit
-    automatiquement pour être passé à *SQLAlchemy*.
+    automatiquement pour être passé à *SQLAlchemy*.  Sa variante asynchrone
+    (:meth:`async_database_url`) remplace le pilote par ``aiomysql`` ou
+    ``aiosqlite`` – ou par **DB_ASYNC_ENGINE** s’il est défini.
     """
 
+    #: Pilote asyncio utilisé par défaut pour chaque dialecte.
+    _ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
     def __init__(self) -> None:
+        load_env()
+
         # Paramètres principaux
         self.db_engine: str | None = os.getenv("DB_ENGINE")
         self.db_user: str | None = os.getenv("DB_USER")
@@ -50,14 +77,86 @@ class DatabaseConfig:
         self.db_port: str | None = os.getenv("DB_PORT")
         self.db_name: str | None = os.getenv("DB_NAME")
 
+        # Pool de connexions
+        self.pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.pool_pre_ping: bool = os.getenv(
+            "DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes", "on")
+        self.pool_warmup: int = int(os.getenv("DB_POOL_WARMUP", "1"))
+
         # Information éventuelle pour Sentry (non utilisée ici)
         self.sentry_dsn: str | None = os.getenv("SENTRY_DSN")
 
+        # SQLite : fichier local (ou mémoire) et pragmas de performance
+        self.is_sqlite: bool = (self.db_engine or "").startswith("sqlite")
+        self.sqlite_path: str = self.db_name or ":memory:"
+        self.sqlite_mmap_size: int = int(
+            os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+        self.sqlite_cache_size: int = int(
+            os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+        self.sqlite_busy_timeout: int = int(
+            os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))
+
         # Construction de l’URL que requiert SQLAlchemy
-        self.sqlalchemy_database_url: str = (
-            f"{self.db_engine}://{self.db_user}:{self.db_password}"
-            f"@{self.db_host}:{self.db_port}/{self.db_name}"
-        )
+        if self.is_sqlite:
+            self.sqlalchemy_database_url: str = (
+                "sqlite://" if self.sqlite_path == ":memory:"
+                else f"{self.db_engine}:///{self.sqlite_path}"
+            )
+        else:
+            self.sqlalchemy_database_url = (
+                f"{self.db_engine}://{self.db_user}:{self.db_password}"
+                f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            )
+
+    def setup_settings(self) -> dict:
+        """
+        Réglages appliqués à l’*engine* après sa création (pragmas SQLite,
+        instrumentation SQL) : clé ``setup_key`` du registre d’*engines*.
+        """
+        settings = {
+            "sql_slow_ms": os.getenv("SQL_SLOW_MS", "200"),
+            "sql_query_budget": os.getenv("SQL_QUERY_BUDGET", "0"),
+        }
+        if self.is_sqlite:
+            settings.update(
+                sqlite_mmap_size=self.sqlite_mmap_size,
+                sqlite_cache_size=self.sqlite_cache_size,
+                sqlite_busy_timeout=self.sqlite_busy_timeout,
+            )
+        return settings
+
+    def async_database_url(self) -> str:
+        """URL SQLAlchemy équivalente pour un pilote *asyncio*."""
+        dialect = (self.db_engine or "").split("+")[0]
+        driver = os.getenv("DB_ASYNC_ENGINE") or self._ASYNC_DRIVERS.get(
+            dialect)
+        if driver is None:
+            raise ValueError(
+                f"Aucun pilote asynchrone connu pour « {self.db_engine} ».")
+        head, sep, tail = self.sqlalchemy_database_url.partition("://")
+        return f"{driver}{sep}{tail}"
+
+    def engine_options(self) -> dict:
+        """Arguments nommés passés à ``create_engine`` (réglages du pool)."""
+        if self.is_sqlite and self.sqlite_path == ":memory:":
+            # Une base mémoire n’existe que dans sa connexion : on partage
+            # une connexion unique entre tous les threads.
+            from sqlalchemy.pool import StaticPool
+
+            return {
+                "poolclass": StaticPool,
+                "connect_args": {"check_same_thread": False},
+            }
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
 
 
 class DatabaseConnection:
@@ -74,20 +173,67 @@ class DatabaseConnection:
 
     def __init__(self, config: DatabaseConfig) -> None:
         self.config = config
+        self._engine = None
+        self._session_factory = None
+        self.pool_metrics = None
+        self.sql_instrumentation = None
 
-        # Création de l’engine SQLAlchemy
-        self.engine = create_engine(
-            self.config.sqlalchemy_database_url,
-            echo=False,                 # pas de SQL en sortie standard
-        )
+    # ------------------------------------------------------------------
+    # Création différée
+    # ------------------------------------------------------------------
+    @property
+    def engine(self):
+        """
+        *Engine* SQLAlchemy, obtenu au premier accès.
+
+        L’*engine* vient du registre de processus
+        (:mod:`app.config.engine_registry`) : deux connexions construites
+        sur la même configuration partagent engine, pool et métriques.
+        """
+        if self._engine is None:
+            from app.config.engine_registry import (
+                engine_attachments,
+                get_engine,
+            )
+
+            self._engine = get_engine(
+                self.config.sqlalchemy_database_url,
+                setup=self._setup_engine,
+                setup_key=self.config.setup_settings(),
+                warmup=self.config.pool_warmup,
+                echo=False,             # pas de SQL en sortie standard
+                **self.config.engine_options(),
+            )
+            self.pool_metrics, self.sql_instrumentation = (
+                engine_attachments(self._engine))
+        return self._engine
 
-        # Fabrique de sessions (« sessionmaker »)
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine,
+    def _setup_engine(self, engine):
+        """Équipe un *engine* neuf (appelé une fois par le registre)."""
+        from app.observability.pool_metrics import PoolMetrics
+        from app.observability.sql_instrumentation import (
+            install_sql_instrumentation,
         )
 
+        if self.config.is_sqlite:
+            from app.config.sqlite import install_sqlite_pragmas
+
+            install_sqlite_pragmas(engine, self.config)
+        return PoolMetrics(engine), install_sql_instrumentation(engine)
+
+    @property
+    def SessionLocal(self):
+        """Fabrique de sessions (« sessionmaker ») liée à :attr:`engine`."""
+        if self._session_factory is None:
+            from sqlalchemy.orm import sessionmaker
+
+            self._session_factory = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=self.engine,
+            )
+        return self._session_factory
+
     # ------------------------------------------------------------------
     # API public
     # ------------------------------------------------------------------
@@ -99,3 +245,22 @@ class DatabaseConnection:
         `session.close()` ou contexte *with*) après utilisation.
         """
         return self.SessionLocal()
+
+    def dispose(self) -> None:
+        """Ferme le pool de cette connexion et le retire du registre."""
+        if self._engine is not None:
+            from app.config.engine_registry import dispose_engine
+
+            dispose_engine(self._engine)
+            self._engine = None
+            self._session_factory = None
+
+    def pool_stats(self) -> dict:
+        """
+        Statistiques du pool (cf. :meth:`PoolMetrics.snapshot`).
+
+        Renvoie un dictionnaire vide tant qu’aucune session n’a été ouverte.
+        """
+        if self.pool_metrics is None:
+            return {}
+        return self.pool_metrics.snapshot()
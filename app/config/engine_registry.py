@@ -0,0 +1,137 @@
+# app/config/engine_registry.py
+# -*- coding: utf-8 -*-
+"""
+Registre d’*engines* SQLAlchemy partagé par tout le processus.
+
+Créer un *engine* coûte : construction du pool, initialisation du
+dialecte à la première connexion (version du serveur, encodage…),
+poignée de main réseau.  :func:`get_engine` ne le fait **qu’une fois**
+par triplet *(URL, options, réglages de setup)* ; tous les appelants –
+CLI, ``init``, ``seed``, tests – partagent ensuite le même *engine* et
+le même pool.
+
+* ``setup`` : fonction appelée une seule fois sur l’*engine* créé
+  (pragmas, métriques…) ; ce qu’elle renvoie est conservé et relu par
+  :func:`engine_attachments`.  Les paramètres qu’elle applique
+  (pragmas SQLite…) sont passés dans ``setup_key`` : deux configurations
+  qui ne diffèrent que par eux obtiennent deux *engines* distincts.
+* ``warmup`` : nombre de connexions ouvertes d’emblée puis rendues au
+  pool (initialise le dialecte et amorce le pool).
+* :func:`dispose_all` ferme tous les pools ; elle est enregistrée via
+  :mod:`atexit` à la création du premier *engine*.
+
+Une URL ``sqlite://`` (base mémoire) désigne donc **une** base partagée
+par tous les appelants du processus.
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_lock = threading.Lock()
+_entries: Dict[Tuple[str, str, str], "_Entry"] = {}
+_atexit_registered = False
+
+
+class _Entry:
+    """Engine enregistré et objets associés par ``setup``."""
+
+    def __init__(self, engine, attachments: Any) -> None:
+        self.engine = engine
+        self.attachments = attachments
+
+
+def _key(url: str, options: Dict[str, Any],
+         setup_key: Any = None) -> Tuple[str, str, str]:
+    """Clé de registre : URL, options triées et réglages de ``setup``."""
+    if isinstance(setup_key, dict):
+        setup_key = sorted(setup_key.items())
+    return str(url), repr(sorted(options.items())), repr(setup_key)
+
+
+def get_engine(url: str, setup: Optional[Callable[[Any], Any]] = None,
+               warmup: int = 0, setup_key: Any = None, **options):
+    """
+    Renvoie l’*engine* partagé pour *url* et *options* (créé au besoin).
+
+    Parameters
+    ----------
+    url :
+        URL SQLAlchemy.
+    setup :
+        Appelée une seule fois avec l’*engine* neuf ; sa valeur de retour
+        est disponible via :func:`engine_attachments`.
+    setup_key :
+        Paramètres appliqués par *setup* (``repr`` stable, dict trié) ;
+        ils font partie de la clé du registre.
+    warmup :
+        Connexions ouvertes puis rendues au pool à la création.
+    **options :
+        Arguments nommés de ``create_engine``.
+    """
+    global _atexit_registered
+
+    key = _key(url, options, setup_key)
+    entry = _entries.get(key)
+    if entry is not None:
+        return entry.engine
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            from sqlalchemy import create_engine
+
+            engine = create_engine(url, **options)
+            attachments = setup(engine) if setup is not None else None
+            if warmup > 0:
+                _warm_up(engine, warmup)
+            entry = _entries[key] = _Entry(engine, attachments)
+            if not _atexit_registered:
+                atexit.register(dispose_all)
+                _atexit_registered = True
+    return entry.engine
+
+
+def _warm_up(engine, count: int) -> None:
+    """
+    Ouvre *count* connexions simultanées puis les rend au pool.
+
+    Best effort : une base injoignable n’est pas signalée ici mais au
+    premier usage réel, avec le contexte de l’appelant.
+    """
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    except Exception:           # noqa: BLE001 – signalé au premier usage
+        pass
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def engine_attachments(engine) -> Any:
+    """Valeur renvoyée par ``setup`` lors de la création de *engine*."""
+    for entry in list(_entries.values()):
+        if entry.engine is engine:
+            return entry.attachments
+    return None
+
+
+def dispose_engine(engine) -> None:
+    """Retire *engine* du registre et ferme son pool."""
+    with _lock:
+        for key, entry in list(_entries.items()):
+            if entry.engine is engine:
+                del _entries[key]
+    engine.dispose()
+
+
+def dispose_all() -> None:
+    """Ferme tous les pools enregistrés et vide le registre."""
+    with _lock:
+        entries = list(_entries.values())
+        _entries.clear()
+    for entry in entries:
+        entry.engine.dispose()
@@ -0,0 +1,24 @@
+# app/config/env.py
+# -*- coding: utf-8 -*-
+"""
+Chargement paresseux du fichier ``.env``.
+
+Les modules de configuration (base de données, JWT, Sentry) appellent
+:func:`load_env` au moment où ils lisent réellement leurs variables, et
+non plus à l’import : ``python-dotenv`` n’est donc importé – et le
+fichier lu – qu’une seule fois, au premier besoin.
+"""
+from __future__ import annotations
+
+_loaded: bool = False
+
+
+def load_env() -> None:
+    """Charge ``.env`` dans ``os.environ`` (idempotent, sans écraser)."""
+    global _loaded
+    if _loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()  # Aucune erreur si le fichier est absent
+    _loaded = True
@@ -0,0 +1,124 @@
+# app/config/session_scope.py
+# -*- coding: utf-8 -*-
+"""
+Session SQLAlchemy « par requête » (une action CLI = une session).
+
+:func:`request_scope` ouvre un périmètre ; tant qu’il est actif,
+:func:`use_session` renvoie **la même** session à toutes les vues et à
+tous les contrôleurs qui la demandent pour cette connexion :
+
+* un seul emprunt de connexion au pool pour toute l’action – la session
+  est liée à une connexion dédiée, conservée même après un ``commit`` ;
+* une seule *identity map* : une entité lue pour une vérification n’est
+  pas relue par le contrôleur qui la modifie ensuite.
+
+La session n’est créée qu’au premier :func:`use_session` ; elle est
+fermée (transaction en cours annulée) à la sortie du périmètre.  Hors
+périmètre, :func:`use_session` se comporte comme
+``db.create_session()`` : chaque bloc ``with`` a sa propre session.
+
+Avant chaque saisie, les vues appellent :func:`before_prompt` : la
+transaction de lecture en cours est validée (sans expirer les entités
+chargées), afin de ne garder ni verrous de ligne ni *snapshot* MySQL
+ouverts pendant que l’utilisateur tape.  La connexion reste dédiée.
+"""
+from __future__ import annotations
+
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Optional
+
+_current: ContextVar[Optional["_RequestScope"]] = ContextVar(
+    "epic_request_scope", default=None)
+
+
+class _RequestScope:
+    """Périmètre actif : connexion et session partagées, créées à la demande."""
+
+    def __init__(self, db) -> None:
+        self.db = db
+        self.session = None
+        self.connection = None
+        self._token = None
+
+    def get_session(self):
+        """Session du périmètre (ouverte au premier appel)."""
+        if self.session is None:
+            factory = getattr(self.db, "SessionLocal", None)
+            if factory is not None and hasattr(self.db, "engine"):
+                # Connexion dédiée : les commits ne la rendent pas au pool.
+                self.connection = self.db.engine.connect()
+                self.session = factory(bind=self.connection)
+            else:
+                self.session = self.db.create_session()
+        return self.session
+
+    def end_transaction(self) -> None:
+        """
+        Valide la transaction ouverte, sans expirer les entités chargées ;
+        ignorée si des modifications ne sont pas encore envoyées.
+        """
+        sess = self.session
+        if sess is None or not sess.in_transaction():
+            return
+        if sess.new or sess.dirty or sess.deleted:
+            return
+        expire, sess.expire_on_commit = sess.expire_on_commit, False
+        try:
+            sess.commit()
+        finally:
+            sess.expire_on_commit = expire
+
+    def __enter__(self) -> "_RequestScope":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        try:
+            if self.session is not None:
+                self.session.close()
+            if self.connection is not None:
+                self.connection.close()
+        finally:
+            _current.reset(self._token)
+        return False
+
+
+def request_scope(db):
+    """
+    Ouvre un périmètre de session pour *db* (idempotent si déjà ouvert).
+
+    Parameters
+    ----------
+    db :
+        Objet exposant ``create_session()`` (typiquement
+        :class:`~app.config.database.DatabaseConnection`).
+    """
+    scope = _current.get()
+    if scope is not None and scope.db is db:
+        return nullcontext(scope)
+    return _RequestScope(db)
+
+
+def use_session(db) -> Any:
+    """
+    Gestionnaire de contexte fournissant une session pour *db*.
+
+    Dans un :func:`request_scope`, renvoie la session partagée sans la
+    fermer en sortie de bloc ; sinon, une session neuve fermée en sortie.
+    """
+    scope = _current.get()
+    if scope is not None and scope.db is db:
+        return nullcontext(scope.get_session())
+    return db.create_session()
+
+
+def before_prompt() -> None:
+    """
+    À appeler avant une saisie : termine la transaction du périmètre
+    courant (cf. :meth:`_RequestScope.end_transaction`).  Sans effet
+    hors périmètre.
+    """
+    scope = _current.get()
+    if scope is not None:
+        scope.end_transaction()
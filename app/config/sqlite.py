@@ -0,0 +1,49 @@
+# app/config/sqlite.py
+# -*- coding: utf-8 -*-
+"""
+Réglages du moteur **SQLite** (usage local, hors‑ligne, benchmarks).
+
+À chaque nouvelle connexion DBAPI, :func:`install_sqlite_pragmas`
+applique les *pragmas* suivants :
+
+* ``journal_mode=WAL``      – lecteurs et écrivain ne se bloquent plus ;
+* ``synchronous=NORMAL``    – sûr en WAL, bien plus rapide que FULL ;
+* ``mmap_size``             – lecture des pages par *memory‑mapping* ;
+* ``cache_size``            – cache de pages par connexion ;
+* ``foreign_keys=ON``       – contraintes de clés étrangères appliquées ;
+* ``busy_timeout``          – attente (ms) d’un verrou avant erreur ;
+* ``temp_store=MEMORY``     – tables temporaires / tris en mémoire.
+
+Le module neutralise aussi la gestion implicite des transactions du
+pilote ``sqlite3`` (``BEGIN`` émis par SQLAlchemy lui‑même), recette
+documentée par SQLAlchemy pour que les ``SAVEPOINT`` fonctionnent.
+"""
+from __future__ import annotations
+
+from sqlalchemy import event
+
+
+def install_sqlite_pragmas(engine, config) -> None:
+    """Attache les *pragmas* de *config* aux connexions de *engine*."""
+    in_memory = config.sqlite_path == ":memory:"
+
+    def on_connect(dbapi_conn, _record) -> None:
+        # Transactions pilotées par SQLAlchemy (cf. événement « begin »).
+        dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA cache_size={int(config.sqlite_cache_size)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(
+            f"PRAGMA busy_timeout={int(config.sqlite_busy_timeout)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    def on_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "begin", on_begin)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+AsyncDataReader / AsyncDataWriter
+=================================
+
+Pendants *asyncio* de :class:`DataReader` et :class:`DataWriter`.
+
+Chaque coroutine délègue à la méthode synchrone correspondante via
+``AsyncSession.run_sync`` : contrôles d’authentification, règles de
+droits et validations métier restent **uniques** et partagés.  Seules
+les entrées / sorties réseau sont asynchrones ; plusieurs lectures
+indépendantes (chacune dans sa propre session) peuvent ainsi s’exécuter
+en parallèle sur une même boucle d’événements, cf.
+:meth:`AsyncDataReader.overview`.
+
+Notes
+-----
+* Aucun décorateur n’est utilisé.
+* Les entités renvoyées sont détachables mais leurs relations *lazy* ne
+  peuvent pas être chargées hors ``run_sync`` : charger ce dont la vue a
+  besoin dans la coroutine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+from app.controllers.data_reader import DataReader
+from app.controllers.data_writer import DataWriter
+
+
+class AsyncDataReader:
+    """Contrôleur de lecture asynchrone."""
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, db_connection) -> None:
+        """
+        Parameters
+        ----------
+        db_connection :
+            :class:`AsyncDatabaseConnection` (``create_session`` renvoie
+            une :class:`AsyncSession`).
+        """
+        self._db_connection = db_connection
+        self._sync = DataReader(db_connection)
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+    async def get_all_clients(self, session, current_user: Dict) -> List:
+        """Cf. :meth:`DataReader.get_all_clients`."""
+        return await session.run_sync(
+            self._sync.get_all_clients, current_user)
+
+    async def get_all_contracts(self, session, current_user: Dict) -> List:
+        """Cf. :meth:`DataReader.get_all_contracts`."""
+        return await session.run_sync(
+            self._sync.get_all_contracts, current_user)
+
+    async def get_all_events(self, session, current_user: Dict) -> List:
+        """Cf. :meth:`DataReader.get_all_events`."""
+        return await session.run_sync(
+            self._sync.get_all_events, current_user)
+
+    # ------------------------------------------------------------------ #
+    async def overview(self, current_user: Dict) -> Dict[str, List]:
+        """
+        Clients, contrats et événements lus **en parallèle**.
+
+        Chaque lecture dispose de sa propre session (donc de sa propre
+        connexion) ; les trois requêtes sont concurrentes.
+
+        Returns
+        -------
+        dict
+            ``{"clients": [...], "contracts": [...], "events": [...]}``
+        """
+        async def read(method):
+            async with self._db_connection.create_session() as session:
+                return await method(session, current_user)
+
+        clients, contracts, events = await asyncio.gather(
+            read(self.get_all_clients),
+            read(self.get_all_contracts),
+            read(self.get_all_events),
+        )
+        return {"clients": clients, "contracts": contracts, "events": events}
+
+
+class AsyncDataWriter:
+    """
+    Contrôleur d’écriture asynchrone.
+
+    Signatures identiques à :class:`DataWriter`, la session étant une
+    :class:`AsyncSession`.  Les exceptions (*ValueError*,
+    *PermissionError*, …) sont propagées telles quelles.
+    """
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, db_connection) -> None:
+        self.db = db_connection
+        self._sync = DataWriter(db_connection)
+
+    # ================================================================== #
+    #  COLLABORATEURS                                                    #
+    # ================================================================== #
+    async def create_user(self, session, cur: Dict[str, Any],
+                          *args, **kwargs):
+        """Cf. :meth:`DataWriter.create_user`."""
+        return await session.run_sync(
+            self._sync.create_user, cur, *args, **kwargs)
+
+    async def update_user(self, session, cur: Dict[str, Any],
+                          user_id: int, **updates):
+        """Cf. :meth:`DataWriter.update_user`."""
+        return await session.run_sync(
+            self._sync.update_user, cur, user_id, **updates)
+
+    async def update_user_by_employee_number(
+        self, session, cur: Dict[str, Any], employee_number: str, **updates
+    ):
+        """Cf. :meth:`DataWriter.update_user_by_employee_number`."""
+        return await session.run_sync(
+            self._sync.update_user_by_employee_number,
+            cur, employee_number, **updates)
+
+    async def delete_user(self, session, cur: Dict[str, Any],
+                          employee_number: str) -> bool:
+        """Cf. :meth:`DataWriter.delete_user`."""
+        return await session.run_sync(
+            self._sync.delete_user, cur, employee_number)
+
+    # ================================================================== #
+    #  CLIENTS                                                           #
+    # ================================================================== #
+    async def create_client(self, session, cur: Dict[str, Any],
+                            *args, **kwargs):
+        """Cf. :meth:`DataWriter.create_client`."""
+        return await session.run_sync(
+            self._sync.create_client, cur, *args, **kwargs)
+
+    async def update_client(self, session, cur: Dict[str, Any],
+                            client_id: int, **updates):
+        """Cf. :meth:`DataWriter.update_client`."""
+        return await session.run_sync(
+            self._sync.update_client, cur, client_id, **updates)
+
+    # ================================================================== #
+    #  CONTRATS                                                          #
+    # ================================================================== #
+    async def create_contract(self, session, cur: Dict[str, Any],
+                              *args, **kwargs):
+        """Cf. :meth:`DataWriter.create_contract`."""
+        return await session.run_sync(
+            self._sync.create_contract, cur, *args, **kwargs)
+
+    async def update_contract(self, session, cur: Dict[str, Any],
+                              contract_id: int, **updates):
+        """Cf. :meth:`DataWriter.update_contract`."""
+        return await session.run_sync(
+            self._sync.update_contract, cur, contract_id, **updates)
+
+    # ================================================================== #
+    #  ÉVÉNEMENTS                                                        #
+    # ================================================================== #
+    async def create_event(self, session, cur: Dict[str, Any],
+                           *args, **kwargs):
+        """Cf. :meth:`DataWriter.create_event`."""
+        return await session.run_sync(
+            self._sync.create_event, cur, *args, **kwargs)
+
+    async def update_event(self, session, cur: Dict[str, Any],
+                           event_id: int, **updates):
+        """Cf. :meth:`DataWriter.update_event`."""
+        return await session.run_sync(
+            self._sync.update_event, cur, event_id, **updates)
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+BatchRunner
+===========
+
+Exécution en lot d’opérations d’écriture décrites en JSON Lines ::
+
+    {"op": "update_contract", "id": 42, "remaining_amount": 0}
+    {"op": "update_event", "id": 7, "support": "S002"}
+    {"op": "create_client", "full_name": "Ann", "email": "ann@x.io"}
+
+* ``op`` désigne une méthode de :class:`DataWriter` (cf. :data:`OPS`) ;
+  ``id`` est passé comme identifiant positionnel, les autres clés comme
+  arguments nommés.
+* ``support`` / ``commercial`` (numéro d’employé) sont traduits en
+  ``support_id`` / ``commercial_id`` via le cache de référence (sans
+  requête) ; ``date_start`` / ``date_end``
+  sont lus au format ISO 8601.
+* Lignes vides et lignes commençant par ``#`` sont ignorées.
+
+Transactions
+------------
+Tout le lot passe par **une** connexion.  La session y est liée en mode
+``join_transaction_mode="create_savepoint"`` : le ``commit()`` effectué
+par DataWriter ne libère qu’un *SAVEPOINT*, et une opération en échec
+est annulée seule.  La transaction englobante est validée toutes les
+``batch_size`` opérations (et en fin de lot), ou annulée en
+``dry_run``.  Après chaque validation ou annulation, l’annuaire en cache
+est invalidé si le lot a modifié des collaborateurs.
+
+Les résultats d’un lot ne sont comptés et rapportés qu’une fois ce lot
+validé.  Si une erreur SQL emporte la transaction englobante (*deadlock*
+ou *lock wait timeout* MySQL, qui annulent toute la transaction) ou si
+sa validation échoue, les lignes du lot déjà passées sont rapportées en
+échec – et non comme réussies – puis une nouvelle transaction est
+ouverte pour la suite.
+
+Notes
+-----
+* Aucun décorateur n’est utilisé (pas de ``@staticmethod``).
+* Les droits sont ceux de DataWriter : chaque ligne est contrôlée pour
+  l’utilisateur courant.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.controllers.data_writer import DataWriter
+from app.controllers.lookup_index import outer_transaction_ended
+from app.controllers.reference_cache import reference_cache
+
+OPS = (
+    "create_client", "update_client",
+    "create_contract", "update_contract",
+    "create_event", "update_event",
+    "update_user", "delete_user",
+)
+_REFERENCES = {"support": "support_id", "commercial": "commercial_id"}
+_DATES = ("date_start", "date_end")
+_DIRECTORY_OPS = ("update_user", "delete_user")
+
+
+class BatchResult:
+    """Résultat d’une ligne du lot."""
+
+    def __init__(self, line: int, op: Optional[str], ok: bool,
+                 detail: str) -> None:
+        self.line = line
+        self.op = op
+        self.ok = ok
+        self.detail = detail
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"line": self.line, "op": self.op, "ok": self.ok,
+                "detail": self.detail}
+
+
+class BatchRunner:
+    """Applique un fichier JSON Lines via :class:`DataWriter`."""
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, db_connection, batch_size: int = 100) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size doit être ≥ 1.")
+        self._db_connection = db_connection
+        self.writer = DataWriter(db_connection)
+        self.batch_size = batch_size
+        self._directory_dirty = False
+
+    # ------------------------------------------------------------------ #
+    # Helpers internes                                                   #
+    # ------------------------------------------------------------------ #
+    def _parse(self, raw: str) -> Tuple[str, Dict[str, Any]]:
+        """Décode une ligne ; renvoie (op, arguments)."""
+        try:
+            args = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"JSON invalide ({exc.msg}).") from exc
+        if not isinstance(args, dict):
+            raise ValueError("Objet JSON attendu.")
+        op = args.pop("op", None)
+        if op not in OPS:
+            raise ValueError(f"Opération inconnue : {op!r}.")
+        for key in _DATES:
+            if isinstance(args.get(key), str):
+                args[key] = dt.datetime.fromisoformat(args[key])
+        return op, args
+
+    def _resolve(self, session: Session, args: Dict[str, Any]) -> None:
+        """Remplace les numéros d’employé par les identifiants."""
+        for key, column in _REFERENCES.items():
+            if key not in args:
+                continue
+            number = args.pop(key)
+            if number is None:
+                args[column] = None
+                continue
+            user = reference_cache(session).collaborator(session, number, key)
+            if user is None:
+                raise ValueError(f"Collaborateur {key} introuvable : "
+                                 f"{number}.")
+            args[column] = user.id
+
+    def _apply(self, session: Session, cur: Dict, op: str,
+               args: Dict[str, Any]) -> str:
+        """Exécute une opération ; renvoie un court descriptif."""
+        method = getattr(self.writer, op)
+        if "id" in args:
+            target = args.pop("id")
+            method(session, cur, target, **args)
+            return f"{op} #{target}"
+        result = method(session, cur, **args)
+        ident = getattr(result, "id", None)
+        return f"{op} #{ident}" if ident is not None else op
+
+    def _commit(self, session: Session, connection,
+                reopen: bool = True) -> None:
+        """Valide la transaction englobante ; en rouvre une au besoin."""
+        session.close()
+        connection.commit()
+        self._ended(connection, committed=True)
+        if reopen:
+            connection.begin()
+
+    def _rollback_line(self, session: Session, connection) -> bool:
+        """
+        Annule la ligne en échec (retour au *SAVEPOINT*) ; False si la
+        transaction englobante n’a pas survécu à l’erreur.
+        """
+        try:
+            session.rollback()
+        except SQLAlchemyError:
+            return False
+        transaction = connection.get_transaction()
+        return transaction is not None and transaction.is_active
+
+    def _restart(self, session: Session, connection,
+                 reopen: bool = True) -> None:
+        """Abandonne la transaction englobante perdue ; en rouvre une."""
+        session.close()
+        self._ended(connection, committed=False)
+        try:
+            connection.rollback()
+        except SQLAlchemyError:
+            connection.invalidate()
+        if reopen:
+            connection.begin()
+
+    def _ended(self, connection, committed: bool) -> None:
+        """
+        Fin de la transaction englobante : index de recherche et, si le
+        lot a touché aux collaborateurs, annuaire en cache – rechargé par
+        la session du lot, il a pu lire des lignes non validées.
+        """
+        outer_transaction_ended(connection, committed)
+        if self._directory_dirty:
+            reference_cache(connection).invalidate()
+            self._directory_dirty = False
+
+    def _lost(self, chunk: List[BatchResult], reason: Any) -> None:
+        """Requalifie en échec les lignes réussies d’un lot annulé."""
+        for result in chunk:
+            if result.ok:
+                result.ok = False
+                result.detail = (f"{result.detail} annulée : transaction "
+                                 f"englobante perdue ({reason}).")
+
+    def _flush(self, chunk: List[BatchResult], summary: Dict[str, float],
+               report: Optional[Callable[[BatchResult], None]]) -> None:
+        """Compte et rapporte les résultats d’un lot terminé."""
+        for result in chunk:
+            summary["ok" if result.ok else "failed"] += 1
+            if report is not None:
+                report(result)
+        chunk.clear()
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+    def run(
+        self,
+        current_user: Dict,
+        lines: Iterable[str],
+        report: Optional[Callable[[BatchResult], None]] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Exécute *lines* et renvoie le bilan.
+
+        Parameters
+        ----------
+        current_user :
+            Utilisateur authentifié (une seule fois pour tout le lot).
+        lines :
+            Lignes JSON (fichier ouvert, liste…), lues au fil de l’eau.
+        report :
+            Rappel appelé avec le :class:`BatchResult` de chaque ligne.
+        dry_run :
+            Exécute puis annule tout (validation d’un fichier).
+
+        Returns
+        -------
+        dict
+            ``ok``, ``failed``, ``commits``, ``seconds`` et ``per_second``.
+        """
+        started = time.perf_counter()
+        summary: Dict[str, float] = {"ok": 0, "failed": 0, "commits": 0}
+        chunk: List[BatchResult] = []
+
+        with self._db_connection.engine.connect() as connection:
+            connection.begin()
+            session = Session(bind=connection, expire_on_commit=False,
+                              join_transaction_mode="create_savepoint")
+
+            def commit(reopen: bool) -> None:
+                try:
+                    self._commit(session, connection, reopen)
+                    summary["commits"] += 1
+                except SQLAlchemyError as exc:
+                    self._lost(chunk, exc)
+                    self._restart(session, connection, reopen)
+
+            try:
+                for number, raw in enumerate(lines, start=1):
+                    raw = raw.strip()
+                    if not raw or raw.startswith("#"):
+                        continue
+                    op = None
+                    try:
+                        op, args = self._parse(raw)
+                        if op in _DIRECTORY_OPS:
+                            self._directory_dirty = True
+                        self._resolve(session, args)
+                        result = BatchResult(
+                            number, op, True,
+                            self._apply(session, current_user, op, args))
+                    except (ValueError, PermissionError, TypeError,
+                            SQLAlchemyError) as exc:
+                        result = BatchResult(number, op, False, str(exc))
+                        if not self._rollback_line(session, connection):
+                            self._lost(chunk, exc)
+                            self._restart(session, connection)
+                    chunk.append(result)
+
+                    if len(chunk) >= self.batch_size:
+                        if not dry_run:
+                            commit(reopen=True)
+                        self._flush(chunk, summary, report)
+
+                if dry_run:
+                    connection.rollback()
+                    self._ended(connection, committed=False)
+                elif chunk:
+                    commit(reopen=False)
+                self._flush(chunk, summary, report)
+            finally:
+                session.close()
+                # Sortie anticipée : la transaction est annulée à la
+                # fermeture ; rien ne reste reporté sur la connexion.
+                self._ended(connection, committed=False)
+
+        seconds = time.perf_counter() - started
+        done = summary["ok"] + summary["failed"]
+        summary["seconds"] = seconds
+        summary["per_second"] = done / seconds if seconds else 0.0
+        return summary
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+DataExporter
+============
+
+Export en flux des *clients*, *contrats* et *événements* vers CSV ou
+NDJSON (une ligne JSON par enregistrement), compressé en gzip sur
+demande.
+
+* **Périmètre** : les requêtes sont celles de :class:`DataReader`
+  (``clients_query`` / ``contracts_query`` / ``events_query``) ; un
+  commercial avec ``force_filter`` n’exporte que ses propres lignes.
+* **Mémoire constante** : seules les colonnes de la table sont lues
+  (pas d’objets ORM), avec ``stream_results`` (curseur côté serveur sous
+  MySQL) et ``yield_per`` ; les lignes sont écrites par blocs de
+  ``chunk_size``.  Un export de plusieurs millions de lignes n’occupe
+  qu’un bloc en mémoire.
+* **Instantané cohérent** : toutes les tables sont lues dans **une seule**
+  transaction, en ``REPEATABLE READ`` sous MySQL / PostgreSQL ; sous
+  SQLite, la transaction ouverte par les *pragmas* de
+  :mod:`app.config.sqlite` fige la même vue.  Un contrat créé pendant
+  l’export des clients n’apparaît donc pas dans celui des contrats.
+* **Écriture atomique** : chaque fichier est écrit sous ``.part`` puis
+  renommé une fois complet.
+
+Notes
+-----
+* Aucun décorateur n’est utilisé (pas de ``@staticmethod``).
+* Le format Parquet n’est pas proposé : il imposerait une dépendance
+  (``pyarrow``) absente du projet.
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import gzip
+import json
+import os
+from decimal import Decimal
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, TextIO,
+)
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.controllers.data_reader import DataReader
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.event import Event
+from app.observability.actions import instrument
+
+FORMATS = ("csv", "ndjson")
+TABLES = ("clients", "contracts", "events")
+_GZIP_LEVEL = 6            # niveau par défaut de ``gzip`` (9 : ~2× plus lent)
+
+_QUERIES = {
+    "clients": (Client, "clients_query"),
+    "contracts": (Contract, "contracts_query"),
+    "events": (Event, "events_query"),
+}
+# Niveau d’isolement garantissant un instantané unique par transaction.
+_SNAPSHOT_ISOLATION = {
+    "mysql": "REPEATABLE READ",
+    "mariadb": "REPEATABLE READ",
+    "postgresql": "REPEATABLE READ",
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Sérialisation JSON des dates et décimaux."""
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+class DataExporter:
+    """Export en flux, limité au périmètre de l’utilisateur courant."""
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, db_connection, chunk_size: int = 10_000) -> None:
+        self._db_connection = db_connection
+        self._reader = DataReader(db_connection)
+        self.chunk_size = chunk_size
+        instrument(self, "DataExporter")
+
+    # ------------------------------------------------------------------ #
+    # Helpers internes                                                   #
+    # ------------------------------------------------------------------ #
+    def _statement(self, table: str, current_user: Dict) -> Select:
+        """Requête colonnes‑seules de *table* dans le périmètre du rôle."""
+        if table not in _QUERIES:
+            raise ValueError(f"Table inconnue : {table}.")
+        model, builder = _QUERIES[table]
+        stmt = getattr(self._reader, builder)(current_user)
+        return stmt.with_only_columns(*model.__table__.columns)
+
+    def _snapshot(self, session: Session):
+        """Connexion de la transaction d’export (instantané unique)."""
+        level = _SNAPSHOT_ISOLATION.get(session.get_bind().dialect.name)
+        options = {"isolation_level": level} if level else {}
+        return session.connection(execution_options=options)
+
+    def _chunks(self, connection, stmt: Select
+                ) -> tuple[Sequence[str], Iterator[Sequence]]:
+        """Exécute *stmt* en flux ; renvoie (colonnes, blocs de lignes)."""
+        result = connection.execute(stmt.execution_options(
+            stream_results=True, yield_per=self.chunk_size))
+        return list(result.keys()), result.partitions()
+
+    def _write(self, out: TextIO, fmt: str, columns: Sequence[str],
+               chunks: Iterable[Sequence]) -> int:
+        """Écrit l’en‑tête puis chaque bloc ; renvoie le nombre de lignes."""
+        count = 0
+        if fmt == "csv":
+            writer = csv.writer(out, lineterminator="\n")
+            writer.writerow(columns)
+            for chunk in chunks:
+                writer.writerows(chunk)
+                count += len(chunk)
+        elif fmt == "ndjson":
+            encode = json.JSONEncoder(default=_json_default,
+                                      ensure_ascii=False).encode
+            for chunk in chunks:
+                out.write("".join(
+                    encode(dict(zip(columns, row))) + "\n" for row in chunk))
+                count += len(chunk)
+        else:
+            raise ValueError(f"Format inconnu : {fmt}.")
+        return count
+
+    def _open(self, path: str, compress: bool) -> TextIO:
+        if compress:
+            return gzip.open(path, "wt", compresslevel=_GZIP_LEVEL,
+                             encoding="utf-8", newline="")
+        return open(path, "w", encoding="utf-8", newline="")
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+    def stream(self, current_user: Dict, table: str, out: TextIO,
+               fmt: str = "csv") -> int:
+        """
+        Écrit *table* dans le flux texte *out* (ex. ``sys.stdout``).
+
+        Returns
+        -------
+        int
+            Nombre de lignes exportées.
+        """
+        stmt = self._statement(table, current_user)
+        with self._db_connection.create_session() as session:
+            columns, chunks = self._chunks(self._snapshot(session), stmt)
+            return self._write(out, fmt, columns, chunks)
+
+    def export(
+        self,
+        current_user: Dict,
+        directory: str,
+        tables: Sequence[str] = TABLES,
+        fmt: str = "csv",
+        compress: bool = False,
+        progress: Optional[Callable[[str, int], None]] = None,
+    ) -> Dict[str, str]:
+        """
+        Exporte *tables* dans *directory*, sous un même instantané.
+
+        Parameters
+        ----------
+        current_user :
+            Utilisateur courant (``force_filter`` respecté).
+        directory :
+            Dossier de destination (créé si besoin).
+        tables :
+            Sous‑ensemble de :data:`TABLES`, dans l’ordre d’export.
+        fmt :
+            ``"csv"`` ou ``"ndjson"``.
+        compress :
+            Ajoute ``.gz`` et compresse à la volée.
+        progress :
+            Rappel ``progress(table, lignes)`` après chaque fichier.
+
+        Returns
+        -------
+        dict
+            Chemin du fichier écrit pour chaque table.
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Format inconnu : {fmt}.")
+        statements = {t: self._statement(t, current_user) for t in tables}
+        os.makedirs(directory, exist_ok=True)
+        suffix = f".{fmt}" + (".gz" if compress else "")
+        paths: Dict[str, str] = {}
+
+        with self._db_connection.create_session() as session:
+            connection = self._snapshot(session)
+            for table, stmt in statements.items():
+                path = os.path.join(directory, table + suffix)
+                columns, chunks = self._chunks(connection, stmt)
+                try:
+                    with self._open(path + ".part", compress) as out:
+                        count = self._write(out, fmt, columns, chunks)
+                    os.replace(path + ".part", path)
+                except BaseException:
+                    # Pas de fichier partiel laissé dans la destination.
+                    if os.path.exists(path + ".part"):
+                        os.unlink(path + ".part")
+                    raise
+                paths[table] = path
+                if progress is not None:
+                    progress(table, count)
+        return paths
@@ -16,9 +16,17 @@ Un filtre optionnel peut toutefois être appliqué :
 * **support**  : idem, mais limité aux événements assignés au
   technicien support.
 
+Le calendrier (:meth:`DataReader.get_calendar`) renvoie les événements
+chevauchant une période, éventuellement pour un seul support : la
+requête s’appuie alors sur l’index ``ix_events_support_period``.
+
 Notes
 -----
 * Aucun décorateur n’est utilisé (pas de ``@staticmethod``).  
+* Les méthodes publiques sont instrumentées à la construction (compteur
+  de requêtes SQL par méthode, cf. :mod:`app.observability.actions`) ;
+  les constructeurs de requêtes ``*_query`` n’exécutent rien et ne le
+  sont pas.
 * Aucune trace de debug n’est émise ; les méthodes se contentent de
   renvoyer les listes demandées ou de lever une :class:`PermissionError`
   lorsqu’un utilisateur non authentifié les invoque.
@@ -26,13 +34,16 @@ Notes
 
 from __future__ import annotations
 
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Optional
 
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from app.models.client import Client
 from app.models.contract import Contract
-from app.models.event import Event
+from app.models.event import Event, overlapping
+from app.observability.actions import instrument
 
 
 class DataReader:
@@ -43,6 +54,9 @@ class DataReader:
     # ------------------------------------------------------------------ #
     def __init__(self, db_connection) -> None:
         self._db_connection = db_connection
+        instrument(self, "DataReader",
+                   skip=("clients_query", "contracts_query", "events_query",
+                         "calendar_query"))
 
     # ------------------------------------------------------------------ #
     # Helper interne                                                     #
@@ -53,81 +67,116 @@ class DataReader:
             raise PermissionError("Utilisateur non authentifié.")
 
     # ------------------------------------------------------------------ #
-    # Public API                                                         #
+    # Requêtes (construites, non exécutées)                              #
     # ------------------------------------------------------------------ #
-    def get_all_clients(self, session: Session, current_user: Dict) -> List[Client]:
+    def clients_query(self, current_user: Dict) -> Select:
         """
-        Renvoie la liste des clients.
+        Requête des clients visibles par *current_user*.
 
         • Tous les rôles voient l’intégralité des clients.  
         • Un commercial peut demander un filtrage forcé en ajoutant
           ``"force_filter": True`` à *current_user*.
+
+        La requête n’est pas exécutée : :meth:`get_all_clients` la charge
+        en mémoire, l’export (:mod:`app.controllers.data_exporter`) la
+        parcourt en flux.
         """
         self._ensure_authenticated(current_user)
-        session.expire_all()
-
+        stmt = select(Client)
         if (
             current_user.get("role") == "commercial" and
             current_user.get("force_filter")
         ):
-            return (
-                session.query(Client)
-                .filter(Client.commercial_id == current_user["id"])
-                .all()
-            )
+            stmt = stmt.where(Client.commercial_id == current_user["id"])
+        return stmt.order_by(Client.id)
 
-        return session.query(Client).all()
-
-    # ------------------------------------------------------------------ #
-    def get_all_contracts(
-        self, session: Session, current_user: Dict
-    ) -> List[Contract]:
-        """
-        Renvoie la liste des contrats, avec la même règle de filtrage
-        facultatif que :meth:`get_all_clients`.
-        """
+    def contracts_query(self, current_user: Dict) -> Select:
+        """Requête des contrats (même filtrage que :meth:`clients_query`)."""
         self._ensure_authenticated(current_user)
-        session.expire_all()
-
+        stmt = select(Contract)
         if (
             current_user.get("role") == "commercial" and
             current_user.get("force_filter")
         ):
-            return (
-                session.query(Contract)
-                .filter(Contract.commercial_id == current_user["id"])
-                .all()
-            )
-
-        return session.query(Contract).all()
+            stmt = stmt.where(Contract.commercial_id == current_user["id"])
+        return stmt.order_by(Contract.id)
 
-    # ------------------------------------------------------------------ #
-    def get_all_events(self, session: Session, current_user: Dict) -> List[Event]:
+    def events_query(self, current_user: Dict) -> Select:
         """
-        Renvoie la liste des événements.
+        Requête des événements.
 
         *Commercial* : avec ``"force_filter": True``, seuls les événements
-        liés aux contrats du commercial sont retournés.  
+        liés aux contrats du commercial sont retenus.  
         *Support*    : avec ``"force_filter": True``, seuls les événements
-        assignés au support courant sont retournés.
+        assignés au support courant sont retenus.
         """
         self._ensure_authenticated(current_user)
-        session.expire_all()
+        stmt = select(Event)
         role = current_user.get("role")
 
         if role == "commercial" and current_user.get("force_filter"):
-            return (
-                session.query(Event)
-                .join(Contract, Event.contract_id == Contract.id)
-                .filter(Contract.commercial_id == current_user["id"])
-                .all()
-            )
-
-        if role == "support" and current_user.get("force_filter"):
-            return (
-                session.query(Event)
-                .filter(Event.support_id == current_user["id"])
-                .all()
-            )
-
-        return session.query(Event).all()
+            stmt = (stmt.join(Contract, Event.contract_id == Contract.id)
+                    .where(Contract.commercial_id == current_user["id"]))
+        elif role == "support" and current_user.get("force_filter"):
+            stmt = stmt.where(Event.support_id == current_user["id"])
+        return stmt.order_by(Event.id)
+
+    def calendar_query(
+        self,
+        current_user: Dict,
+        start: datetime,
+        end: datetime,
+        support_id: Optional[int] = None,
+    ) -> Select:
+        """
+        Requête des événements chevauchant ``[start, end]``.
+
+        Même filtrage que :meth:`events_query` ; *support_id* restreint au
+        planning d’un support.  Tri chronologique.
+        """
+        if end < start:
+            raise ValueError("Date fin < date début.")
+        stmt = self.events_query(current_user).order_by(None)
+        if support_id is not None:
+            stmt = stmt.where(Event.support_id == support_id)
+        return (stmt.where(overlapping(start, end))
+                .order_by(Event.date_start, Event.id))
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+    def get_all_clients(self, session: Session, current_user: Dict) -> List[Client]:
+        """Renvoie la liste des clients (cf. :meth:`clients_query`)."""
+        stmt = self.clients_query(current_user)
+        session.expire_all()
+        return list(session.scalars(stmt))
+
+    # ------------------------------------------------------------------ #
+    def get_all_contracts(
+        self, session: Session, current_user: Dict
+    ) -> List[Contract]:
+        """Renvoie la liste des contrats (cf. :meth:`contracts_query`)."""
+        stmt = self.contracts_query(current_user)
+        session.expire_all()
+        return list(session.scalars(stmt))
+
+    # ------------------------------------------------------------------ #
+    def get_all_events(self, session: Session, current_user: Dict) -> List[Event]:
+        """Renvoie la liste des événements (cf. :meth:`events_query`)."""
+        stmt = self.events_query(current_user)
+        session.expire_all()
+        return list(session.scalars(stmt))
+
+    # ------------------------------------------------------------------ #
+    def get_calendar(
+        self,
+        session: Session,
+        current_user: Dict,
+        start: datetime,
+        end: datetime,
+        support_id: Optional[int] = None,
+    ) -> List[Event]:
+        """Renvoie les événements de la période (cf. :meth:`calendar_query`)."""
+        stmt = self.calendar_query(current_user, start, end, support_id)
+        session.expire_all()
+        return list(session.scalars(stmt))
@@ -12,13 +12,16 @@ Garanties principales :
   - adresses e‑mail valides ;  
   - montants positifs et *remaining ≤ total* ;  
   - cohérence des dates (*end* ≥ *start*) ;  
+  - pas de double affectation d’un support sur des événements qui se
+    chevauchent (:class:`PlanningConflictError`) ;  
   - respect des règles de droits selon le rôle connecté (*gestion*,
     *commercial* ou *support*).
 
 * **Observabilité** :  
   Des points clés (création / modification de collaborateurs, signature
   d’un contrat) sont envoyés à Sentry via :py:meth:`_capture`.  
-  Aucune action n’est entreprise si le SDK n’est pas initialisé.
+  Aucune action n’est entreprise si le SDK n’est pas initialisé ; le SDK
+  n’est d’ailleurs jamais importé par ce module s’il ne l’a pas déjà été.
 
 !!! note
     Aucun décorateur n’est présent ; toutes les méthodes sont des
@@ -28,16 +31,39 @@ from __future__ import annotations
 
 import datetime as dt
 import re
+import sys
 from typing import Any, Dict, List, Optional
 
-import sentry_sdk
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.client import Client
 from app.models.contract import Contract
-from app.models.event import Event
+from app.models.event import Event, overlapping
+from app.controllers.reference_cache import reference_cache
+from app.observability.actions import instrument
+
+
+class PlanningConflictError(ValueError):
+    """Le support est déjà affecté à un événement sur la même période."""
+
+    def __init__(self, event_id: int, start: dt.datetime,
+                 end: Optional[dt.datetime]) -> None:
+        # Tous les arguments à la base : pickle / copy reconstruisent
+        # l’exception à l’identique.
+        super().__init__(event_id, start, end)
+        self.event_id = event_id
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        period = f"{self.start:%Y-%m-%d %H:%M}"
+        if self.end is not None and self.end != self.start:
+            period += f" → {self.end:%Y-%m-%d %H:%M}"
+        return (f"Conflit de planning : support déjà affecté à l’événement "
+                f"#{self.event_id} ({period}).")
 
 
 class DataWriter:
@@ -59,6 +85,7 @@ class DataWriter:
             *Session SQLAlchemy*.
         """
         self.db = db_connection
+        instrument(self, "DataWriter")
 
     # ------------------------------------------------------------------ #
     # Aide Sentry                                                        #
@@ -68,7 +95,8 @@ class DataWriter:
         Envoie un message **info** à Sentry, enrichi du contexte passé
         en mots‑clés.  Silencieux si le SDK n’est pas initialisé.
         """
-        if sentry_sdk.Hub.current.client is None:
+        sentry_sdk = sys.modules.get("sentry_sdk")  # importé par init_sentry
+        if sentry_sdk is None or sentry_sdk.Hub.current.client is None:
             return
 
         with sentry_sdk.push_scope() as scope:
@@ -99,13 +127,52 @@ class DataWriter:
     # ------------------------------------------------------------------ #
     _REG_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[A-Za-z]{2,}$")
 
-    def _prefix_for(self, role_id: int) -> str:
-        """Retourne le préfixe *C/S/G* selon l’ID du rôle."""
-        return {1: "C", 2: "S", 3: "G"}.get(role_id, "X")
+    def _prefix_for(self, sess: Session, role_id: int) -> str:
+        """Retourne le préfixe du matricule (initiale du rôle, ex. *C*)."""
+        return reference_cache(sess).prefix_for(sess, role_id)
+
+    def _directory_changed(self, sess: Session) -> None:
+        """Invalide l’annuaire en cache après une écriture collaborateur."""
+        reference_cache(sess).invalidate()
+
+    def _check_support_available(
+        self,
+        sess: Session,
+        support_id: Optional[int],
+        start: Optional[dt.datetime],
+        end: Optional[dt.datetime],
+        event_id: Optional[int] = None,
+    ) -> None:
+        """
+        Refuse une période qui chevauche un autre événement du support.
+
+        Une seule requête, couverte par l’index ``ix_events_support_period``
+        (support, début, fin) mais qui en parcourt tout l’historique du
+        support antérieur à *end* (cf. :func:`overlapping`) ;
+        l’événement *event_id* lui‑même est exclu.
+
+        Raises
+        ------
+        PlanningConflictError
+            Premier événement (chronologique) en conflit.
+        """
+        if support_id is None or start is None:
+            return
+        stmt = (select(Event.id, Event.date_start, Event.date_end)
+                .where(Event.support_id == support_id,
+                       overlapping(start, end or start))
+                .order_by(Event.date_start)
+                .limit(1))
+        if event_id is not None:
+            stmt = stmt.where(Event.id != event_id)
+        with sess.no_autoflush:
+            conflict = sess.execute(stmt).first()
+        if conflict is not None:
+            raise PlanningConflictError(*conflict)
 
     def _generate_employee_number(self, sess: Session, role_id: int) -> str:
         """Génère le prochain matricule (ex. ``C004``) pour le rôle donné."""
-        prefix = self._prefix_for(role_id)
+        prefix = self._prefix_for(sess, role_id)
         max_num = 0
         for (emp,) in sess.query(User.employee_number).filter(
             User.role_id == role_id
@@ -136,8 +203,9 @@ class DataWriter:
 
         if not self._REG_EMAIL.match(email):
             raise ValueError("Email collaborateur invalide.")
-        if role_id not in (1, 2, 3):
-            raise ValueError("Rôle inconnu (1=Com,2=Sup,3=Gest).")
+        refs = reference_cache(sess)
+        if refs.role_name(sess, role_id) is None:
+            raise ValueError(f"Rôle inconnu ({refs.role_menu(sess)}).")
 
         if not employee_number:
             employee_number = self._generate_employee_number(sess, role_id)
@@ -156,6 +224,7 @@ class DataWriter:
         except IntegrityError as err:
             sess.rollback()
             raise ValueError(f"Email déjà utilisé : {err}") from err
+        self._directory_changed(sess)
 
         self._capture("user_created", user_id=user.id, created_by=cur["id"])
         return user
@@ -181,6 +250,7 @@ class DataWriter:
         for key, value in updates.items():
             setattr(user, key, value)
         sess.commit()
+        self._directory_changed(sess)
 
         self._capture(
             "user_updated",
@@ -215,6 +285,7 @@ class DataWriter:
         for key, value in updates.items():
             setattr(user, key, value)
         sess.commit()
+        self._directory_changed(sess)
 
         self._capture(
             "user_updated",
@@ -243,6 +314,7 @@ class DataWriter:
 
         sess.delete(user)
         sess.commit()
+        self._directory_changed(sess)
         return True
 
     # ================================================================== #
@@ -419,6 +491,7 @@ class DataWriter:
             raise ValueError("Date fin < date début.")
         if attendees is not None and attendees < 0:
             raise ValueError("Participants négatifs.")
+        self._check_support_available(sess, support_id, date_start, date_end)
 
         event = Event(
             contract_id=contract_id,
@@ -467,6 +540,11 @@ class DataWriter:
         ):
             raise ValueError("Participants négatifs.")
 
+        if {"support_id", "date_start", "date_end"} & updates.keys():
+            self._check_support_available(
+                sess, updates.get("support_id", event.support_id),
+                new_start, new_end, event_id=event.id)
+
         for key, value in updates.items():
             setattr(event, key, value)
         sess.commit()
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+"""
+LookupIndex
+===========
+
+Index mémoire des collaborateurs, clients et contrats, pour la
+complétion à la saisie et les suggestions « Vouliez‑vous dire… ».
+
+Structures
+----------
+* **préfixes** : par famille, liste triée de couples ``(terme, clé)`` ;
+  une recherche est une dichotomie (:mod:`bisect`) suivie d’un parcours
+  des termes commençant par le préfixe — l’équivalent d’un *trie*, en
+  une seule liste compacte ;
+* **trigrammes** : par famille, ``trigramme → {termes}`` et
+  ``terme → {clés}`` ; les termes proches d’une saisie approximative
+  sont classés par similarité de Jaccard sur les trigrammes (un nom
+  partagé par mille clients n’est évalué qu’une fois) ;
+* **MRU** : les dernières clés utilisées (:meth:`LookupIndex.touch`)
+  passent en tête des résultats.
+
+Les termes sont normalisés (minuscules, sans accents).  Familles et
+clés :
+
+============  ===================  ======================================
+Famille       Clé                  Termes indexés
+============  ===================  ======================================
+``user``      ``employee_number``  numéro, prénom, nom, « prénom nom »,
+                                   partie locale de l’e‑mail
+``client``    ``id``               nom complet et chacun de ses mots,
+                                   entreprise, partie locale de l’e‑mail
+``contract``  ``id``               identifiant, nom du client et chacun
+                                   de ses mots
+============  ===================  ======================================
+
+Fraîcheur
+---------
+:meth:`LookupIndex.load` lit la base une fois (colonnes seules) puis
+abonne l’index aux *commits* des sessions ORM liées au même *engine* :
+les objets écrits par :class:`DataWriter` (ajouts, modifications,
+suppressions) sont capturés à chaque *flush* et appliqués à l’index
+lorsque la transaction est validée ; un *rollback* les abandonne.
+
+Une session jointe à une transaction externe en mode
+``create_savepoint`` (mode lot, :mod:`app.controllers.batch_runner`)
+ne fait que libérer un *SAVEPOINT* à son ``commit()`` : ses changements
+sont alors reportés sur la connexion, et appliqués (ou abandonnés) quand
+son propriétaire signale la fin de la transaction englobante
+(:func:`outer_transaction_ended`).  Un changement de numéro d’employé
+retire l’ancienne clé.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+import weakref
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.user import User
+from app.controllers.reference_cache import reference_cache
+
+KINDS = ("user", "client", "contract")
+
+_WATCHED: "weakref.WeakSet[LookupIndex]" = weakref.WeakSet()
+_PENDING = "lookup_index_pending"
+
+
+def _normalize(text: str) -> str:
+    """Minuscules, sans accents, espaces réduits."""
+    text = str(text)
+    if text.isascii():                     # cas courant : pas d’accents
+        return " ".join(text.lower().split())
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return " ".join("".join(
+        c for c in decomposed if not unicodedata.combining(c)).split())
+
+
+def _trigrams(term: str) -> set:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class LookupEntry:
+    """Entité indexée : clé à saisir, libellé affiché, rôle éventuel."""
+
+    __slots__ = ("kind", "key", "label", "name", "role", "terms")
+
+    def __init__(self, kind: str, key: Hashable, label: str, name: str,
+                 terms: Iterable[str], role: Optional[str] = None) -> None:
+        self.kind = kind
+        self.key = key
+        self.label = label
+        self.name = name
+        self.role = role
+        self.terms = tuple(dict.fromkeys(
+            t for t in map(_normalize, terms) if t))
+
+    def __repr__(self) -> str:
+        return f"LookupEntry({self.kind!r}, {self.key!r}, {self.label!r})"
+
+
+class LookupIndex:
+    """Index préfixe + trigrammes avec classement MRU."""
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, mru_size: int = 64) -> None:
+        self.mru_size = mru_size
+        self.loaded = False
+        self._engine = None
+        self._roles: Dict[int, str] = {}
+        self._entries: Dict[str, Dict[Hashable, LookupEntry]] = {
+            kind: {} for kind in KINDS}
+        self._prefix: Dict[str, List[Tuple[str, Hashable]]] = {
+            kind: [] for kind in KINDS}
+        self._grams: Dict[str, Dict[str, set]] = {
+            kind: defaultdict(set) for kind in KINDS}
+        self._holders: Dict[str, Dict[str, set]] = {
+            kind: {} for kind in KINDS}
+        self._sizes: Dict[str, int] = {}          # trigrammes par terme
+        self._mru: Dict[str, OrderedDict] = {
+            kind: OrderedDict() for kind in KINDS}
+
+    def __len__(self) -> int:
+        return sum(map(len, self._entries.values()))
+
+    # ------------------------------------------------------------------ #
+    # Construction des entrées                                           #
+    # ------------------------------------------------------------------ #
+    def _user_entry(self, emp: str, first: str, last: str, email: str,
+                    role_id: Optional[int]) -> LookupEntry:
+        role = self._roles.get(role_id)
+        name = f"{first} {last}"
+        return LookupEntry(
+            "user", emp, f"{emp} – {name}" + (f" ({role})" if role else ""),
+            name, (emp, first, last, name, (email or "").split("@")[0]),
+            role)
+
+    def _client_entry(self, cid: int, full_name: str, email: str,
+                      company: Optional[str]) -> LookupEntry:
+        label = f"{cid} – {full_name}" + (f" ({company})" if company else "")
+        return LookupEntry(
+            "client", cid, label, full_name,
+            (full_name, *full_name.split(), company or "",
+             (email or "").split("@")[0]))
+
+    def _contract_entry(self, cid: int, client_id: int) -> LookupEntry:
+        client = self._entries["client"].get(client_id)
+        name = client.name if client else f"client {client_id}"
+        return LookupEntry("contract", cid, f"{cid} – {name}", name,
+                           (str(cid), name, *name.split()))
+
+    def _row_for(self, obj) -> Optional[Tuple[str, Tuple]]:
+        """Famille et colonnes indexées d’un objet ORM (None sinon)."""
+        if isinstance(obj, User):
+            return "user", (obj.employee_number, obj.first_name,
+                            obj.last_name, obj.email, obj.role_id)
+        if isinstance(obj, Client):
+            return "client", (obj.id, obj.full_name, obj.email,
+                              obj.company_name)
+        if isinstance(obj, Contract):
+            return "contract", (obj.id, obj.client_id)
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Mise à jour                                                        #
+    # ------------------------------------------------------------------ #
+    def add(self, entry: LookupEntry, _bulk: bool = False) -> None:
+        """Ajoute (ou remplace) *entry*."""
+        self.remove(entry.kind, entry.key)
+        self._entries[entry.kind][entry.key] = entry
+        prefix, grams = self._prefix[entry.kind], self._grams[entry.kind]
+        for term in entry.terms:
+            if _bulk:                      # trié une fois en fin de load()
+                prefix.append((term, entry.key))
+            else:
+                insort(prefix, (term, entry.key))
+            holders = self._holders[entry.kind].setdefault(term, set())
+            if not holders:                # nouveau terme : ses trigrammes
+                term_grams = _trigrams(term)
+                self._sizes[term] = len(term_grams)
+                for gram in term_grams:
+                    grams[gram].add(term)
+            holders.add(entry.key)
+
+    def remove(self, kind: str, key: Hashable) -> None:
+        """Retire l’entrée *key* (sans effet si absente)."""
+        entry = self._entries[kind].pop(key, None)
+        if entry is None:
+            return
+        prefix, grams = self._prefix[kind], self._grams[kind]
+        for term in entry.terms:
+            pos = bisect_left(prefix, (term, key))
+            if pos < len(prefix) and prefix[pos] == (term, key):
+                del prefix[pos]
+            holders = self._holders[kind].get(term)
+            if holders is not None:
+                holders.discard(key)
+                if not holders:
+                    del self._holders[kind][term]
+                    for gram in _trigrams(term):
+                        grams[gram].discard(term)
+
+    def touch(self, kind: str, key: Hashable) -> None:
+        """Marque *key* comme utilisée à l’instant (classement MRU)."""
+        mru = self._mru[kind]
+        mru.pop(key, None)
+        mru[key] = None
+        if len(mru) > self.mru_size:
+            mru.popitem(last=False)
+
+    def load(self, session: Session) -> "LookupIndex":
+        """Charge toutes les entités puis suit les *commits* de l’engine."""
+        for kind in KINDS:
+            self._entries[kind].clear()
+            self._prefix[kind].clear()
+            self._grams[kind].clear()
+            self._holders[kind].clear()
+        self._roles = reference_cache(session).roles(session)
+        for row in session.execute(select(
+                User.employee_number, User.first_name, User.last_name,
+                User.email, User.role_id)):
+            self.add(self._user_entry(*row), _bulk=True)
+        for row in session.execute(select(
+                Client.id, Client.full_name, Client.email,
+                Client.company_name)):
+            self.add(self._client_entry(*row), _bulk=True)
+        for row in session.execute(select(Contract.id, Contract.client_id)):
+            self.add(self._contract_entry(*row), _bulk=True)
+        for terms in self._prefix.values():
+            terms.sort()
+
+        bind = session.get_bind()
+        self._engine = getattr(bind, "engine", bind)
+        _watch(self)
+        self.loaded = True
+        return self
+
+    def close(self) -> None:
+        """Cesse de suivre les *commits*."""
+        _WATCHED.discard(self)
+
+    # ------------------------------------------------------------------ #
+    # Recherche                                                          #
+    # ------------------------------------------------------------------ #
+    def _rank(self, kind: str, keys: Iterable[Hashable],
+              role: Optional[str], limit: int) -> List[LookupEntry]:
+        """Entrées de *keys* (déjà ordonnées), MRU en tête, rôle filtré."""
+        entries = self._entries[kind]
+        mru = self._mru[kind]
+        recent = {key: rank for rank, key in enumerate(reversed(mru))}
+        found = [entries[k] for k in keys
+                 if k in entries and (role is None or entries[k].role == role)]
+        found.sort(key=lambda e: recent.get(e.key, len(recent)))
+        return found[:limit]
+
+    def complete(self, kind: str, prefix: str, limit: int = 10,
+                 role: Optional[str] = None) -> List[LookupEntry]:
+        """
+        Entrées dont un terme commence par *prefix*.
+
+        Parameters
+        ----------
+        kind :
+            ``"user"``, ``"client"`` ou ``"contract"``.
+        prefix :
+            Saisie partielle (casse et accents ignorés).
+        limit :
+            Nombre maximal de résultats.
+        role :
+            Restreint les collaborateurs à un rôle (``"support"``…).
+
+        Returns
+        -------
+        list[LookupEntry]
+            Entrées récemment utilisées d’abord, puis ordre alphabétique.
+        """
+        text = _normalize(prefix)
+        entries = self._entries[kind]
+        keys = dict.fromkeys(
+            key for key in reversed(self._mru[kind])
+            if key in entries
+            and any(t.startswith(text) for t in entries[key].terms))
+
+        terms = self._prefix[kind]
+        scan = limit * (64 if role else 8)
+        pos = bisect_left(terms, (text,))
+        while pos < len(terms) and scan and terms[pos][0].startswith(text):
+            keys.setdefault(terms[pos][1])
+            pos += 1
+            scan -= 1
+        return self._rank(kind, keys, role, limit)
+
+    def suggest(self, kind: str, text: str, limit: int = 5,
+                role: Optional[str] = None,
+                threshold: float = 0.25) -> List[LookupEntry]:
+        """
+        Entrées proches de *text* (saisie approximative).
+
+        Les termes partageant des trigrammes avec *text* sont classés par
+        similarité de Jaccard ; seuls ceux atteignant *threshold* sont
+        retenus, les entrées récemment utilisées passant en tête à
+        similarité égale.
+        """
+        query = _trigrams(_normalize(text))
+        if not query:
+            return []
+        shared: Dict[str, int] = defaultdict(int)
+        grams = self._grams[kind]
+        for gram in query:
+            for term in grams.get(gram, ()):
+                shared[term] += 1
+
+        size, sizes = len(query), self._sizes
+        scored = []
+        for term, count in shared.items():
+            score = count / (size + sizes[term] - count)
+            if score >= threshold:
+                scored.append((-round(score, 2), term))
+        scored.sort()
+
+        entries, holders = self._entries[kind], self._holders[kind]
+        recent = list(reversed(self._mru[kind]))
+        found: Dict[Hashable, LookupEntry] = {}
+        for _score, term in scored:
+            keys = holders[term]
+            for key in chain((k for k in recent if k in keys), keys):
+                entry = entries[key]
+                if role is None or entry.role == role:
+                    found.setdefault(key, entry)
+                    if len(found) >= limit:
+                        return list(found.values())
+        return list(found.values())
+
+    def find(self, kind: str, text: str, limit: int = 5,
+             role: Optional[str] = None) -> List[LookupEntry]:
+        """Complétion si la saisie est un préfixe, sinon suggestions."""
+        return (self.complete(kind, text, limit, role)
+                or self.suggest(kind, text, limit, role))
+
+    # ------------------------------------------------------------------ #
+    # Suivi des commits                                                  #
+    # ------------------------------------------------------------------ #
+    def watches(self, session: Session) -> bool:
+        """True si *session* écrit dans la base indexée."""
+        if self._engine is None:
+            return False
+        try:
+            bind = session.get_bind()
+        except Exception:
+            return False
+        return getattr(bind, "engine", bind) is self._engine
+
+    def _capture(self, session: Session) -> List[Tuple]:
+        """Colonnes des objets d’un *flush*, appliquées au *commit*."""
+        changes: List[Tuple] = []
+        for action, objects in (("add", list(session.new)),
+                                ("add", list(session.dirty)),
+                                ("remove", list(session.deleted))):
+            for obj in objects:
+                found = self._row_for(obj)
+                if found is None:
+                    continue
+                if isinstance(obj, User) and action == "add":
+                    renamed = inspect(obj).attrs.employee_number.history
+                    for old in renamed.deleted or ():
+                        if old is not None:
+                            changes.append(("remove", "user", (old,)))
+                changes.append((action, *found))
+        return changes
+
+    def _apply(self, changes: Iterable[Tuple]) -> None:
+        """Applique les changements, famille par famille (clients avant
+        contrats : le libellé d’un contrat reprend le nom du client)."""
+        builders = {"user": self._user_entry, "client": self._client_entry,
+                    "contract": self._contract_entry}
+        changes = sorted(changes, key=lambda c: KINDS.index(c[1]))
+        for action, kind, row in changes:
+            if action == "add":
+                self.add(builders[kind](*row))
+            else:
+                self.remove(kind, row[0])
+
+
+# --------------------------------------------------------------------------- #
+# Écouteurs ORM (installés une fois, partagés par tous les index)             #
+# --------------------------------------------------------------------------- #
+def _after_flush(session: Session, _flush_context) -> None:
+    for index in list(_WATCHED):
+        if index.watches(session):
+            session.info.setdefault(_PENDING, []).append(
+                (index, index._capture(session)))
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING, [])
+    try:
+        bind = session.get_bind()
+    except Exception:
+        bind = None
+    if isinstance(bind, Connection) and bind.in_transaction():
+        # SAVEPOINT libéré : rien n’est encore validé en base.
+        if pending:
+            bind.info.setdefault(_PENDING, []).extend(pending)
+        return
+    for index, changes in pending:
+        index._apply(changes)
+
+
+def outer_transaction_ended(connection, committed: bool) -> None:
+    """
+    Fin de la transaction englobante de *connection* : applique (si
+    *committed*) ou abandonne les changements reportés par les sessions
+    qui y étaient jointes.
+    """
+    for index, changes in connection.info.pop(_PENDING, ()):
+        if committed:
+            index._apply(changes)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+def _watch(index: LookupIndex) -> None:
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
+    _WATCHED.add(index)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+ReferenceCache
+==============
+
+Données de référence conservées en mémoire pour tout le processus :
+
+* les **rôles** (``id`` ↔ ``name``) ;
+* l’**annuaire des collaborateurs** : pour chacun ``id``,
+  ``employee_number``, prénom, nom et rôle – jamais l’e‑mail ni le
+  hachage du mot de passe.
+
+Vues et contrôleurs y résolvent un rôle, un préfixe de matricule ou un
+support saisi par son numéro d’employé **sans requête** ; seul le
+chargement (deux ``SELECT`` de quelques colonnes) touche la base.
+
+Cycle de vie
+------------
+* :func:`reference_cache` renvoie le cache de l’*engine* de la session
+  (un par base, partagé par toutes les vues et tous les contrôleurs) ;
+  il est chargé à la première lecture – ou d’emblée par ``main run``.
+* :class:`DataWriter` appelle :meth:`ReferenceCache.invalidate` après
+  chaque création, modification ou suppression de collaborateur : la
+  lecture suivante recharge l’annuaire.
+* Les modifications faites par **un autre processus** sont prises en
+  compte à l’expiration du cache (``REFERENCE_CACHE_TTL`` secondes,
+  300 par défaut, ``0`` = à chaque lecture) ou dès qu’une recherche
+  échoue : un numéro inconnu provoque **un** rechargement avant de
+  conclure à son absence.
+
+Notes
+-----
+* Aucun décorateur n’est utilisé (pas de ``@property``).
+* Le rechargement construit de nouveaux dictionnaires puis les publie
+  d’un bloc : un lecteur concurrent voit l’ancien ou le nouvel état,
+  jamais un mélange.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.role import Role
+from app.models.user import User
+
+_DEFAULT_TTL = 300.0
+
+
+class Collaborator:
+    """Entrée compacte de l’annuaire (aucune donnée d’authentification)."""
+
+    __slots__ = ("id", "employee_number", "first_name", "last_name",
+                 "role_id", "role")
+
+    def __init__(self, id: int, employee_number: str, first_name: str,
+                 last_name: str, role_id: int, role: Optional[str]) -> None:
+        self.id = id
+        self.employee_number = employee_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.role_id = role_id
+        self.role = role
+
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    def __repr__(self) -> str:
+        return (f"<Collaborator {self.employee_number} "
+                f"{self.full_name()} ({self.role})>")
+
+
+class ReferenceCache:
+    """Rôles et annuaire des collaborateurs d’une base de données."""
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """
+        Parameters
+        ----------
+        ttl :
+            Durée de validité en secondes (``REFERENCE_CACHE_TTL`` ou
+            300 s si None).
+        """
+        if ttl is None:
+            ttl = float(os.getenv("REFERENCE_CACHE_TTL", _DEFAULT_TTL))
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._role_names: Dict[int, str] = {}
+        self._role_ids: Dict[str, int] = {}
+        self._by_number: Dict[str, Collaborator] = {}
+        self._by_id: Dict[int, Collaborator] = {}
+        self.loads = 0
+
+    # ------------------------------------------------------------------ #
+    # Chargement / invalidation                                          #
+    # ------------------------------------------------------------------ #
+    def load(self, session: Session) -> "ReferenceCache":
+        """(Re)charge rôles et annuaire via *session*."""
+        role_names = dict(session.execute(
+            select(Role.id, Role.name).order_by(Role.id)).all())
+        by_number: Dict[str, Collaborator] = {}
+        by_id: Dict[int, Collaborator] = {}
+        for uid, number, first, last, role_id in session.execute(select(
+                User.id, User.employee_number, User.first_name,
+                User.last_name, User.role_id).order_by(User.id)):
+            entry = Collaborator(uid, number, first, last, role_id,
+                                 role_names.get(role_id))
+            by_number[number] = entry
+            by_id[uid] = entry
+
+        with self._lock:
+            self._role_names = role_names
+            self._role_ids = {name: rid for rid, name in role_names.items()}
+            self._by_number = by_number
+            self._by_id = by_id
+            self._loaded_at = time.monotonic()
+            self.loads += 1
+        return self
+
+    def invalidate(self) -> None:
+        """Force le rechargement à la prochaine lecture."""
+        with self._lock:
+            self._loaded_at = None
+
+    def is_fresh(self) -> bool:
+        """Vrai si le contenu est chargé et non expiré."""
+        loaded_at = self._loaded_at
+        return (loaded_at is not None
+                and time.monotonic() - loaded_at < self.ttl)
+
+    def _ensure(self, session: Session) -> bool:
+        """Charge au besoin ; renvoie True si un chargement a eu lieu."""
+        if self.is_fresh():
+            return False
+        self.load(session)
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Rôles                                                              #
+    # ------------------------------------------------------------------ #
+    def roles(self, session: Session) -> Dict[int, str]:
+        """``{id: nom}`` de tous les rôles, par identifiant croissant."""
+        self._ensure(session)
+        return dict(self._role_names)
+
+    def role_name(self, session: Session, role_id: int) -> Optional[str]:
+        """Nom du rôle *role_id* (None s’il n’existe pas)."""
+        reloaded = self._ensure(session)
+        name = self._role_names.get(role_id)
+        if name is None and not reloaded:
+            self.load(session)
+            name = self._role_names.get(role_id)
+        return name
+
+    def role_id(self, session: Session, name: str) -> Optional[int]:
+        """Identifiant du rôle *name* (None s’il n’existe pas)."""
+        reloaded = self._ensure(session)
+        rid = self._role_ids.get(name)
+        if rid is None and not reloaded:
+            self.load(session)
+            rid = self._role_ids.get(name)
+        return rid
+
+    def prefix_for(self, session: Session, role_id: int) -> str:
+        """Préfixe de matricule : initiale du nom du rôle (*X* si inconnu)."""
+        name = self.role_name(session, role_id)
+        return name[0].upper() if name else "X"
+
+    def role_menu(self, session: Session) -> str:
+        """Aide de saisie, ex. ``1=commercial, 2=support, 3=gestion``."""
+        return ", ".join(f"{rid}={name}"
+                         for rid, name in self.roles(session).items())
+
+    # ------------------------------------------------------------------ #
+    # Annuaire                                                           #
+    # ------------------------------------------------------------------ #
+    def collaborator(self, session: Session, employee_number: str,
+                     role: Optional[str] = None) -> Optional[Collaborator]:
+        """
+        Collaborateur *employee_number*, éventuellement limité à *role*.
+
+        Un numéro absent du cache provoque un rechargement (collaborateur
+        créé par un autre processus) avant de renvoyer None.
+        """
+        reloaded = self._ensure(session)
+        entry = self._by_number.get(employee_number)
+        if entry is None and not reloaded:
+            self.load(session)
+            entry = self._by_number.get(employee_number)
+        if entry is None or (role is not None and entry.role != role):
+            return None
+        return entry
+
+    def collaborator_by_id(self, session: Session,
+                           user_id: int) -> Optional[Collaborator]:
+        """Collaborateur d’identifiant *user_id* (None s’il n’existe pas)."""
+        reloaded = self._ensure(session)
+        entry = self._by_id.get(user_id)
+        if entry is None and not reloaded:
+            self.load(session)
+            entry = self._by_id.get(user_id)
+        return entry
+
+    def collaborators(self, session: Session,
+                      role: Optional[str] = None) -> List[Collaborator]:
+        """Annuaire complet (ou limité à *role*), par identifiant."""
+        self._ensure(session)
+        return [entry for entry in self._by_id.values()
+                if role is None or entry.role == role]
+
+
+# ---------------------------------------------------------------------- #
+# Registre : un cache par engine                                         #
+# ---------------------------------------------------------------------- #
+_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def _engine_of(source):
+    """Engine derrière une session, une connexion BD ou un engine."""
+    if isinstance(source, Session):
+        source = source.get_bind()
+    source = getattr(source, "engine", source)
+    return getattr(source, "engine", source)
+
+
+def reference_cache(source) -> ReferenceCache:
+    """
+    Cache de référence de la base derrière *source* (créé au besoin).
+
+    Parameters
+    ----------
+    source :
+        Session SQLAlchemy, connexion (:class:`DatabaseConnection` ou
+        ``Connection``) ou *engine*.
+    """
+    engine = _engine_of(source)
+    cache = _caches.get(engine)
+    if cache is None:
+        with _registry_lock:
+            cache = _caches.get(engine)
+            if cache is None:
+                cache = _caches[engine] = ReferenceCache()
+    return cache
+
+
+def warm_reference_cache(db) -> Tuple[int, int]:
+    """
+    Charge d’emblée le cache de *db* (démarrage de la CLI).
+
+    Returns
+    -------
+    tuple
+        ``(rôles, collaborateurs)`` chargés.
+    """
+    cache = reference_cache(db)
+    with db.create_session() as session:
+        cache.load(session)
+    return len(cache._role_names), len(cache._by_id)
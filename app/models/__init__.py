@@ -4,3 +4,5 @@ from .user import User
 from .client import Client
 from .contract import Contract
 from .event import Event
+from .login_throttle import LoginThrottleBucket
+from .schema_version import SchemaVersion
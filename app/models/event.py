@@ -2,13 +2,20 @@
 
 Un événement (prestations Epic Events) est toujours adossé à un contrat.
 Il peut être pris en charge par un collaborateur *support*.
+
+L’index ``ix_events_support_period`` (support, début, fin) sert le
+calendrier d’un support et la détection des doubles affectations :
+:func:`overlapping` y restreint le support et borne ``date_start`` par
+le haut ; la borne basse (fin ≥ début de période) n’est qu’un filtre
+appliqué aux entrées parcourues.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, Index, Integer, String, Text, func)
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -18,6 +25,10 @@ class Event(Base):
     """Table *events* – informations logistiques des événements."""
 
     __tablename__: str = "events"
+    __table_args__ = (
+        Index("ix_events_support_period",
+              "support_id", "date_start", "date_end"),
+    )
 
     id: int = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -39,3 +50,19 @@ class Event(Base):
     # --- relations --------------------------------------------------
     contract = relationship("Contract", backref="event")
     support = relationship("User", backref="events")
+
+
+def overlapping(start: datetime, end: datetime):
+    """
+    Clause SQL : l’événement chevauche la période ``[start, end]``.
+
+    Les bornes sont incluses (saisie au jour près : deux événements du
+    même jour se chevauchent) ; un événement sans date de fin occupe
+    son seul instant de début.
+
+    Coût : aucune durée maximale ne bornant un événement, seule la fin
+    de période limite le parcours d’index ; les événements antérieurs du
+    support sont donc tous examinés (proportionnel à son historique).
+    """
+    return (Event.date_start <= end) & (
+        func.coalesce(Event.date_end, Event.date_start) >= start)
@@ -0,0 +1,25 @@
+"""Modèle « LoginThrottleBucket ».
+
+État persistant d’un seau à jetons (*token bucket*) utilisé pour limiter
+les tentatives de connexion lorsque plusieurs processus partagent la
+même base (cf. :mod:`app.authentification.login_throttle`).
+
+Colonnes en double précision : un ``FLOAT`` MySQL (simple précision)
+arrondirait un horodatage epoch (~1,7e9) par pas de 128 s.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, Double, String
+
+from app.models.base import Base
+
+
+class LoginThrottleBucket(Base):
+    """Table *login_throttle* – un seau par e‑mail ou par source."""
+
+    __tablename__: str = "login_throttle"
+
+    key: str = Column(String(255), primary_key=True)
+    tokens: float = Column(Double, nullable=False)
+    updated_at: float = Column(Double, nullable=False)  # horodatage epoch
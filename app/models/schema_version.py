@@ -0,0 +1,23 @@
+"""Modèle « SchemaVersion ».
+
+Historique des migrations appliquées à la base : la version la plus
+élevée indique l’état courant du schéma (cf. :mod:`main.migrate`).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.models.base import Base
+
+
+class SchemaVersion(Base):
+    """Table *schema_version* – une ligne par migration appliquée."""
+
+    __tablename__: str = "schema_version"
+
+    version: int = Column(Integer, primary_key=True, autoincrement=False)
+    description: str = Column(String(255), nullable=False)
+    applied_at: datetime = Column(DateTime, default=datetime.utcnow)
@@ -2,6 +2,11 @@
 
 Représente un collaborateur de l’entreprise, rattaché à un rôle
 (:class:`app.models.role.Role`).
+
+La relation ``role`` n’est plus jointe à chaque requête : les noms de
+rôle se lisent dans le cache de référence
+(:mod:`app.controllers.reference_cache`) ou, pour l’utilisateur qui se
+connecte, sont chargés explicitement (``joinedload``).
 """
 
 from __future__ import annotations
@@ -26,4 +31,4 @@ class User(Base):
 
     # --- relations --------------------------------------------------
     role_id: int = Column(Integer, ForeignKey("roles.id"), nullable=False)
-    role = relationship("Role", backref="users", lazy="joined")
+    role = relationship("Role", backref="users", lazy="select")
@@ -0,0 +1,186 @@
+# app/observability/actions.py
+# -*- coding: utf-8 -*-
+"""
+Contexte d’« action » courant (méthode de contrôleur ou action CLI).
+
+Une action est ouverte par :func:`action_scope` ; elle est mémorisée dans
+une :class:`~contextvars.ContextVar`, ce qui la rend visible depuis les
+événements SQLAlchemy déclenchés pendant son exécution (compteur de
+requêtes, journal des requêtes lentes, …).  Les actions s’imbriquent :
+une action CLI englobe les méthodes de contrôleur qu’elle appelle.
+
+Les *observateurs* (:func:`register_action_observer`) reçoivent chaque
+action ouverte et peuvent renvoyer un gestionnaire de contexte qui
+l’encadre (métriques, traces, profilage…).
+
+:func:`instrument` enveloppe les méthodes publiques d’un objet *sur
+l’instance* : les classes instrumentées restent libres de tout
+décorateur.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, List, Optional
+
+_current: ContextVar[Optional["Action"]] = ContextVar(
+    "epic_action", default=None)
+_observers: List[Callable[["Action"], Any]] = []
+
+
+class Action:
+    """Action en cours : nom, type, rôle et coût SQL accumulé."""
+
+    def __init__(self, name: str, kind: str = "action",
+                 role: Optional[str] = None,
+                 parent: Optional["Action"] = None) -> None:
+        self.name = name
+        self.kind = kind
+        self.role = role or (parent.role if parent else None)
+        self.parent = parent
+        self.queries = 0
+        self.sql_time = 0.0
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.error: Optional[BaseException] = None
+
+    def lineage(self):
+        """Itère de l’action courante jusqu’à l’action racine."""
+        action = self
+        while action is not None:
+            yield action
+            action = action.parent
+
+
+class _ActionScope:
+    """Gestionnaire de contexte renvoyé par :func:`action_scope`."""
+
+    def __init__(self, name: str, kind: str, role: Optional[str]) -> None:
+        self._args = (name, kind, role)
+        self._stack: Optional[ExitStack] = None
+        self._token = None
+        self.action: Optional[Action] = None
+
+    def __enter__(self) -> Action:
+        name, kind, role = self._args
+        self.action = Action(name, kind, role, parent=_current.get())
+        self._token = _current.set(self.action)
+        self._stack = ExitStack()
+        try:
+            for observer in list(_observers):
+                manager = observer(self.action)
+                if manager is not None:
+                    self._stack.enter_context(manager)
+        except BaseException:
+            self._stack.close()
+            _current.reset(self._token)
+            raise
+        return self.action
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.action.duration = time.perf_counter() - self.action.started
+        self.action.error = exc
+        try:
+            return self._stack.__exit__(exc_type, exc, tb)
+        finally:
+            _current.reset(self._token)
+
+
+def action_scope(name: str, kind: str = "action",
+                 role: Optional[str] = None) -> _ActionScope:
+    """
+    Ouvre l’action *name* pour la durée d’un bloc ``with``.
+
+    Parameters
+    ----------
+    name :
+        Identifiant lisible, ex. ``"DataWriter.update_contract"``.
+    kind :
+        Famille de l’action (``"cli"``, ``"controller"``, …).
+    role :
+        Rôle du collaborateur connecté ; hérité de l’action parente à
+        défaut.
+    """
+    return _ActionScope(name, kind, role)
+
+
+def current_action() -> Optional[Action]:
+    """Action la plus interne en cours, ou ``None``."""
+    return _current.get()
+
+
+def register_action_observer(observer: Callable[[Action], Any]) -> None:
+    """Ajoute *observer* (idempotent)."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def unregister_action_observer(observer: Callable[[Action], Any]) -> None:
+    """Retire *observer* s’il est enregistré."""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+# ---------------------------------------------------------------------- #
+# Instrumentation d’instances                                            #
+# ---------------------------------------------------------------------- #
+def _role_of(args) -> Optional[str]:
+    """Rôle lu dans le premier dictionnaire utilisateur des arguments."""
+    for arg in args[:2]:
+        if isinstance(arg, dict) and "role" in arg:
+            return arg.get("role")
+    return None
+
+
+def _resolve(obj, name: str):
+    """Attribut *name* de la classe de *obj*, lié à *obj* si possible."""
+    attr = getattr(type(obj), name)
+    binder = getattr(type(attr), "__get__", None)
+    return binder(attr, obj, type(obj)) if binder else attr
+
+
+def instrument(obj, prefix: str, kind: str = "controller",
+               skip: Iterable[str] = (),
+               around: Optional[Callable[[], Any]] = None):
+    """
+    Enveloppe chaque méthode publique de *obj* dans :func:`action_scope`.
+
+    La méthode est résolue sur la classe **à chaque appel** : un
+    ``patch`` posé ultérieurement sur la classe reste effectif.
+
+    Parameters
+    ----------
+    obj :
+        Instance à instrumenter (contrôleur, vue…).
+    prefix :
+        Préfixe du nom d’action, ex. ``"DataWriter"``.
+    kind :
+        Famille des actions créées.
+    skip :
+        Noms de méthodes à laisser intacts (ex. helpers d’affichage).
+    around :
+        Fabrique d’un gestionnaire de contexte supplémentaire ouvert
+        autour de chaque appel (ex. périmètre de session).
+
+    Returns
+    -------
+    object
+        *obj* lui‑même, pour chaîner dans un constructeur.
+    """
+    for name in dir(type(obj)):
+        if (name.startswith("_") or name in skip
+                or not callable(getattr(type(obj), name))):
+            continue
+
+        def wrapper(*args, _method=name, **kwargs):
+            with ExitStack() as stack:
+                if around is not None:
+                    stack.enter_context(around())
+                stack.enter_context(
+                    action_scope(f"{prefix}.{_method}", kind, _role_of(args)))
+                return _resolve(obj, _method)(*args, **kwargs)
+
+        wrapper.__name__ = name
+        setattr(obj, name, wrapper)
+    return obj
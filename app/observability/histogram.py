@@ -0,0 +1,95 @@
+# app/observability/histogram.py
+# -*- coding: utf-8 -*-
+"""
+Histogramme de latences à seaux logarithmiques (façon *HDR*).
+
+Les bornes suivent une progression géométrique de raison ``2 ** (1/4)``
+entre 1 µs et ~100 s : l’erreur relative d’un percentile est donc bornée
+(≈ 19 %) quel que soit l’ordre de grandeur, pour une empreinte fixe de
+~110 compteurs.  L’enregistrement d’une valeur coûte une recherche
+dichotomique et un incrément sous verrou.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+_SUB_BUCKETS = 4                      # seaux par puissance de deux
+_MIN_SECONDS = 1e-6
+_MAX_SECONDS = 100.0
+
+#: Bornes supérieures (secondes) partagées par tous les histogrammes.
+BOUNDS: Tuple[float, ...] = tuple(
+    _MIN_SECONDS * 2 ** (i / _SUB_BUCKETS)
+    for i in range(int(math.log2(_MAX_SECONDS / _MIN_SECONDS)
+                       * _SUB_BUCKETS) + 2)
+)
+
+
+class LatencyHistogram:
+    """Compteurs par seau + somme, min et max (durées en secondes)."""
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * (len(BOUNDS) + 1)  # +1 : au‑delà
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Ajoute une observation."""
+        idx = bisect.bisect_left(BOUNDS, seconds)
+        with self._lock:
+            self._counts[idx] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Estimation du quantile *q* (0–100), bornée par min / max."""
+        with self._lock:
+            counts, count = list(self._counts), self.count
+        if not count:
+            return 0.0
+        rank = max(1, math.ceil(count * q / 100.0))
+        seen = 0
+        for idx, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                upper = BOUNDS[idx] if idx < len(BOUNDS) else self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def cumulative(self, bounds: Sequence[float]) -> List[Tuple[float, int]]:
+        """
+        Compte cumulé d’observations ≤ chaque borne de *bounds*.
+
+        Sert à l’export au format Prometheus (seaux ``le``) ; la précision
+        est celle des seaux internes.
+        """
+        with self._lock:
+            counts = list(self._counts)
+        result, seen, idx = [], 0, 0
+        for bound in sorted(bounds):
+            while idx < len(BOUNDS) and BOUNDS[idx] <= bound:
+                seen += counts[idx]
+                idx += 1
+            result.append((bound, seen))
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        """Résumé lisible (millisecondes)."""
+        return {
+            "count": self.count,
+            "mean_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
@@ -0,0 +1,124 @@
+# app/observability/importtime.py
+# -*- coding: utf-8 -*-
+"""
+Budget de démarrage basé sur ``python -X importtime``
+=====================================================
+
+Le temps jusqu’au premier prompt de ``python -m main`` est dominé par
+les imports.  Ce module lance un interpréteur **neuf** avec l’option
+``-X importtime``, analyse le rapport émis sur *stderr* puis vérifie :
+
+* qu’aucune dépendance lourde (Sentry, Argon2, JWT, SQLAlchemy, dotenv,
+  modèles) n’est importée par le module testé ;
+* que le temps cumulé d’import du module reste sous un budget (ms).
+
+Utilisation en ligne de commande ::
+
+    python -m app.observability.importtime app.views.cli_interface \\
+        --budget-ms 100
+
+Le code de sortie vaut 1 si le budget est dépassé.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+#: Modules dont le chargement doit rester différé au premier usage.
+HEAVY_MODULES: Tuple[str, ...] = (
+    "sentry_sdk",
+    "argon2",
+    "jwt",
+    "sqlalchemy",
+    "dotenv",
+    "app.models",
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def profile_imports(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Importe *module* dans un interpréteur neuf et renvoie le rapport.
+
+    Returns
+    -------
+    dict
+        ``{nom_module: (self_µs, cumul_µs)}`` pour chaque module importé.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [_ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=_ROOT,
+        env=env,
+        check=True,
+    )
+    report: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumul_us, name = line[len("import time:"):].split("|", 2)
+        report[name.strip()] = (int(self_us), int(cumul_us))
+    return report
+
+
+def check_startup_budget(
+    module: str,
+    budget_ms: float,
+    forbidden: Iterable[str] = HEAVY_MODULES,
+    report: Dict[str, Tuple[int, int]] | None = None,
+) -> List[str]:
+    """
+    Renvoie la liste des violations (vide si le budget est respecté).
+
+    *report* peut être fourni pour éviter de relancer un interpréteur.
+    """
+    if report is None:
+        report = profile_imports(module)
+    forbidden = tuple(forbidden)
+    violations = [
+        f"{name} importé au chargement de {module}"
+        for name in report
+        if any(name == p or name.startswith(p + ".") for p in forbidden)
+    ]
+    cumul_ms = report.get(module, (0, 0))[1] / 1000
+    if cumul_ms > budget_ms:
+        violations.append(
+            f"{module} : {cumul_ms:.1f} ms > budget {budget_ms:.1f} ms")
+    return violations
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Point d’entrée ``python -m app.observability.importtime``."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="+")
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument("--top", type=int, default=10,
+                        help="nombre de modules les plus coûteux affichés")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for module in args.modules:
+        report = profile_imports(module)
+        print(f"== {module} ==")
+        slowest = sorted(report.items(), key=lambda kv: kv[1][0],
+                         reverse=True)[:args.top]
+        for name, (self_us, _cumul) in slowest:
+            print(f"  {self_us / 1000:8.2f} ms  {name}")
+        for violation in check_startup_budget(
+                module, args.budget_ms, report=report):
+            print(f"  ✗ {violation}")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
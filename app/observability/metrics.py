@@ -0,0 +1,313 @@
+# app/observability/metrics.py
+# -*- coding: utf-8 -*-
+"""
+Métriques de latence et de débit au format Prometheus.
+
+Un observateur d’action (cf. :mod:`app.observability.actions`) alimente
+:data:`METRICS` à la fin de chaque action – méthode de DataReader /
+DataWriter / DataExporter ou action CLI – par couple *(action, rôle)* :
+
+* ``epic_action_calls_total``            appels ;
+* ``epic_action_errors_total``           échecs, par type d’exception ;
+* ``epic_action_duration_seconds``       histogramme des durées (seaux
+  ``le`` Prometheus, issus de :class:`LatencyHistogram`) ;
+* ``epic_action_duration_quantile_seconds``  p50 / p95 / p99 estimés
+  par l’histogramme à seaux logarithmiques (erreur relative ≤ 19 %) ;
+* ``epic_action_sql_queries_total`` / ``epic_action_sql_seconds_total``
+  coût SQL imputé à l’action.
+
+Enregistrer une action coûte deux recherches de dictionnaire et un
+incrément d’histogramme ; le texte Prometheus n’est produit qu’à la
+lecture.
+
+Export (variables d’environnement, lues par :func:`install_metrics_from_env`)
+-----------------------------------------------------------------------------
+``EPIC_METRICS_FILE``      fichier *textfile* (collecteur de
+                           ``node_exporter``), réécrit de façon atomique
+                           au plus toutes les ``EPIC_METRICS_INTERVAL``
+                           secondes (15) à la fin d’une action racine,
+                           puis à la sortie du processus ;
+``EPIC_METRICS_PORT``      point ``/metrics`` HTTP local (thread démon),
+                           sur ``EPIC_METRICS_HOST`` (``127.0.0.1``).
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.config.env import load_env
+from app.observability.actions import register_action_observer
+from app.observability.histogram import LatencyHistogram
+
+#: Seaux ``le`` exportés (secondes).
+EXPORT_BOUNDS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+_QUANTILES = (50, 95, 99)
+
+
+def _escape(value: str) -> str:
+    """Échappe une valeur de label (antislash, guillemet, saut de ligne)."""
+    return (value.replace("\\", "\\\\").replace('"', '\\"')
+            .replace("\n", "\\n"))
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(str(value))}"'
+                    for key, value in labels.items())
+
+
+class _Series:
+    """Compteurs et histogramme d’un couple *(type, action, rôle)*."""
+
+    __slots__ = ("calls", "queries", "sql_time", "latency")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.latency = LatencyHistogram()
+
+
+class MetricsRegistry:
+    """Agrégat des métriques d’action (thread‑safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._errors: Dict[Tuple[str, str, str, str], int] = {}
+
+    def record(self, action) -> None:
+        """Ajoute une action terminée (durée, coût SQL, erreur)."""
+        key = (action.kind, action.name, action.role or "")
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, _Series())
+        series.latency.record(action.duration)
+        with self._lock:
+            series.calls += 1
+            series.queries += action.queries
+            series.sql_time += action.sql_time
+            if action.error is not None:
+                err = key + (type(action.error).__name__,)
+                self._errors[err] = self._errors.get(err, 0) + 1
+
+    def reset(self) -> None:
+        """Remet toutes les métriques à zéro."""
+        with self._lock:
+            self._series.clear()
+            self._errors.clear()
+
+    def render(self) -> str:
+        """Texte d’exposition Prometheus (format 0.0.4)."""
+        with self._lock:
+            items = sorted(self._series.items())
+            errors = sorted(self._errors.items())
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("epic_action_calls_total", "counter",
+               "Actions terminées, par action et rôle.")
+        for (kind, name, role), series in items:
+            lines.append(f"epic_action_calls_total"
+                         f"{{{_labels(kind=kind, action=name, role=role)}}} "
+                         f"{series.calls}")
+
+        family("epic_action_errors_total", "counter",
+               "Actions en échec, par type d’exception.")
+        for (kind, name, role, exc), count in errors:
+            labels = _labels(kind=kind, action=name, role=role,
+                             exception=exc)
+            lines.append(f"epic_action_errors_total{{{labels}}} {count}")
+
+        family("epic_action_duration_seconds", "histogram",
+               "Durée des actions.")
+        for (kind, name, role), series in items:
+            base = _labels(kind=kind, action=name, role=role)
+            hist = series.latency
+            for bound, count in hist.cumulative(EXPORT_BOUNDS):
+                lines.append(f"epic_action_duration_seconds_bucket"
+                             f'{{{base},le="{bound:g}"}} {count}')
+            lines.append(f'epic_action_duration_seconds_bucket'
+                         f'{{{base},le="+Inf"}} {hist.count}')
+            lines.append(f"epic_action_duration_seconds_sum{{{base}}} "
+                         f"{hist.total:.9f}")
+            lines.append(f"epic_action_duration_seconds_count{{{base}}} "
+                         f"{hist.count}")
+
+        family("epic_action_duration_quantile_seconds", "gauge",
+               "Quantiles estimés par l’histogramme logarithmique.")
+        for (kind, name, role), series in items:
+            base = _labels(kind=kind, action=name, role=role)
+            for q in _QUANTILES:
+                lines.append(
+                    f"epic_action_duration_quantile_seconds"
+                    f'{{{base},quantile="{q / 100:g}"}} '
+                    f"{series.latency.percentile(q):.9f}")
+
+        family("epic_action_sql_queries_total", "counter",
+               "Requêtes SQL imputées aux actions.")
+        for (kind, name, role), series in items:
+            lines.append(f"epic_action_sql_queries_total"
+                         f"{{{_labels(kind=kind, action=name, role=role)}}} "
+                         f"{series.queries}")
+
+        family("epic_action_sql_seconds_total", "counter",
+               "Temps SQL imputé aux actions.")
+        for (kind, name, role), series in items:
+            lines.append(f"epic_action_sql_seconds_total"
+                         f"{{{_labels(kind=kind, action=name, role=role)}}} "
+                         f"{series.sql_time:.9f}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Écrit :meth:`render` dans *path* (fichier temporaire + rename)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                out.write(self.render())
+            os.chmod(tmp, 0o644)           # lisible par node_exporter
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+#: Agrégat global, alimenté à la fin de chaque action.
+METRICS = MetricsRegistry()
+
+
+# ---------------------------------------------------------------------- #
+# Export                                                                 #
+# ---------------------------------------------------------------------- #
+class _Textfile:
+    """Réécriture périodique du fichier *textfile*."""
+
+    def __init__(self, path: str, interval: float) -> None:
+        self.path = path
+        self.interval = interval
+        self._last = 0.0
+
+    def maybe_write(self) -> None:
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.write()
+
+    def write(self) -> None:
+        try:
+            METRICS.write_textfile(self.path)
+        except OSError:                    # supervision : au mieux
+            pass
+
+
+_textfile: Optional[_Textfile] = None
+
+
+class _MetricsObserver:
+    """Observateur d’action : enregistre l’action à sa sortie."""
+
+    def __init__(self, action) -> None:
+        self.action = action
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        METRICS.record(self.action)
+        if _textfile is not None and self.action.parent is None:
+            _textfile.maybe_write()
+        return False
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1"):
+    """
+    Sert ``GET /metrics`` sur *host*:*port* dans un thread démon.
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        Serveur démarré (``shutdown()`` pour l’arrêter).
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = METRICS.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type",
+                             "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):     # pas de bruit sur la console
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="epic-metrics",
+                     daemon=True).start()
+    return server
+
+
+def install_metrics(textfile: Optional[str] = None,
+                    port: Optional[int] = None,
+                    host: str = "127.0.0.1",
+                    interval: float = 15.0):
+    """
+    Active la collecte et, au besoin, l’export.
+
+    Parameters
+    ----------
+    textfile :
+        Chemin du fichier *textfile* Prometheus.
+    port :
+        Port du point ``/metrics`` (aucun serveur si None).
+    host :
+        Adresse d’écoute du serveur.
+    interval :
+        Délai minimal (s) entre deux réécritures du fichier.
+
+    Returns
+    -------
+    ThreadingHTTPServer | None
+        Serveur ``/metrics`` démarré, le cas échéant.
+    """
+    global _textfile
+    register_action_observer(_MetricsObserver)
+    if textfile and (_textfile is None or _textfile.path != textfile):
+        _textfile = _Textfile(textfile, interval)
+        atexit.register(_textfile.write)
+    if port is not None:
+        return serve_metrics(port, host)
+    return None
+
+
+def install_metrics_from_env():
+    """:func:`install_metrics` selon ``EPIC_METRICS_*`` (rien si absentes)."""
+    load_env()
+    textfile = os.getenv("EPIC_METRICS_FILE")
+    port = os.getenv("EPIC_METRICS_PORT")
+    if not textfile and not port:
+        return None
+    return install_metrics(
+        textfile=textfile,
+        port=int(port) if port else None,
+        host=os.getenv("EPIC_METRICS_HOST", "127.0.0.1"),
+        interval=float(os.getenv("EPIC_METRICS_INTERVAL", "15")),
+    )
@@ -0,0 +1,122 @@
+# app/observability/pool_metrics.py
+# -*- coding: utf-8 -*-
+"""
+Métriques du pool de connexions SQLAlchemy.
+
+:class:`PoolMetrics` s’attache à un *engine* et suit en continu :
+
+* les connexions ouvertes, empruntées (*checked out*) et rendues ;
+* le débordement (*overflow*) au‑delà de ``pool_size`` ;
+* le temps passé à attendre une connexion libre (cumul et en cours) ;
+* un histogramme de la latence d’emprunt (cf. :class:`LatencyHistogram`).
+
+Les compteurs proviennent des événements de pool (``connect``,
+``checkout``, ``checkin``, ``invalidate``) ; l’attente est mesurée autour
+de ``Pool._do_get`` – le point d’extension prévu par SQLAlchemy pour les
+implémentations de pool – réinstallé après chaque ``engine.dispose()``.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+
+from app.observability.histogram import LatencyHistogram
+
+
+class PoolMetrics:
+    """Collecteur de statistiques pour le pool d’un *engine*."""
+
+    def __init__(self, engine) -> None:
+        self.engine = engine
+        self.checkout_latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.wait_time_total = 0.0
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "engine_disposed", self._on_disposed)
+        self._instrument(engine.pool)
+
+    # ------------------------------------------------------------------ #
+    # Instrumentation                                                    #
+    # ------------------------------------------------------------------ #
+    def _instrument(self, pool) -> None:
+        """Chronomètre ``pool._do_get`` (attente d’une connexion libre)."""
+        do_get = pool._do_get
+
+        def timed_do_get():
+            with self._lock:
+                self.waiting += 1
+            start = time.perf_counter()
+            try:
+                return do_get()
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.waiting -= 1
+                    self.wait_time_total += elapsed
+                self.checkout_latency.record(elapsed)
+
+        pool._do_get = timed_do_get
+
+    def _on_connect(self, dbapi_conn, record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_conn, record, proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def _on_checkin(self, dbapi_conn, record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def _on_invalidate(self, dbapi_conn, record, exc) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_disposed(self, engine) -> None:
+        self._instrument(engine.pool)
+
+    # ------------------------------------------------------------------ #
+    # Lecture                                                            #
+    # ------------------------------------------------------------------ #
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Photographie des statistiques courantes.
+
+        Les valeurs ``pool_size``, ``checked_in`` et ``overflow`` ne sont
+        renseignées que pour les pools qui les exposent (``QueuePool``).
+        """
+        pool = self.engine.pool
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "pool_class": type(pool).__name__,
+                "checked_out": self.checked_out,
+                "waiting": self.waiting,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "wait_time_total_ms": self.wait_time_total * 1000,
+            }
+        for key, attr in (("pool_size", "size"),
+                          ("checked_in", "checkedin"),
+                          ("overflow", "overflow")):
+            getter = getattr(pool, attr, None)
+            stats[key] = getter() if callable(getter) else None
+        stats["checkout_latency"] = self.checkout_latency.summary()
+        return stats
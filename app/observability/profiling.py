@@ -0,0 +1,196 @@
+# app/observability/profiling.py
+# -*- coding: utf-8 -*-
+"""
+Profilage intégré des actions CLI (``cProfile`` + ``tracemalloc``).
+
+Activé par ``EPIC_PROFILE_DIR`` : une fraction ``EPIC_PROFILE_RATE``
+(0.1 par défaut) des actions de menu de :class:`CLIInterface` – actions
+racines de type ``cli`` – est exécutée sous :mod:`cProfile` et
+:mod:`tracemalloc`.  Pour chacune, deux fichiers sont écrits dans le
+dossier ::
+
+    20250601-101500-123-DataReaderView.display_contracts_only-4242.pstats
+    20250601-101500-123-DataReaderView.display_contracts_only-4242.mem.txt
+
+* ``.pstats`` : à lire avec ``python -m pstats`` ou *snakeviz* ;
+* ``.mem.txt`` : durée, requêtes SQL, pic mémoire et les
+  ``EPIC_PROFILE_TOP`` (20) lignes de code ayant le plus alloué pendant
+  l’action (blocs encore vivants à sa fin).
+
+Les actions non tirées au sort ne coûtent qu’un tirage aléatoire ; le
+mode peut donc rester actif en production avec un taux faible.
+``EPIC_PROFILE_MEMORY=0`` désactive :mod:`tracemalloc` (le plus coûteux
+des deux) et ne conserve que ``cProfile``.
+"""
+from __future__ import annotations
+
+import os
+import random
+import re
+import time
+from typing import Callable, Optional
+
+from app.config.env import load_env
+from app.observability.actions import (
+    register_action_observer,
+    unregister_action_observer,
+)
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ActionProfiler:
+    """
+    Observateur d’action : profile les actions CLI tirées au sort.
+
+    Parameters
+    ----------
+    directory :
+        Dossier de sortie (créé au besoin).
+    rate :
+        Fraction des actions profilées (0–1).
+    top :
+        Nombre de lignes du rapport d’allocations.
+    memory :
+        Active :mod:`tracemalloc` en plus de :mod:`cProfile`.
+    draw :
+        Tirage aléatoire dans [0, 1) (injectable pour les tests).
+    """
+
+    def __init__(self, directory: str, rate: float = 0.1, top: int = 20,
+                 memory: bool = True,
+                 draw: Callable[[], float] = random.random) -> None:
+        self.directory = directory
+        self.rate = rate
+        self.top = top
+        self.memory = memory
+        self._draw = draw
+        self._active = False
+        self.profiled = 0
+
+    def __call__(self, action):
+        if (action.kind != "cli" or action.parent is not None
+                or self._active or self._draw() >= self.rate):
+            return None
+        return _ProfiledAction(self, action)
+
+    def _base_path(self, action) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        millis = int(time.time() * 1000) % 1000
+        name = _UNSAFE.sub("_", action.name)
+        return os.path.join(self.directory,
+                            f"{stamp}-{millis:03d}-{name}-{os.getpid()}")
+
+
+class _ProfiledAction:
+    """Profil d’une action : démarré à l’entrée, écrit à la sortie."""
+
+    def __init__(self, profiler: ActionProfiler, action) -> None:
+        self.profiler = profiler
+        self.action = action
+        self._profile = None
+        self._tracing = False
+
+    def __enter__(self):
+        import cProfile
+        import tracemalloc
+
+        self._profile = cProfile.Profile()
+        try:
+            self._profile.enable()
+        except ValueError:                 # autre profileur déjà actif
+            self._profile = None
+            return self
+        self.profiler._active = True
+        if self.profiler.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        import tracemalloc
+
+        if self._profile is None:
+            return False
+        self._profile.disable()
+        snapshot, peak = None, 0
+        if self._tracing:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.profiler._active = False
+        try:
+            self._write(snapshot, peak)
+        except OSError:                    # diagnostic : au mieux
+            pass
+        return False
+
+    def _write(self, snapshot, peak: int) -> None:
+        os.makedirs(self.profiler.directory, exist_ok=True)
+        base = self.profiler._base_path(self.action)
+        self._profile.dump_stats(base + ".pstats")
+
+        action = self.action
+        lines = [
+            f"action  : {action.name}",
+            f"rôle    : {action.role or '-'}",
+            f"durée   : {action.duration * 1000:.1f} ms",
+            f"SQL     : {action.queries} requêtes, "
+            f"{action.sql_time * 1000:.1f} ms",
+        ]
+        if action.error is not None:
+            lines.append(f"erreur  : {type(action.error).__name__}")
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces((
+                _exclude("<frozen importlib._bootstrap>"),
+                _exclude("<frozen importlib._bootstrap_external>"),
+                _exclude(__file__),
+            ))
+            stats = snapshot.statistics("lineno")
+            lines.append(f"mémoire : pic {peak / 1024:.1f} KiB, "
+                         f"{sum(s.size for s in stats) / 1024:.1f} KiB "
+                         f"encore alloués")
+            lines.append("")
+            lines.append(f"Top {self.profiler.top} allocations "
+                         "(taille KiB, blocs, ligne) :")
+            for stat in stats[:self.profiler.top]:
+                frame = stat.traceback[0]
+                lines.append(f"{stat.size / 1024:10.1f} {stat.count:8d}  "
+                             f"{frame.filename}:{frame.lineno}")
+        with open(base + ".mem.txt", "w", encoding="utf-8") as out:
+            out.write("\n".join(lines) + "\n")
+        self.profiler.profiled += 1
+
+
+def _exclude(filename: str):
+    import tracemalloc
+
+    return tracemalloc.Filter(False, filename)
+
+
+_installed: Optional[ActionProfiler] = None
+
+
+def install_profiling(directory: str, rate: float = 0.1, top: int = 20,
+                      memory: bool = True) -> ActionProfiler:
+    """Remplace le profileur installé par un :class:`ActionProfiler`."""
+    global _installed
+    if _installed is not None:
+        unregister_action_observer(_installed)
+    _installed = ActionProfiler(directory, rate, top, memory)
+    register_action_observer(_installed)
+    return _installed
+
+
+def install_profiling_from_env() -> Optional[ActionProfiler]:
+    """:func:`install_profiling` selon ``EPIC_PROFILE_*`` (rien sans dossier)."""
+    load_env()
+    directory = os.getenv("EPIC_PROFILE_DIR")
+    if not directory:
+        return None
+    return install_profiling(
+        directory,
+        rate=float(os.getenv("EPIC_PROFILE_RATE", "0.1")),
+        top=int(os.getenv("EPIC_PROFILE_TOP", "20")),
+        memory=os.getenv("EPIC_PROFILE_MEMORY", "1") != "0",
+    )
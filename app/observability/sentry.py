@@ -13,7 +13,13 @@ Variables d’environnement reconnues
 
 ``SENTRY_DSN``               clé de projet fournie par Sentry (obligatoire)  
 ``SENTRY_ENV``               environnement logique ; *prod* par défaut  
-``SENTRY_TRACES``            taux d’échantillonnage pour l’APM (*0.0 → off*)  
+``SENTRY_TRACES``            active l’APM (*0.0 → off*) ; taux par défaut des
+                             écritures  
+``SENTRY_TRACES_READ`` / ``_WRITE`` / ``_ERRORS``
+                             taux par nature d’action (cf.
+                             :mod:`app.observability.tracing`)  
+``SENTRY_SPOOL``             ``0`` : transport HTTP du SDK au lieu du spool
+                             disque (cf. :mod:`app.observability.spool_transport`)  
 
 Toutes les autres options conservent leurs valeurs par défaut.
 
@@ -22,27 +28,18 @@ Exemple de contenu minimal du *.env* ::
     # Sentry
     SENTRY_DSN=https://…@…ingest.sentry.io/123456
     SENTRY_ENV=prod
-    SENTRY_TRACES=0.25        # 25 % des transactions tracées
+    SENTRY_TRACES=0.25        # 25 % des écritures tracées
+    SENTRY_TRACES_READ=0.01   # 1 % des lectures
+
+Le ``.env`` n’est lu – et ``sentry_sdk`` n’est importé – qu’à l’appel de
+:func:`init_sentry`, et seulement si un DSN est configuré : sans DSN, le
+SDK ne pèse rien sur le démarrage de la CLI.
 """
 from __future__ import annotations
 
 import os
 
-from dotenv import load_dotenv
-import sentry_sdk
-
-# ---------------------------------------------------------------------------#
-# Chargement du fichier .env (s’il existe)                                    #
-# ---------------------------------------------------------------------------#
-load_dotenv()  # Aucune erreur si le fichier est absent
-
-# ---------------------------------------------------------------------------#
-# Lecture des variables d’environnement                                       #
-# ---------------------------------------------------------------------------#
-_DSN: str | None = os.getenv("SENTRY_DSN")
-_ENV: str = os.getenv("SENTRY_ENV", "prod")
-_TRACES_RATE: float = float(
-    os.getenv("SENTRY_TRACES", "0.0"))  # 0.0 ➜ désactivé
+from app.config.env import load_env
 
 
 def init_sentry() -> None:
@@ -52,18 +49,52 @@ def init_sentry() -> None:
     La fonction est *idempotente* : appeler plusieurs fois ``init_sentry()``
     n’a aucun effet secondaire.
     """
-    if not _DSN:
+    load_env()  # Aucune erreur si le fichier est absent
+    dsn: str | None = os.getenv("SENTRY_DSN")
+    if not dsn:
         # Aucune configuration trouvée : on ne fait rien, l’application
         # continue simplement sans remontée vers Sentry.
         return
 
+    import sentry_sdk
+
+    traces_rate = float(os.getenv("SENTRY_TRACES", "0.0"))  # 0.0 ➜ désactivé
+    sampler = None
+    integrations = []
+    if traces_rate > 0.0:
+        from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
+        from app.observability.tracing import install_tracing, sampler_from_env
+
+        sampler = sampler_from_env(traces_rate)
+        integrations.append(SqlalchemyIntegration())    # spans « db »
+
+    # Événements écrits sur disque puis envoyés en tâche de fond : une
+    # capture n’attend jamais le réseau, et rien n’est perdu hors ligne.
+    transport = None
+    if os.getenv("SENTRY_SPOOL", "1") != "0":
+        from app.observability.spool_transport import SpoolTransport
+
+        try:
+            transport = SpoolTransport(
+                {"dsn": dsn},
+                max_bytes=int(float(os.getenv("SENTRY_SPOOL_MAX_MB", "20"))
+                              * 1024 * 1024))
+        except OSError:
+            # Dossier de spool impossible à créer : transport du SDK.
+            transport = None
+
     # Initialisation « basique » : seules les options réellement utiles dans
     # le cadre du projet sont renseignées ; le reste suit la configuration
     # par défaut du SDK.
     sentry_sdk.init(
-        dsn=_DSN,
-        environment=_ENV,
+        dsn=dsn,
+        environment=os.getenv("SENTRY_ENV", "prod"),
         send_default_pii=True,          # envoie IP, User‑Agent, etc.
-        traces_sample_rate=_TRACES_RATE,
-        enable_tracing=_TRACES_RATE > 0.0,
+        traces_sample_rate=traces_rate,
+        traces_sampler=sampler,         # prioritaire sur le taux global
+        integrations=integrations,
+        transport=transport,
     )
+    if sampler is not None:
+        install_tracing(sampler)        # transactions / spans par action
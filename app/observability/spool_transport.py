@@ -0,0 +1,268 @@
+# app/observability/spool_transport.py
+# -*- coding: utf-8 -*-
+"""
+Transport Sentry « hors ligne » : spool disque + envoi en tâche de fond.
+
+Le transport HTTP du SDK envoie depuis un thread mais perd les
+événements lorsque le réseau est absent ou lent (file bornée, ``flush``
+qui attend).  :class:`SpoolTransport` découple complètement capture et
+réseau :
+
+* ``capture_envelope`` **écrit** l’enveloppe sérialisée dans le dossier
+  de spool (un fichier par enveloppe, écrit sous ``.tmp`` puis renommé)
+  et rend la main : aucune attente réseau ;
+* un thread démon **vide** le spool, du plus ancien au plus récent, vers
+  l’API *envelope* du DSN.  En cas d’échec réseau ou de réponse 5xx /
+  429, il attend selon un *backoff* exponentiel (``Retry-After`` s’il
+  est fourni) puis réessaie ; une réponse 4xx (enveloppe refusée) la
+  supprime ;
+* ce qui n’a pas pu partir reste sur disque et sera envoyé par le
+  prochain processus (CLI relancée une fois le réseau revenu).
+
+Plusieurs processus peuvent partager le dossier : une enveloppe est
+réservée par renommage atomique avant envoi.  Le spool est borné à
+``max_bytes`` (les plus anciennes enveloppes sont abandonnées).
+
+Variables d’environnement (cf. :func:`init_sentry`)
+---------------------------------------------------
+``SENTRY_SPOOL``          ``0`` pour revenir au transport HTTP du SDK ;
+``SENTRY_SPOOL_DIR``      dossier (``~/.epic_events/sentry-spool``) ;
+``SENTRY_SPOOL_MAX_MB``   taille maximale du spool (20 Mo).
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from sentry_sdk.consts import EndpointType
+from sentry_sdk.transport import Transport
+
+_SUFFIX = ".envelope"
+_INFLIGHT = ".inflight"
+_STALE_INFLIGHT = 600.0                  # réservation abandonnée (s)
+
+
+def default_spool_dir() -> str:
+    return os.getenv("SENTRY_SPOOL_DIR") or os.path.join(
+        os.path.expanduser("~"), ".epic_events", "sentry-spool")
+
+
+class SpoolTransport(Transport):
+    """
+    Transport Sentry écrivant sur disque et envoyant en arrière‑plan.
+
+    Parameters
+    ----------
+    options :
+        Options du SDK (au minimum ``{"dsn": …}``).
+    directory :
+        Dossier de spool (créé en ``0700`` ; :class:`OSError` s’il ne
+        peut l’être).
+    max_bytes :
+        Taille maximale du spool.
+    base_delay, max_delay :
+        Bornes (s) du *backoff* exponentiel entre deux tentatives.
+    timeout :
+        Délai (s) d’une requête HTTP.
+    background :
+        Démarre le thread d’envoi (False : envoi manuel via
+        :meth:`drain`, pour les tests).
+    """
+
+    def __init__(self, options: Dict[str, Any], directory: Optional[str] = None,
+                 max_bytes: int = 20 * 1024 * 1024,
+                 base_delay: float = 1.0, max_delay: float = 300.0,
+                 timeout: float = 10.0, background: bool = True) -> None:
+        super().__init__(options)
+        self.directory = directory or default_spool_dir()
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.failures = 0
+        self.sent = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._round = threading.Condition()
+        self._started = 0                  # tours d’envoi commencés
+        self._rounds = 0                   # … et terminés
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="sentry-spool", daemon=True)
+            self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    # Capture : écriture disque uniquement                               #
+    # ------------------------------------------------------------------ #
+    def capture_envelope(self, envelope) -> None:
+        """Écrit *envelope* dans le spool et réveille l’envoi."""
+        with self._lock:
+            self._seq += 1
+            name = (f"{time.time_ns():020d}-{os.getpid()}-{self._seq:06d}"
+                    + _SUFFIX)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path + ".tmp", "wb") as out:
+                out.write(envelope.serialize())
+            os.replace(path + ".tmp", path)
+        except OSError:                    # disque indisponible : perdu
+            return
+        self._enforce_limit()
+        self._wake.set()
+
+    def pending(self) -> List[str]:
+        """Enveloppes en attente, de la plus ancienne à la plus récente."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(os.path.join(self.directory, n)
+                      for n in names if n.endswith(_SUFFIX))
+
+    def _enforce_limit(self) -> None:
+        """Abandonne les plus anciennes enveloppes au‑delà de max_bytes."""
+        files = self.pending()
+        sizes = []
+        for path in files:
+            try:
+                sizes.append(os.path.getsize(path))
+            except OSError:
+                sizes.append(0)
+        total = sum(sizes)
+        for path, size in zip(files, sizes):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    # ------------------------------------------------------------------ #
+    # Envoi                                                              #
+    # ------------------------------------------------------------------ #
+    def _send(self, body: bytes) -> Optional[float]:
+        """
+        Envoie *body* ; renvoie None si l’enveloppe est traitée (acceptée
+        ou refusée définitivement), sinon le délai conseillé avant un
+        nouvel essai (0 : backoff par défaut).
+        """
+        auth = self.parsed_dsn.to_auth("epic-events-spool/1")
+        request = urllib.request.Request(
+            auth.get_api_url(EndpointType.ENVELOPE), data=body,
+            method="POST", headers={
+                "Content-Type": "application/x-sentry-envelope",
+                "X-Sentry-Auth": auth.to_header(),
+            })
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                return None
+        except urllib.error.HTTPError as err:
+            if err.code == 429:
+                return float(err.headers.get("Retry-After") or 0)
+            if 400 <= err.code < 500:
+                return None                # refusée : inutile d’insister
+            return 0.0
+        except (urllib.error.URLError, OSError):
+            return 0.0
+
+    def _recover_stale(self) -> None:
+        """Remet en file les réservations d’un processus disparu."""
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(_INFLIGHT):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.path.getmtime(path) > _STALE_INFLIGHT:
+                    os.replace(path, path.split(_SUFFIX)[0] + _SUFFIX)
+            except OSError:
+                pass
+
+    def drain(self) -> Optional[float]:
+        """
+        Envoie les enveloppes en attente jusqu’au premier échec.
+
+        Returns
+        -------
+        float | None
+            None si le spool est vide, sinon le délai avant nouvel essai.
+        """
+        if self.parsed_dsn is None:
+            return None
+        self._recover_stale()
+        for path in self.pending():
+            claimed = f"{path}.{os.getpid()}{_INFLIGHT}"
+            try:
+                os.replace(path, claimed)  # réservation atomique
+                with open(claimed, "rb") as fh:
+                    body = fh.read()
+            except OSError:
+                continue                   # prise par un autre processus
+            retry = self._send(body)
+            if retry is not None:
+                os.replace(claimed, path)
+                self.failures += 1
+                backoff = min(self.max_delay,
+                              self.base_delay * 2 ** (self.failures - 1))
+                return max(retry, backoff * random.uniform(0.5, 1.0))
+            os.unlink(claimed)
+            self.sent += 1
+            self.failures = 0
+        return None
+
+    def _run(self) -> None:
+        delay: Optional[float] = 0.0
+        while not self._stop:
+            if delay is None:
+                self._wake.wait()
+            elif delay:
+                self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop:
+                break
+            with self._round:
+                self._started += 1
+            try:
+                delay = self.drain()
+            except Exception:              # le thread ne doit pas mourir
+                delay = self.max_delay
+            with self._round:
+                self._rounds += 1
+                self._round.notify_all()
+
+    # ------------------------------------------------------------------ #
+    # Interface Transport                                                #
+    # ------------------------------------------------------------------ #
+    def flush(self, timeout: float, callback: Optional[Any] = None) -> None:
+        """
+        Tente un envoi immédiat et l’attend au plus *timeout* secondes.
+
+        Hors ligne, la tentative échoue vite et les enveloppes restent
+        sur disque : rien n’est perdu.
+        """
+        if self._thread is None or not self.pending():
+            return
+        with self._round:
+            # Un tour déjà en cours a pu lister le spool avant l’appel :
+            # seul un tour commencé après compte.
+            target = self._started + 1
+            self._wake.set()
+            self._round.wait_for(lambda: self._rounds >= target, timeout)
+
+    def kill(self) -> None:
+        """Arrête le thread d’envoi (le spool reste sur disque)."""
+        self._stop = True
+        self._wake.set()
+
+    def is_healthy(self) -> bool:
+        return self.failures == 0
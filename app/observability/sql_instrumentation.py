@@ -0,0 +1,225 @@
+# app/observability/sql_instrumentation.py
+# -*- coding: utf-8 -*-
+"""
+Instrumentation SQL : compteur par action, journal des requêtes lentes
+et budget de requêtes.
+
+:func:`install_sql_instrumentation` écoute ``before_cursor_execute`` /
+``after_cursor_execute`` sur un *engine* :
+
+* chaque requête est imputée à l’action courante **et** à ses actions
+  englobantes (cf. :mod:`app.observability.actions`) ;
+* une requête plus lente que ``SQL_SLOW_MS`` (200 ms) est écrite sur le
+  journal ``epic_events.sql.slow`` – dans le fichier ``SQL_SLOW_LOG`` si
+  défini – avec ses paramètres **masqués** ;
+* si ``SQL_QUERY_BUDGET`` (> 0) est défini, la requête qui dépasse ce
+  nombre pour une même action lève :class:`QueryBudgetExceeded` (utile
+  pour détecter un N+1 en test ou en recette).
+
+Les totaux par action sont agrégés dans :data:`SQL_STATS`.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+
+from app.config.env import load_env
+from app.observability.actions import (
+    current_action,
+    register_action_observer,
+)
+
+slow_logger = logging.getLogger("epic_events.sql.slow")
+slow_logger.addHandler(logging.NullHandler())
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Levée quand une action émet plus de requêtes que son budget."""
+
+    def __init__(self, action: str, budget: int, statement: str) -> None:
+        # Tous les arguments à la base : pickle / copy reconstruisent
+        # l’exception à l’identique.
+        super().__init__(action, budget, statement)
+        self.action = action
+        self.budget = budget
+        self.statement = statement
+
+    def __str__(self) -> str:
+        return (f"Budget de {self.budget} requêtes dépassé par "
+                f"« {self.action} » (requête suivante : "
+                f"{redact_statement(self.statement)[:120]})")
+
+
+def redact_statement(statement: str) -> str:
+    """Remplace les littéraux (chaînes, nombres) d’une requête par ``?``."""
+    return _LITERAL.sub("?", " ".join(statement.split()))
+
+
+def _describe_params(parameters: Any) -> str:
+    """Forme des paramètres, sans leurs valeurs."""
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}=?" for k in parameters) + "}"
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return f"<{len(parameters)} lots masqués>"
+        return "(" + ", ".join("?" for _ in parameters) + ")"
+    return "?"
+
+
+class SqlStats:
+    """Totaux SQL par nom d’action (thread‑safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def record_action(self, action) -> None:
+        """Ajoute le coût d’une action terminée."""
+        with self._lock:
+            row = self._totals.setdefault(action.name, {
+                "calls": 0, "queries": 0, "sql_ms": 0.0, "max_queries": 0,
+            })
+            row["calls"] += 1
+            row["queries"] += action.queries
+            row["sql_ms"] += action.sql_time * 1000
+            row["max_queries"] = max(row["max_queries"], action.queries)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copie des totaux, triée par temps SQL décroissant."""
+        with self._lock:
+            items = sorted(self._totals.items(),
+                           key=lambda kv: kv[1]["sql_ms"], reverse=True)
+            return {name: dict(row) for name, row in items}
+
+    def reset(self) -> None:
+        """Remet les totaux à zéro."""
+        with self._lock:
+            self._totals.clear()
+
+
+#: Agrégat global, alimenté à la fin de chaque action.
+SQL_STATS = SqlStats()
+
+
+class _StatsObserver:
+    """Observateur d’action : enregistre le coût SQL à la sortie."""
+
+    def __init__(self, action) -> None:
+        self.action = action
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        SQL_STATS.record_action(self.action)
+        return False
+
+
+class SqlInstrumentation:
+    """
+    Écouteurs de curseur attachés à un *engine*.
+
+    Parameters
+    ----------
+    engine :
+        Engine SQLAlchemy à instrumenter.
+    slow_ms :
+        Seuil du journal des requêtes lentes (``None`` : ``SQL_SLOW_MS``).
+    budget :
+        Requêtes autorisées par action ; 0 désactive le contrôle
+        (``None`` : ``SQL_QUERY_BUDGET``).
+    """
+
+    def __init__(self, engine, slow_ms: Optional[float] = None,
+                 budget: Optional[int] = None) -> None:
+        load_env()
+        self.engine = engine
+        self.slow_ms = float(os.getenv("SQL_SLOW_MS", "200")
+                             if slow_ms is None else slow_ms)
+        self.budget = int(os.getenv("SQL_QUERY_BUDGET", "0")
+                          if budget is None else budget)
+        _configure_slow_log()
+
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._failed)
+        register_action_observer(_StatsObserver)
+
+    def _before(self, conn, cursor, statement, parameters, context,
+                executemany) -> None:
+        action = current_action()
+        if action is not None:
+            for scope in action.lineage():
+                scope.queries += 1
+                if self.budget and scope.queries > self.budget:
+                    raise QueryBudgetExceeded(
+                        scope.name, self.budget, statement)
+        conn.info.setdefault("epic_query_start", []).append(
+            time.perf_counter())
+        if context is not None:
+            context.epic_query_timed = True
+
+    def _after(self, conn, cursor, statement, parameters, context,
+               executemany) -> None:
+        starts = conn.info.get("epic_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        if context is not None:
+            context.epic_query_timed = False
+        action = current_action()
+        if action is not None:
+            for scope in action.lineage():
+                scope.sql_time += elapsed
+        if elapsed * 1000 >= self.slow_ms:
+            slow_logger.warning(
+                "%.1f ms [%s] %s -- params %s",
+                elapsed * 1000,
+                action.name if action is not None else "-",
+                redact_statement(statement),
+                _describe_params(parameters),
+            )
+
+    def _failed(self, exception_context) -> None:
+        """
+        Requête en échec : ``after_cursor_execute`` n’est pas appelé, on
+        retire ici son départ (sinon la pile croît sur la connexion du
+        pool et les mesures suivantes s’apparient au mauvais départ).
+        """
+        context = exception_context.execution_context
+        conn = exception_context.connection
+        if conn is None or not getattr(context, "epic_query_timed", False):
+            return
+        context.epic_query_timed = False
+        starts = conn.info.get("epic_query_start")
+        if starts:
+            starts.pop()
+
+
+_slow_log_path: Optional[str] = None
+
+
+def _configure_slow_log() -> None:
+    """Ajoute (une seule fois) le fichier ``SQL_SLOW_LOG`` au journal."""
+    global _slow_log_path
+    path = os.getenv("SQL_SLOW_LOG")
+    if not path or path == _slow_log_path:
+        return
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_logger.addHandler(handler)
+    slow_logger.setLevel(logging.WARNING)
+    _slow_log_path = path
+
+
+def install_sql_instrumentation(engine, **options) -> SqlInstrumentation:
+    """Instrumente *engine* ; cf. :class:`SqlInstrumentation`."""
+    return SqlInstrumentation(engine, **options)
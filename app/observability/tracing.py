@@ -0,0 +1,159 @@
+# app/observability/tracing.py
+# -*- coding: utf-8 -*-
+"""
+Traces de performance Sentry (APM) construites sur les actions.
+
+Un observateur d’action (cf. :mod:`app.observability.actions`) traduit :
+
+* chaque action **racine** – action CLI, ou appel direct d’un contrôleur
+  par une commande scriptable – en *transaction* Sentry (op
+  ``cli.action`` / ``controller.action``, tag ``role``) ;
+* chaque action imbriquée (méthode de DataReader / DataWriter…) en
+  *span* enfant (op ``controller``), **seulement** si la transaction
+  englobante est échantillonnée : une action non tracée ne coûte
+  qu’une lecture de ``ContextVar``.
+
+Les requêtes SQL deviennent des spans ``db`` via l’intégration
+SQLAlchemy du SDK, activée par :func:`init_sentry`.
+
+Échantillonnage (:class:`TraceSampler`)
+---------------------------------------
+``SENTRY_TRACES_WRITE``   écritures, connexion (``create``, ``update``,
+                          ``delete``, ``assign``, ``login``…) ;
+                          ``SENTRY_TRACES`` par défaut ;
+``SENTRY_TRACES_READ``    lectures (chemins chauds) ; 0.01 par défaut ;
+``SENTRY_TRACES_ERRORS``  action ayant échoué dans les
+                          ``SENTRY_TRACES_ERROR_WINDOW`` dernières
+                          secondes (300) ; 1.0 par défaut.
+
+Une transaction dont le parent (trace distribuée) a déjà décidé hérite
+de sa décision.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.observability.actions import register_action_observer
+
+#: Mots qui, dans le nom de méthode, désignent une écriture.
+WRITE_WORDS = ("create", "update", "delete", "assign", "login", "logout",
+               "batch", "sign")
+
+
+def is_write(action_name: str) -> bool:
+    """Vrai si *action_name* (``Classe.méthode``) désigne une écriture."""
+    method = action_name.rsplit(".", 1)[-1].lower()
+    return any(word in method for word in WRITE_WORDS)
+
+
+class TraceSampler:
+    """
+    ``traces_sampler`` Sentry : taux selon la nature de l’action.
+
+    Parameters
+    ----------
+    read_rate, write_rate, error_rate :
+        Taux (0–1) des lectures, des écritures et des actions en échec
+        récent.
+    error_window :
+        Durée (s) pendant laquelle une action en échec est suréchantillonnée.
+    """
+
+    def __init__(self, read_rate: float, write_rate: float,
+                 error_rate: float = 1.0, error_window: float = 300.0) -> None:
+        self.read_rate = read_rate
+        self.write_rate = write_rate
+        self.error_rate = error_rate
+        self.error_window = error_window
+        self._lock = threading.Lock()
+        self._failures: Dict[str, float] = {}
+
+    def record_error(self, action_name: str) -> None:
+        """Mémorise l’échec de *action_name* (suréchantillonnage)."""
+        with self._lock:
+            self._failures[action_name] = time.monotonic()
+
+    def _failed_recently(self, action_name: str) -> bool:
+        failed_at = self._failures.get(action_name)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < self.error_window:
+            return True
+        with self._lock:
+            self._failures.pop(action_name, None)
+        return False
+
+    def rate_for(self, action_name: str) -> float:
+        """Taux applicable à *action_name*."""
+        if self._failed_recently(action_name):
+            return max(self.error_rate, self.write_rate, self.read_rate)
+        return self.write_rate if is_write(action_name) else self.read_rate
+
+    def __call__(self, sampling_context: Dict[str, Any]) -> float:
+        parent = sampling_context.get("parent_sampled")
+        if parent is not None:
+            return 1.0 if parent else 0.0
+        context = sampling_context.get("transaction_context") or {}
+        return self.rate_for(context.get("name") or "")
+
+
+def sampler_from_env(default_rate: float) -> TraceSampler:
+    """:class:`TraceSampler` selon ``SENTRY_TRACES_*``."""
+    return TraceSampler(
+        read_rate=float(os.getenv("SENTRY_TRACES_READ", "0.01")),
+        write_rate=float(os.getenv("SENTRY_TRACES_WRITE", str(default_rate))),
+        error_rate=float(os.getenv("SENTRY_TRACES_ERRORS", "1.0")),
+        error_window=float(os.getenv("SENTRY_TRACES_ERROR_WINDOW", "300")),
+    )
+
+
+# ---------------------------------------------------------------------- #
+# Observateur d’action                                                   #
+# ---------------------------------------------------------------------- #
+_sampler: Optional[TraceSampler] = None
+
+
+class _TransactionScope:
+    """Transaction Sentry d’une action racine."""
+
+    def __init__(self, sentry_sdk, action) -> None:
+        self.action = action
+        self.transaction = sentry_sdk.start_transaction(
+            op=f"{action.kind}.action", name=action.name,
+            source="task")
+        if action.role:
+            self.transaction.set_tag("role", action.role)
+
+    def __enter__(self):
+        self.transaction.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc is not None and _sampler is not None:
+            _sampler.record_error(self.action.name)
+        self.transaction.set_data("db.queries", self.action.queries)
+        return self.transaction.__exit__(exc_type, exc, tb)
+
+
+def trace_action(action):
+    """Observateur : transaction (racine) ou span (action imbriquée)."""
+    sentry_sdk = sys.modules.get("sentry_sdk")
+    if sentry_sdk is None:
+        return None
+    if action.parent is None:
+        return _TransactionScope(sentry_sdk, action)
+    span = sentry_sdk.get_current_span()
+    if span is None or not span.sampled:
+        return None
+    return span.start_child(op=action.kind, name=action.name)
+
+
+def install_tracing(sampler: Optional[TraceSampler] = None) -> None:
+    """Enregistre :func:`trace_action` ; *sampler* reçoit les échecs."""
+    global _sampler
+    _sampler = sampler
+    register_action_observer(trace_action)
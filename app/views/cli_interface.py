@@ -13,18 +13,32 @@ Le menu affiché dépend du rôle du collaborateur connecté :
 
 Toutes les interactions clavier sont protégées ; aucune trace « debug »
 n’est affichée pour garder la sortie propre en production.
+
+Les vues enfants (et donc Argon2, JWT, SQLAlchemy et les modèles) ne sont
+importées qu’au premier usage : le menu principal s’affiche sans attendre
+leur chargement.  Chaque action de ces vues est ouverte comme « action
+CLI » : les requêtes SQL qu’elle émet lui sont imputées, et une seule
+session (cf. :func:`request_scope`) la sert de bout en bout.
 """
 from __future__ import annotations
 
+from importlib import import_module
+
+from app.config.session_scope import request_scope
+from app.observability.actions import instrument
 from app.views.generic_view import GenericView
-from app.views.login_view import LoginView
-from app.views.data_reader_view import DataReaderView
-from app.views.data_writer_view import DataWriterView
 
 
 class CLIInterface(GenericView):
     """Point d’entrée CLI ; orchestre les vues Login, Lecture et Écriture."""
 
+    #: Vues instanciées à la demande : attribut → (module, classe).
+    _LAZY_VIEWS = {
+        "login_v": ("app.views.login_view", "LoginView"),
+        "reader_v": ("app.views.data_reader_view", "DataReaderView"),
+        "writer_v": ("app.views.data_writer_view", "DataWriterView"),
+    }
+
     # ------------------------------------------------------------------ #
     # Construction                                                       #
     # ------------------------------------------------------------------ #
@@ -37,11 +51,26 @@ class CLIInterface(GenericView):
         """
         super().__init__()
         self.db = db_connection
-        self.login_v = LoginView(db_connection)
-        self.reader_v = DataReaderView(db_connection)
-        self.writer_v = DataWriterView(db_connection)
         self.current_user: dict | None = None  # stocke le user connecté
 
+    def __getattr__(self, name: str):
+        """
+        Instancie *login_v*, *reader_v* ou *writer_v* au premier accès.
+
+        La vue créée est ensuite mémorisée sur l’instance : les accès
+        suivants ne repassent plus par cette méthode.
+        """
+        try:
+            module_name, class_name = self._LAZY_VIEWS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        view_cls = getattr(import_module(module_name), class_name)
+        view = instrument(view_cls(self.db), class_name, kind="cli",
+                          skip=dir(GenericView),
+                          around=lambda: request_scope(self.db))
+        setattr(self, name, view)
+        return view
+
     # ------------------------------------------------------------------ #
     # Menu principal                                                     #
     # ------------------------------------------------------------------ #
@@ -142,7 +171,10 @@ class CLIInterface(GenericView):
                     ("3", "Événements", self._menu_event_commercial),
                 ]
             else:  # support
-                options.append(("1", "Événements", self._menu_event_support))
+                options += [
+                    ("1", "Événements", self._menu_event_support),
+                    ("2", "Mon planning", self._support_calendar),
+                ]
 
             for key, label, _ in options:
                 print(self.BLUE + f"[{key}] {label}" + self.END)
@@ -250,6 +282,7 @@ class CLIInterface(GenericView):
         self.print_header("-- Événements (gestion) --")
         print(self.BLUE + "[1] Afficher sans support" + self.END)
         print(self.BLUE + "[2] Assigner / modifier support" + self.END)
+        print(self.BLUE + "[3] Planning d’un support" + self.END)
         print(self.BLUE + "[0] Retour" + self.END)
         choice = input(self.CYAN + "Choix : " + self.END).strip()
         match choice:
@@ -257,6 +290,8 @@ class CLIInterface(GenericView):
                 self.writer_v.list_events_no_support(self.current_user)
             case "2":
                 self.writer_v.assign_support_cli(self.current_user)
+            case "3":
+                self._support_calendar()
 
     def _menu_event_commercial(self) -> None:
         """Création d’événements pour les contrats signés du commercial."""
@@ -269,3 +304,9 @@ class CLIInterface(GenericView):
     def _menu_event_support(self) -> None:
         """Sous‑menu délégué à DataWriterView pour le rôle *support*."""
         self.writer_v.menu_event_support(self.current_user)
+
+    def _support_calendar(self) -> None:
+        """Planning hebdomadaire d’un support (le sien pour un support)."""
+        query = self.writer_v.ask_support_week(self.current_user)
+        if query:
+            self.reader_v.display_support_calendar(self.current_user, *query)
@@ -4,9 +4,9 @@
 Vue **lecture seule** pour l’affichage des entités métier.
 
 Le rôle de `DataReaderView` est purement *UI* :  
-il interroge le contrôleur `DataReader`, formate chaque entité en
-chaine lisible puis l’affiche dans la console à l’aide des méthodes
-de coloration héritées de `GenericView`.
+il interroge le contrôleur `DataReader` puis affiche les entités sous
+forme de tableau via `GenericView.print_table` (écriture par blocs,
+*pager* pour les longues listes).
 
 Fonctionnalités :
 
@@ -15,13 +15,19 @@ Fonctionnalités :
 * **Événements**                  : `display_events_only`
 * **Contrats non signés**         : `display_unsigned_contracts`
 * **Contrats restant à payer**    : `display_unpaid_contracts`
+* **Planning d’un support**       : `display_support_calendar`
 """
 from __future__ import annotations
 
-from typing import Dict, List
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterable, List
 
+from app.config.session_scope import use_session
 from app.controllers.data_reader import DataReader
+from app.models.client import Client
 from app.models.contract import Contract
+from app.models.event import Event
 from app.views.generic_view import GenericView
 
 
@@ -47,51 +53,50 @@ class DataReaderView(GenericView):
     # ------------------------------------------------------------------ #
     # Méthodes utilitaires                                               #
     # ------------------------------------------------------------------ #
-    def _fmt(self, entity) -> str:
+    def _print_entities(self, model, entities: Iterable) -> int:
         """
-        Transforme une entité SQLAlchemy en dictionnaire « propre ».
+        Affiche *entities* (instances de *model*) sous forme de tableau.
 
         Le champ *password_hash* est volontairement masqué pour éviter
         l’affichage de données sensibles.
 
         Parameters
         ----------
-        entity :
-            Instance SQLAlchemy (Client, Contract, Event, …).
+        model :
+            Classe SQLAlchemy (Client, Contract, Event, …).
+        entities :
+            Instances à afficher.
 
         Returns
         -------
-        str
-            Représentation textuelle prête à être affichée.
+        int
+            Nombre de lignes affichées.
         """
-        return str(
-            {
-                col.name: getattr(entity, col.name)
-                for col in entity.__table__.columns
-                if col.name != "password_hash"
-            }
-        )
+        columns = [col.name for col in model.__table__.columns
+                   if col.name != "password_hash"]
+        values = attrgetter(*columns)
+        return self.print_table(columns, map(values, entities))
 
     # ------------------------------------------------------------------ #
     # LISTES GÉNÉRIQUES                                                  #
     # ------------------------------------------------------------------ #
     def display_clients_only(self, current_user: Dict):
         """Affiche tous les clients accessibles pour *current_user*."""
-        with self._db_conn.create_session() as sess:
-            for client in self._reader.get_all_clients(sess, current_user):
-                print(self._fmt(client))
+        with use_session(self._db_conn) as sess:
+            self._print_entities(
+                Client, self._reader.get_all_clients(sess, current_user))
 
     def display_contracts_only(self, current_user: Dict):
         """Affiche tous les contrats accessibles pour *current_user*."""
-        with self._db_conn.create_session() as sess:
-            for contract in self._reader.get_all_contracts(sess, current_user):
-                print(self._fmt(contract))
+        with use_session(self._db_conn) as sess:
+            self._print_entities(
+                Contract, self._reader.get_all_contracts(sess, current_user))
 
     def display_events_only(self, current_user: Dict):
         """Affiche tous les événements accessibles pour *current_user*."""
-        with self._db_conn.create_session() as sess:
-            for event in self._reader.get_all_events(sess, current_user):
-                print(self._fmt(event))
+        with use_session(self._db_conn) as sess:
+            self._print_entities(
+                Event, self._reader.get_all_events(sess, current_user))
 
     # ------------------------------------------------------------------ #
     # LISTES SPÉCIFIQUES – rôle commercial                               #
@@ -112,12 +117,11 @@ class DataReaderView(GenericView):
             return
 
         self.print_green(f"--- {title} ---")
-        for contract in contracts:
-            print(self._fmt(contract))
+        self._print_entities(Contract, contracts)
 
     def display_unsigned_contracts(self, current_user: Dict):
         """Affiche les contrats dont `is_signed` est *False*."""
-        with self._db_conn.create_session() as sess:
+        with use_session(self._db_conn) as sess:
             unsigned = [
                 ctr
                 for ctr in self._reader.get_all_contracts(sess, current_user)
@@ -127,10 +131,63 @@ class DataReaderView(GenericView):
 
     def display_unpaid_contracts(self, current_user: Dict):
         """Affiche les contrats avec un `remaining_amount` > 0."""
-        with self._db_conn.create_session() as sess:
+        with use_session(self._db_conn) as sess:
             unpaid = [
                 ctr
                 for ctr in self._reader.get_all_contracts(sess, current_user)
                 if ctr.remaining_amount > 0
             ]
         self._print_contract_subset("Contrats restant à payer", unpaid)
+
+    # ------------------------------------------------------------------ #
+    # PLANNING – un support sur une période                              #
+    # ------------------------------------------------------------------ #
+    def _overlaps(self, events: List[Event]) -> Dict[int, List[int]]:
+        """
+        Chevauchements entre *events* (triés par début) : id → ids en
+        conflit.  Signale les doubles affectations antérieures au contrôle
+        de :class:`~app.controllers.data_writer.DataWriter`.
+        """
+        clashes: Dict[int, List[int]] = {}
+        active: List[Event] = []
+        for ev in events:
+            active = [prev for prev in active
+                      if (prev.date_end or prev.date_start) >= ev.date_start]
+            for prev in active:
+                clashes.setdefault(prev.id, []).append(ev.id)
+                clashes.setdefault(ev.id, []).append(prev.id)
+            active.append(ev)
+        return clashes
+
+    def display_support_calendar(self, current_user: Dict, support_id: int,
+                                 start: datetime, end: datetime) -> int:
+        """
+        Affiche, dans l’ordre chronologique, les événements du support
+        *support_id* qui chevauchent ``[start, end]``.
+
+        Returns
+        -------
+        int
+            Nombre d’événements affichés.
+        """
+        with use_session(self._db_conn) as sess:
+            events = self._reader.get_calendar(
+                sess, current_user, start, end, support_id)
+        period = f"{start:%d/%m/%Y} → {end:%d/%m/%Y}"
+        if not events:
+            self.print_yellow(f"Aucun événement planifié ({period}).")
+            return 0
+
+        self.print_green(f"--- Planning du {period} ---")
+        clashes = self._overlaps(events)
+        rows = ((ev.id, f"{ev.date_start:%a %d/%m %H:%M}",
+                 f"{ev.date_end:%a %d/%m %H:%M}" if ev.date_end else "",
+                 ev.location, ev.attendees, ev.contract_id,
+                 ", ".join(f"#{i}" for i in clashes.get(ev.id, ())))
+                for ev in events)
+        count = self.print_table(
+            ["id", "début", "fin", "lieu", "participants", "contrat",
+             "conflits"], rows)
+        if clashes:
+            self.print_red(f"⚠ {len(clashes)} événement(s) en conflit.")
+        return count
@@ -18,21 +18,41 @@ d’utiliser la couche « métier » d’écriture (`DataWriter`) :
   - Affectation de supports
 * **Support**
   - Consultation / mise à jour des événements qui leur sont assignés
+* **Planning** : choix du support et de la semaine
+  (:meth:`DataWriterView.ask_support_week`), affiché par
+  :class:`~app.views.data_reader_view.DataReaderView`
 
 Les contrôles de saisie (e‑mail, téléphone, date…) sont effectués ici afin
 d’éviter d’appeler la couche métier avec des valeurs déjà invalides.
 
 Aucune fonction n’est statique ; tout repose sur l’instance pour conserver
 l’état éventuel (connexion BD, utilisateur courant, etc.).
+
+Les sessions sont obtenues via :func:`use_session` : sous la CLI, toutes
+les étapes d’une action (vérification, recherche, écriture) partagent la
+session ouverte par :class:`CLIInterface` pour cette action ; sa
+transaction est close avant chaque saisie (:func:`before_prompt`).
+
+Les saisies d’employee number et d’identifiants (client, contrat) sont
+assistées par un :class:`LookupIndex` chargé à la première utilisation :
+complétion par *Tab* (module :mod:`readline`, terminal uniquement) et
+suggestion « Vouliez‑vous dire … ? » lorsqu’une valeur est introuvable.
+
+Rôles et supports / commerciaux saisis par numéro d’employé sont résolus
+dans le cache de référence (:func:`reference_cache`), sans requête.
 """
 from __future__ import annotations
 
 import re
-from datetime import datetime, date, time
-from typing import Any, Dict, Optional
+import sys
+from datetime import datetime, date, time, timedelta
+from typing import Any, Dict, Optional, Tuple
 
 from app.views.generic_view import GenericView
+from app.config.session_scope import before_prompt, use_session
 from app.controllers.data_writer import DataWriter
+from app.controllers.lookup_index import LookupIndex
+from app.controllers.reference_cache import reference_cache
 from app.authentification.auth_controller import AuthController
 from app.models.user import User
 from app.models.client import Client
@@ -70,6 +90,7 @@ class DataWriterView(GenericView):
         self.db = db_connection
         self.writer = DataWriter(db_connection)
         self.auth = AuthController()
+        self.lookup = LookupIndex()
 
     # ------------------------------------------------------------------ #
     # Expressions régulières de validation                               #
@@ -115,10 +136,12 @@ class DataWriterView(GenericView):
             self.print_red("Nombre positif requis.")
 
     def _ask_positive_int(self, prompt: str,
-                          allow_empty: bool = False) -> Optional[int]:
+                          allow_empty: bool = False,
+                          complete: Optional[Tuple[str, Optional[str]]]
+                          = None) -> Optional[int]:
         """Demande un entier positif."""
         while True:
-            val = self._ask(prompt, int, allow_empty)
+            val = self._ask(prompt, int, allow_empty, complete)
             if val is None and allow_empty:
                 return None
             if val is not None and val >= 0:
@@ -143,7 +166,9 @@ class DataWriterView(GenericView):
     #  Saisie générique : centralise la gestion d’erreurs console        #
     # ------------------------------------------------------------------ #
     def _ask(self, prompt: str, cast=str,
-             allow_empty: bool = False) -> Optional[Any]:
+             allow_empty: bool = False,
+             complete: Optional[Tuple[str, Optional[str]]] = None
+             ) -> Optional[Any]:
         """
         Demande une saisie utilisateur et tente de la caster.
 
@@ -155,6 +180,9 @@ class DataWriterView(GenericView):
             Fonction de conversion (str, int, float, …).
         allow_empty : bool
             Si True, l’utilisateur peut laisser la valeur vide.
+        complete : tuple | None
+            ``(famille, rôle)`` du :class:`LookupIndex` proposé en
+            complétion (*Tab*) pendant la saisie.
 
         Returns
         -------
@@ -163,7 +191,7 @@ class DataWriterView(GenericView):
         """
         while True:
             try:
-                raw = input(self.CYAN + prompt + self.END).strip()
+                raw = self._input(prompt, complete).strip()
             except (KeyboardInterrupt, EOFError):
                 print()
                 self.print_yellow("Saisie interrompue – au revoir.")
@@ -183,6 +211,63 @@ class DataWriterView(GenericView):
             except (ValueError, TypeError):
                 self.print_red("Format invalide.")
 
+    # ------------------------------------------------------------------ #
+    #  Index de recherche : complétion et suggestions                    #
+    # ------------------------------------------------------------------ #
+    def _index(self) -> LookupIndex:
+        """Index des collaborateurs / clients / contrats (chargé une fois)."""
+        if not self.lookup.loaded:
+            with use_session(self.db) as s:
+                self.lookup.load(s)
+        return self.lookup
+
+    def _input(self, prompt: str,
+               complete: Optional[Tuple[str, Optional[str]]]) -> str:
+        """``input`` avec complétion *Tab* sur un terminal interactif."""
+        before_prompt()
+        readline = None
+        if complete is not None and sys.stdin.isatty():
+            try:
+                import readline
+            except ImportError:
+                readline = None
+        if readline is None:
+            return input(self.CYAN + prompt + self.END)
+
+        kind, role = complete
+        matches: list = []
+
+        def completer(text: str, state: int) -> Optional[str]:
+            if state == 0:
+                matches[:] = [str(e.key) for e in
+                              self._index().complete(kind, text, 20, role)]
+            return matches[state] if state < len(matches) else None
+
+        previous = readline.get_completer()
+        readline.set_completer(completer)
+        readline.parse_and_bind("tab: complete")
+        try:
+            return input(self.CYAN + prompt + self.END)
+        finally:
+            readline.set_completer(previous)
+
+    def _did_you_mean(self, kind: str, text: Any,
+                      role: Optional[str] = None) -> str:
+        """Suffixe « Vouliez‑vous dire … ? » (vide sans suggestion)."""
+        try:
+            matches = self._index().find(kind, str(text), 3, role)
+        except Exception:                  # suggestion : au mieux
+            return ""
+        if not matches:
+            return ""
+        return (" Vouliez‑vous dire : "
+                + ", ".join(m.label for m in matches) + " ?")
+
+    def _role_menu(self) -> str:
+        """Rôles disponibles, ex. ``1=commercial, 2=support, 3=gestion``."""
+        with use_session(self.db) as s:
+            return reference_cache(s).role_menu(s)
+
     # ------------------------------------------------------------------ #
     # Mise en forme générique d’un objet SQLAlchemy                      #
     # ------------------------------------------------------------------ #
@@ -203,9 +288,9 @@ class DataWriterView(GenericView):
         lname = self._ask("Nom : ")
         email = self._ask_email("Email : ")
         pwd = self._ask("Mot de passe : ")
-        role = self._ask_positive_int("Rôle (1=C, 2=S, 3=G) : ")
+        role = self._ask_positive_int(f"Rôle ({self._role_menu()}) : ")
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 usr = self.writer.create_user(
                     s, cur, None, fname, lname, email,
@@ -219,16 +304,18 @@ class DataWriterView(GenericView):
 
     def update_user_cli(self, cur: Dict[str, Any]) -> None:
         """Mise à jour d’un collaborateur à partir de son employee number."""
-        emp_num = self._ask("Employee Number : ")
-        with self.db.create_session() as s_chk:
+        emp_num = self._ask("Employee Number : ", complete=("user", None))
+        with use_session(self.db) as s_chk:
             usr = s_chk.query(User).filter_by(employee_number=emp_num).first()
         if not usr:
-            self.print_red("Collaborateur introuvable.")
+            self.print_red("Collaborateur introuvable."
+                           + self._did_you_mean("user", emp_num))
             return
+        self.lookup.touch("user", usr.employee_number)
 
         self.print_yellow("→ Laisser vide pour conserver la valeur.")
         role_id = self._ask_positive_int(
-            f"Rôle actuel {usr.role_id} (1=C,2=S,3=G) : ", True)
+            f"Rôle actuel {usr.role_id} ({self._role_menu()}) : ", True)
         fname = self._ask(f"Prénom ({usr.first_name}) : ", allow_empty=True)
         lname = self._ask(f"Nom ({usr.last_name}) : ", allow_empty=True)
         email = self._ask_email(f"Email ({usr.email}) : ", True)
@@ -250,7 +337,7 @@ class DataWriterView(GenericView):
             self.print_yellow("Aucune modification.")
             return
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 mod = self.writer.update_user_by_employee_number(
                     s, cur, emp_num, **updates)
@@ -262,8 +349,9 @@ class DataWriterView(GenericView):
 
     def delete_user_cli(self, cur: Dict[str, Any]) -> None:
         """Suppression d’un collaborateur par employee number."""
-        emp = self._ask("Employee Number à supprimer : ")
-        with self.db.create_session() as s:
+        emp = self._ask("Employee Number à supprimer : ",
+                        complete=("user", None))
+        with use_session(self.db) as s:
             try:
                 self.writer.delete_user(s, cur, emp)
                 s.commit()
@@ -282,7 +370,7 @@ class DataWriterView(GenericView):
         tel = self._ask_phone("Téléphone   : ", True)
         comp = self._ask("Société     : ", allow_empty=True)
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 cli = self.writer.create_client(
                     s, cur, fn, mail, tel, comp, None
@@ -295,12 +383,15 @@ class DataWriterView(GenericView):
 
     def update_client_cli(self, cur: Dict[str, Any]) -> None:
         """Mise à jour d’un client existant."""
-        cid = self._ask_positive_int("ID client : ")
-        with self.db.create_session() as chk:
+        cid = self._ask_positive_int("ID client : ",
+                                     complete=("client", None))
+        with use_session(self.db) as chk:
             cli = chk.get(Client, cid)
         if not cli:
-            self.print_red("Client introuvable.")
+            self.print_red("Client introuvable."
+                           + self._did_you_mean("client", cid))
             return
+        self.lookup.touch("client", cid)
         if cur["role"] == "commercial" and cli.commercial_id != cur["id"]:
             self.print_red("Vous n’êtes pas responsable de ce client.")
             return
@@ -319,7 +410,7 @@ class DataWriterView(GenericView):
             self.print_yellow("Aucune modification.")
             return
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 mod = self.writer.update_client(s, cur, cid, **updates)
                 s.commit()
@@ -337,12 +428,13 @@ class DataWriterView(GenericView):
             self.print_red("Les commerciaux ne peuvent pas créer de contrat.")
             return
 
-        cid = self._ask_positive_int("ID client : ")
+        cid = self._ask_positive_int("ID client : ",
+                                     complete=("client", None))
         tot = self._ask_positive_float("Montant total : ")
         rem = self._ask_positive_float("Montant restant : ")
         signe = self._ask("Signé ? (o/n) : ").lower() == "o"
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 ctr = self.writer.create_contract(
                     s, cur, cid, tot, rem, signe)
@@ -354,20 +446,23 @@ class DataWriterView(GenericView):
 
     def update_contract_cli(self, cur: Dict[str, Any]) -> None:
         """Mise à jour d’un contrat."""
-        ctr_id = self._ask_positive_int("ID contrat : ")
+        ctr_id = self._ask_positive_int("ID contrat : ",
+                                        complete=("contract", None))
 
         if cur["role"] == "commercial":
-            with self.db.create_session() as chk:
+            with use_session(self.db) as chk:
                 ctr = chk.get(Contract, ctr_id)
             if not ctr:
-                self.print_red("Contrat introuvable.")
+                self.print_red("Contrat introuvable."
+                               + self._did_you_mean("contract", ctr_id))
                 return
             if ctr.commercial_id != cur["id"]:
                 self.print_red("Vous n’êtes pas responsable de ce contrat.")
                 return
 
         self.print_yellow("→ Laisser vide pour conserver la valeur.")
-        n_cli = self._ask_positive_int("Nouveau ID client : ", True)
+        n_cli = self._ask_positive_int("Nouveau ID client : ", True,
+                                       ("client", None))
         n_tot = self._ask_positive_float("Montant total       : ", True)
         n_rem = self._ask_positive_float("Montant restant     : ", True)
 
@@ -394,21 +489,25 @@ class DataWriterView(GenericView):
 
         if cur["role"] != "commercial":
             com_emp = self._ask(
-                "Employee Number commercial : ", cast=str, allow_empty=True)
+                "Employee Number commercial : ", cast=str, allow_empty=True,
+                complete=("user", "commercial"))
             if com_emp:
-                with self.db.create_session() as tmp:
-                    com = tmp.query(User).filter_by(
-                        employee_number=com_emp, role_id=1).first()
+                with use_session(self.db) as tmp:
+                    com = reference_cache(tmp).collaborator(
+                        tmp, com_emp, "commercial")
                 if not com:
-                    self.print_red("Commercial introuvable.")
+                    self.print_red(
+                        "Commercial introuvable."
+                        + self._did_you_mean("user", com_emp, "commercial"))
                     return
+                self.lookup.touch("user", com.employee_number)
                 updates["commercial_id"] = com.id
 
         if not updates:
             self.print_yellow("Aucune modification.")
             return
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 mod = self.writer.update_contract(
                     s, cur, ctr_id, **updates)
@@ -427,11 +526,13 @@ class DataWriterView(GenericView):
             self.print_red("Seul le commercial peut créer un événement.")
             return
 
-        ctr_id = self._ask_positive_int("ID contrat : ")
-        with self.db.create_session() as chk:
+        ctr_id = self._ask_positive_int("ID contrat : ",
+                                        complete=("contract", None))
+        with use_session(self.db) as chk:
             ctr = chk.get(Contract, ctr_id)
         if not ctr:
-            self.print_red("Contrat introuvable.")
+            self.print_red("Contrat introuvable."
+                           + self._did_you_mean("contract", ctr_id))
             return
         if ctr.commercial_id != cur["id"]:
             self.print_red("Vous ne gérez pas ce contrat.")
@@ -440,12 +541,16 @@ class DataWriterView(GenericView):
             self.print_red("Le contrat n'est pas signé.")
             return
 
-        sup_emp = self._ask("Employee Number support : ").strip().upper()
-        with self.db.create_session() as s_sup:
-            sup = s_sup.query(User).filter_by(employee_number=sup_emp).first()
-        if not sup or sup.role_id != 2:
-            self.print_red("Support introuvable ou rôle incorrect.")
+        sup_emp = self._ask("Employee Number support : ",
+                            complete=("user", "support")).strip().upper()
+        with use_session(self.db) as s_sup:
+            sup = reference_cache(s_sup).collaborator(
+                s_sup, sup_emp, "support")
+        if not sup:
+            self.print_red("Support introuvable ou rôle incorrect."
+                           + self._did_you_mean("user", sup_emp, "support"))
             return
+        self.lookup.touch("user", sup.employee_number)
         sup_id = sup.id
 
         start_dt = self._ask_date(
@@ -463,7 +568,7 @@ class DataWriterView(GenericView):
         att = self._ask_positive_int("Participants (vide)   : ", True)
         notes = self._ask("Notes (vide)          : ", allow_empty=True)
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 ev = self.writer.create_event(
                     s, cur, ctr_id, sup_id, start_dt, end_dt,
@@ -476,7 +581,7 @@ class DataWriterView(GenericView):
 
     def list_events_no_support(self, cur: Dict[str, Any]) -> None:
         """Affiche les événements n’ayant pas encore de support assigné."""
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             evs = s.query(Event).filter_by(support_id=None).all()
             if not evs:
                 self.print_yellow("Aucun événement sans support.")
@@ -501,19 +606,23 @@ class DataWriterView(GenericView):
         if event_id is None:
             event_id = self._ask_positive_int("ID événement : ")
         if support_emp is None:
-            support_emp = self._ask("Employee Number du support : ")
+            support_emp = self._ask("Employee Number du support : ",
+                                    complete=("user", "support"))
 
         support_emp = support_emp.strip().upper()
 
-        with self.db.create_session() as s:
-            sup = s.query(User).filter_by(employee_number=support_emp).first()
+        with use_session(self.db) as s:
+            sup = reference_cache(s).collaborator(s, support_emp)
             if not sup:
-                self.print_red("Support introuvable.")
+                self.print_red(
+                    "Support introuvable."
+                    + self._did_you_mean("user", support_emp, "support"))
                 return
-            if sup.role_id != 2:
+            if sup.role != "support":
                 self.print_red("L’utilisateur trouvé n’a pas le rôle support.")
                 return
 
+            self.lookup.touch("user", sup.employee_number)
             try:
                 ev = self.writer.update_event(
                     s, cur, event_id, support_id=sup.id)
@@ -523,6 +632,35 @@ class DataWriterView(GenericView):
                 s.rollback()
                 self.print_red(f"❌ {exc}")
 
+    def ask_support_week(self, cur: Dict[str, Any]
+                         ) -> Optional[Tuple[int, datetime, datetime]]:
+        """
+        Demande le support (le support connecté pour lui‑même) puis une
+        date ; renvoie ``(support_id, lundi 00:00, dimanche 23:59:59)`` de
+        la semaine correspondante, ou None si le support est introuvable.
+        """
+        if cur["role"] == "support":
+            support_id = cur["id"]
+        else:
+            sup_emp = self._ask("Employee Number du support : ",
+                                complete=("user", "support")).strip().upper()
+            with use_session(self.db) as s:
+                sup = reference_cache(s).collaborator(s, sup_emp, "support")
+            if not sup:
+                self.print_red(
+                    "Support introuvable ou rôle incorrect."
+                    + self._did_you_mean("user", sup_emp, "support"))
+                return None
+            self.lookup.touch("user", sup.employee_number)
+            support_id = sup.id
+
+        day = self._ask_date(
+            "Semaine du YYYY-MM-DD (vide = cette semaine) : ", True)
+        day = day.date() if day else date.today()
+        monday = day - timedelta(days=day.weekday())
+        return (support_id, datetime.combine(monday, time.min),
+                datetime.combine(monday + timedelta(days=6), time.max))
+
     # ================================================================== #
     #  =========  ÉVÉNEMENTS – MENU DÉDIÉ AU SUPPORT  =========          #
     # ================================================================== #
@@ -533,6 +671,7 @@ class DataWriterView(GenericView):
             print(self.BLUE + "[1] Mes événements" + self.END)
             print(self.BLUE + "[2] Mettre à jour un événement" + self.END)
             print(self.BLUE + "[0] Retour" + self.END)
+            before_prompt()
             ch = input(self.CYAN + "Choix : " + self.END).strip()
 
             if ch == "1":
@@ -549,7 +688,7 @@ class DataWriterView(GenericView):
     # ------------------------------------------------------------------ #
     def _display_my_events(self, cur: Dict[str, Any]) -> None:
         """Affiche la liste des événements assignés au support courant."""
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             evts = s.query(Event).filter_by(support_id=cur["id"]).all()
             if not evts:
                 self.print_yellow("Aucun événement ne vous est attribué.")
@@ -562,7 +701,7 @@ class DataWriterView(GenericView):
         """Mise à jour d’un événement par son support assigné."""
         ev_id = self._ask_positive_int("ID événement à modifier : ")
 
-        with self.db.create_session() as chk:
+        with use_session(self.db) as chk:
             ev = chk.get(Event, ev_id)
         if not ev:
             self.print_red("Événement introuvable.")
@@ -599,7 +738,7 @@ class DataWriterView(GenericView):
             self.print_yellow("Aucune modification.")
             return
 
-        with self.db.create_session() as s:
+        with use_session(self.db) as s:
             try:
                 mod = self.writer.update_event(s, cur, ev_id, **updates)
                 s.commit()
@@ -5,7 +5,21 @@ Vue générique — fournit de petites méthodes d’affichage coloré.
 
 Tous les écrans CLI héritent de cette classe afin d’afficher des
 intitulés cohérents dans le terminal.
+
+:meth:`GenericView.print_table` affiche de longues listes sous forme de
+tableau : largeurs calculées sur un échantillon borné, écriture par
+blocs, et passage par un *pager* (``$PAGER``, ``less`` par défaut)
+lorsque la sortie dépasse la hauteur du terminal.
 """
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from itertools import chain, islice
+from typing import Any, Iterable, Optional, Sequence, TextIO
+
+_CHUNK_LINES = 2048          # lignes par appel à ``write``
 
 
 class GenericView:
@@ -52,3 +66,111 @@ class GenericView:
     def print_red(self, text: str) -> None:
         """Affiche *text* en rouge."""
         print(f"{self.RED}{text}{self.END}")
+
+    # ----------------------------------------------------------------- #
+    # Tableaux
+    # ----------------------------------------------------------------- #
+    def print_table(
+        self,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        sample: int = 200,
+        max_width: int = 40,
+        out: Optional[TextIO] = None,
+        pager: Optional[bool] = None,
+    ) -> int:
+        """
+        Affiche *rows* sous forme de tableau aligné.
+
+        Parameters
+        ----------
+        columns :
+            Intitulés des colonnes.
+        rows :
+            Itérable de séquences de valeurs (consommé une seule fois, en
+            flux : seules les *sample* premières lignes sont mémorisées).
+        sample :
+            Lignes examinées pour calculer la largeur des colonnes ; les
+            valeurs plus longues sont tronquées.
+        max_width :
+            Largeur maximale d’une colonne.
+        out :
+            Flux de sortie (``sys.stdout`` par défaut).
+        pager :
+            Force (True) ou interdit (False) le *pager* ; par défaut, il
+            est utilisé si *out* est un terminal et ``EPIC_PAGER`` ≠ 0.
+
+        Returns
+        -------
+        int
+            Nombre de lignes de données affichées.
+        """
+        out = out if out is not None else sys.stdout
+        rows = iter(rows)
+        head = [["" if v is None else str(v) for v in row]
+                for row in islice(rows, sample)]
+        if not head:
+            out.write(f"{self.YELLOW}Aucune donnée.{self.END}\n")
+            out.flush()
+            return 0
+
+        widths = [
+            min(max_width, max([len(name)] + [len(row[i]) for row in head]))
+            for i, name in enumerate(columns)
+        ]
+        fmt = " | ".join(f"{{:<{w}.{w}}}" for w in widths).format
+        count = len(head)
+
+        def lines():
+            nonlocal count
+            yield self.BOLD + fmt(*columns) + self.END
+            yield "-+-".join("-" * w for w in widths)
+            for cells in head:
+                yield fmt(*cells)
+            for row in rows:
+                count += 1
+                yield fmt(*["" if v is None else str(v) for v in row])
+
+        stream = lines()
+        if pager is None:
+            pager = (out.isatty() if hasattr(out, "isatty") else False) \
+                and os.getenv("EPIC_PAGER", "1") != "0"
+        if pager:
+            height = shutil.get_terminal_size().lines - 1
+            first = list(islice(stream, height + 1))
+            stream = chain(first, stream)
+            if len(first) > height and self._page(stream):
+                return count
+        self._write_chunks(out, stream)
+        return count
+
+    def _write_chunks(self, out: TextIO, lines: Iterable[str]) -> None:
+        """Écrit *lines* par blocs de :data:`_CHUNK_LINES` lignes."""
+        while True:
+            chunk = list(islice(lines, _CHUNK_LINES))
+            if not chunk:
+                break
+            out.write("\n".join(chunk) + "\n")
+        out.flush()
+
+    def _page(self, lines: Iterable[str]) -> bool:
+        """
+        Envoie *lines* au *pager* ; False si aucun *pager* n’a pu démarrer.
+        """
+        command = shlex.split(os.getenv("PAGER") or "less -FRSX")
+        try:
+            proc = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                    text=True, encoding="utf-8")
+        except OSError:
+            return False
+        try:
+            self._write_chunks(proc.stdin, lines)
+        except BrokenPipeError:          # l’utilisateur a quitté le pager
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            proc.wait()
+        return True
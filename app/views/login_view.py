@@ -11,9 +11,14 @@ Trois variantes sont proposées :
 * :pymeth:`login_with_credentials_return_user` : identique à la
   précédente mais renvoie directement l’objet ``User`` (employé pour
   les tests unitaires).
+
+Lorsqu’une tentative est refusée par le limiteur de débit
+(:class:`TooManyAttemptsError`), le message est affiché en rouge et la
+connexion échoue sans qu’aucun hachage ne soit effectué.
 """
 
 from app.authentification.auth_controller import AuthController
+from app.authentification.login_throttle import TooManyAttemptsError
 from app.views.generic_view import GenericView
 
 
@@ -35,6 +40,18 @@ class LoginView(GenericView):
         self.db_conn = db_connection
         self.auth_controller = AuthController()
 
+    # ----------------------------------------------------------------- #
+    # Helper interne
+    # ----------------------------------------------------------------- #
+    def _authenticate(self, session, email: str, password: str):
+        """Délègue au contrôleur et affiche un éventuel refus du limiteur."""
+        try:
+            return self.auth_controller.authenticate_user(
+                session, email, password)
+        except TooManyAttemptsError as exc:
+            self.print_red(str(exc))
+            return None
+
     # ----------------------------------------------------------------- #
     # Modes d’utilisation
     # ----------------------------------------------------------------- #
@@ -53,7 +70,7 @@ class LoginView(GenericView):
         email = input(self.print_cyan("Entrez votre email : ") or "")
         password = input(self.print_cyan("Entrez votre mot de passe : ") or "")
 
-        user = self.auth_controller.authenticate_user(session, email, password)
+        user = self._authenticate(session, email, password)
         if user:
             token = self.auth_controller.generate_token(user)
             self.print_green("Authentification réussie.")
@@ -75,7 +92,7 @@ class LoginView(GenericView):
             Mot de passe en clair.
         """
         session = self.db_conn.create_session()
-        user = self.auth_controller.authenticate_user(session, email, password)
+        user = self._authenticate(session, email, password)
         if user:
             token = self.auth_controller.generate_token(user)
             self.print_green("Authentification réussie.")
@@ -97,6 +114,6 @@ class LoginView(GenericView):
         app.models.user.User | None
         """
         session = self.db_conn.create_session()
-        user = self.auth_controller.authenticate_user(session, email, password)
+        user = self._authenticate(session, email, password)
         session.close()
         return user
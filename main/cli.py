@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Commandes de ``python -m main`` (groupe *click*).
+
+==========  ==============================================================
+Commande    Effet
+==========  ==============================================================
+``run``     *(défaut)* vérifie la connexion et la version du schéma puis
+            lance l’interface CLI ; aucune écriture en base.
+``init``    supprime puis recrée toutes les tables (destructif).
+``migrate`` applique les migrations de schéma manquantes.
+``seed``    insère le jeu de données de démonstration.
+``generate``
+            insère un jeu de données synthétique volumineux (charge).
+``diagnostics``
+            affiche la configuration et les statistiques du pool.
+``login``   enregistre un jeton pour les commandes non interactives
+            (``logout`` le supprime).
+``clients`` / ``contracts`` / ``events``
+            commandes scriptables ``list`` / ``create`` / ``update``
+            (cf. :mod:`main.scripting`).
+``export``  exporte en flux clients / contrats / événements (CSV, NDJSON,
+            gzip).
+``batch``   exécute un fichier JSON Lines d’opérations d’écriture.
+==========  ==============================================================
+
+Les métriques Prometheus (``EPIC_METRICS_FILE`` / ``EPIC_METRICS_PORT``,
+cf. :mod:`app.observability.metrics`) et le profilage des actions CLI
+(``EPIC_PROFILE_DIR``, cf. :mod:`app.observability.profiling`) sont
+activés au même moment.
+
+Sentry est initialisé une seule fois, avant toute commande ; la
+variable ``SENTRY_TEST`` permet alors d’en vérifier l’intégration :
+
+* ``ping``  → envoi d’un simple message au niveau *error* ;
+* ``1``    → capture d’une `ZeroDivisionError`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import click
+
+
+# ------------------------------------------------------------------------- #
+# Bloc de test Sentry (facultatif – contrôlé par la variable SENTRY_TEST)
+# ------------------------------------------------------------------------- #
+def _sentry_self_test() -> None:
+    """Envoie un ping ou une exception de test selon ``SENTRY_TEST``."""
+    sentry_flag = os.getenv("SENTRY_TEST")
+
+    if sentry_flag == "ping":
+        import sentry_sdk
+        from datetime import datetime as _dt
+
+        print("[SENTRY TEST] Envoi d’un « ping » vers Sentry…")
+        sentry_sdk.capture_message(
+            f"Sentry ping {_dt.utcnow()}",
+            level="error",            # visible dans l’onglet « Issues »
+        )
+        sentry_sdk.flush(timeout=5.0)
+
+    elif sentry_flag == "1":
+        import sentry_sdk
+
+        print("[SENTRY TEST] Génération d’une ZeroDivisionError…")
+        try:
+            _ = 1 / 0  # division volontaire
+        except ZeroDivisionError:
+            # on capture manuellement pour garantir l’envoi
+            sentry_sdk.capture_exception()
+            sentry_sdk.flush(timeout=5.0)
+            # on ne relance pas l’exception : l’application peut poursuivre
+
+
+# ------------------------------------------------------------------------- #
+# Groupe de commandes                                                       #
+# ------------------------------------------------------------------------- #
+def _connection():
+    """
+    Construit la connexion BD à partir du `.env` (engine différé).
+
+    L’*engine* est partagé par toutes les commandes du processus (cf.
+    :mod:`app.config.engine_registry`) et fermé à sa sortie.
+    """
+    from app.config.database import DatabaseConfig, DatabaseConnection
+
+    return DatabaseConnection(DatabaseConfig())
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def cli(ctx: click.Context) -> None:
+    """Epic Events – CRM en ligne de commande."""
+    from app.observability.metrics import install_metrics_from_env
+    from app.observability.profiling import install_profiling_from_env
+    from app.observability.sentry import init_sentry
+
+    # Activation de Sentry très tôt dans le cycle de vie du processus
+    init_sentry()
+    _sentry_self_test()
+    install_metrics_from_env()
+    install_profiling_from_env()
+
+    if ctx.invoked_subcommand is None:
+        ctx.invoke(run)
+
+
+@cli.command()
+def run() -> None:
+    """Vérifie la base (sans la modifier) puis lance l’interface CLI."""
+    from main.migrate import SchemaError, verify_database
+    from app.controllers.reference_cache import warm_reference_cache
+    from app.views.cli_interface import CLIInterface
+
+    conn = _connection()
+    try:
+        version = verify_database(conn.engine)
+    except SchemaError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    click.echo(f"→ Base de données prête (schéma v{version}).")
+    warm_reference_cache(conn)
+    click.echo("\n→ Lancement de l'interface CLI Epic Events\n")
+    CLIInterface(conn).run()
+
+
+@cli.command()
+@click.confirmation_option(
+    prompt="Toutes les tables vont être supprimées puis recréées. Continuer ?")
+def init() -> None:
+    """Supprime puis recrée le schéma complet (destructif)."""
+    from main.init_db import init_db
+
+    click.echo("→ Initialisation de la base de données…")
+    init_db(_connection())
+
+
+@cli.command()
+def migrate() -> None:
+    """Applique les migrations de schéma manquantes."""
+    from main.migrate import LATEST_VERSION, migrate as apply_migrations
+
+    applied = apply_migrations(_connection().engine)
+    if applied:
+        click.echo(f"Migrations appliquées : {', '.join(map(str, applied))}.")
+    else:
+        click.echo(f"Schéma déjà à jour (v{LATEST_VERSION}).")
+
+
+@cli.command()
+def seed() -> None:
+    """Charge le jeu de données de démonstration."""
+    from main.seed_db import seed_db
+
+    click.echo("→ Chargement des données d'exemple…")
+    seed_db(_connection())
+
+
+@cli.command()
+@click.option("--commercials", default=10, show_default=True,
+              help="Commerciaux générés.")
+@click.option("--supports", default=5, show_default=True,
+              help="Supports générés.")
+@click.option("--clients", "clients_per_commercial", default=20.0,
+              show_default=True, help="Clients par commercial (moyenne).")
+@click.option("--contracts", "contracts_per_client", default=3.0,
+              show_default=True, help="Contrats par client (moyenne).")
+@click.option("--events", "events_per_contract", default=2.0,
+              show_default=True, help="Événements par contrat signé (moyenne).")
+@click.option("--seed", default=42, show_default=True,
+              help="Graine : même graine, mêmes données.")
+@click.option("--batch-size", default=5_000, show_default=True,
+              help="Lignes par transaction.")
+def generate(**options) -> None:
+    """Insère un jeu de données synthétique (tests de charge)."""
+    from main.generate_data import generate_data
+
+    def progress(counts):
+        click.echo("\r" + "  ".join(f"{k}={v}" for k, v in counts.items()),
+                   nl=False)
+
+    report = generate_data(_connection().engine, progress=progress, **options)
+    seconds = report.pop("seconds")
+    rows = sum(report.values())
+    click.echo(f"\n{rows} lignes insérées en {seconds:.1f} s "
+               f"({rows / max(seconds, 1e-9):,.0f} lignes/s).")
+
+
+@cli.command()
+@click.option("--json", "as_json", is_flag=True,
+              help="Sortie JSON (pour la supervision).")
+def diagnostics(as_json: bool) -> None:
+    """Vérifie la base et affiche l’état du pool de connexions."""
+    from main.migrate import SchemaError, verify_database
+
+    conn = _connection()
+    try:
+        schema = f"v{verify_database(conn.engine)}"
+    except SchemaError as exc:
+        schema = f"KO – {exc}"
+    report = {
+        "schema": schema,
+        "pool_options": conn.config.engine_options(),
+        "pool": conn.pool_stats(),
+    }
+    if as_json:
+        click.echo(json.dumps(report, indent=2, default=str))
+        return
+
+    click.echo(f"Schéma         : {report['schema']}")
+    for key, value in report["pool_options"].items():
+        click.echo(f"{key:<15}: {value}")
+    for key, value in report["pool"].items():
+        if key != "checkout_latency":
+            click.echo(f"{key:<15}: {value}")
+    latency = report["pool"].get("checkout_latency", {})
+    click.echo(
+        "latence emprunt: "
+        + ", ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}"
+                    for k, v in latency.items())
+    )
+
+
+# ------------------------------------------------------------------------- #
+# Commandes non interactives (cf. main.scripting)                           #
+# ------------------------------------------------------------------------- #
+def _register_scripting() -> None:
+    from main.scripting import COMMANDS
+
+    for command in COMMANDS:
+        cli.add_command(command)
+
+
+_register_scripting()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Générateur de données synthétiques (tests de charge, profilage).
+
+Contrairement à :mod:`main.seed_db` (quelques lignes insérées une à une),
+:func:`generate_data` produit un volume paramétrable :
+
+* *N* commerciaux et *S* supports ;
+* ~*M* clients par commercial ;
+* ~*K* contrats par client (montants log‑normaux, ~70 % signés) ;
+* ~*E* événements par contrat signé (dates réparties sur trois ans,
+  ~85 % avec un support assigné).
+
+Performances :
+
+* identifiants **pré‑calculés** à partir du ``MAX(id)`` de chaque table :
+  aucune lecture de clé générée, insertion par lots ``executemany`` ;
+* lignes mises en tampon par table puis vidées dans l’ordre des clés
+  étrangères, avec un ``COMMIT`` par lot (``batch_size`` lignes) ;
+* **un seul** hachage Argon2, partagé par tous les comptes générés ;
+* générateur pseudo‑aléatoire à graine : même graine, mêmes données.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import math
+import random
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import func, insert, select
+
+from app.models import Client, Contract, Event, Role, User
+
+_FIRST_NAMES = (
+    "Alice", "Bruno", "Chloé", "David", "Emma", "Fabien", "Gaëlle", "Hugo",
+    "Inès", "Julien", "Karima", "Louis", "Manon", "Nicolas", "Océane",
+    "Paul", "Quentin", "Rose", "Samuel", "Théo", "Ursula", "Victor",
+)
+_LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit",
+    "Durand", "Leroy", "Moreau", "Simon", "Laurent", "Lefebvre", "Michel",
+    "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier",
+)
+_COMPANIES = (
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne",
+    "Soylent", "Vandelay", "Cyberdyne", "Tyrell", "Wonka",
+)
+_CITIES = (
+    "Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes", "Nice",
+    "Toulouse", "Strasbourg", "Rennes", "Montpellier", "Grenoble",
+)
+_EPOCH = dt.datetime(2023, 1, 1)
+
+
+# --------------------------------------------------------------------------- #
+# Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Tirage de Poisson (Knuth ; approximation normale au‑delà de 30)."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+class _BatchWriter:
+    """
+    Tampons d’insertion par table, vidés dans l’ordre des clés étrangères.
+
+    Un ``COMMIT`` est émis à chaque vidage : la transaction ouverte ne
+    dépasse jamais ``batch_size`` lignes.
+    """
+
+    _ORDER = (User.__table__, Client.__table__, Contract.__table__,
+              Event.__table__)
+
+    def __init__(self, connection, batch_size: int,
+                 progress: Optional[Callable[[Dict[str, int]], None]] = None
+                 ) -> None:
+        self.connection = connection
+        self.batch_size = batch_size
+        self.progress = progress
+        self.buffers: Dict = {table: [] for table in self._ORDER}
+        self.pending = 0
+        self.counts: Dict[str, int] = {t.name: 0 for t in self._ORDER}
+
+    def add(self, table, row: Dict) -> None:
+        self.buffers[table].append(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for table in self._ORDER:
+            rows = self.buffers[table]
+            if rows:
+                self.connection.execute(insert(table), rows)
+                self.counts[table.name] += len(rows)
+                self.buffers[table] = []
+        self.connection.commit()
+        self.pending = 0
+        if self.progress is not None:
+            self.progress(self.counts)
+
+
+def _next_ids(connection) -> Dict[str, int]:
+    """Premier identifiant libre de chaque table générée."""
+    return {
+        model.__tablename__: (connection.scalar(
+            select(func.max(model.id))) or 0) + 1
+        for model in (User, Client, Contract, Event)
+    }
+
+
+def _role_ids(connection) -> Dict[str, int]:
+    """Identifiants des trois rôles, créés s’ils sont absents."""
+    names = ("commercial", "support", "gestion")
+    found = dict(connection.execute(
+        select(Role.name, Role.id).where(Role.name.in_(names))).all())
+    missing = [{"name": n} for n in names if n not in found]
+    if missing:
+        connection.execute(insert(Role.__table__), missing)
+        found = dict(connection.execute(
+            select(Role.name, Role.id).where(Role.name.in_(names))).all())
+    connection.commit()
+    return found
+
+
+# --------------------------------------------------------------------------- #
+# Fonction principale                                                         #
+# --------------------------------------------------------------------------- #
+def generate_data(
+    engine,
+    commercials: int = 10,
+    supports: int = 5,
+    clients_per_commercial: float = 20,
+    contracts_per_client: float = 3,
+    events_per_contract: float = 2,
+    seed: int = 42,
+    batch_size: int = 5_000,
+    password: str = "Generated-Password-123",
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, float]:
+    """
+    Insère un jeu de données synthétique et renvoie un bilan.
+
+    Parameters
+    ----------
+    engine :
+        *Engine* SQLAlchemy (schéma déjà créé).
+    commercials, supports :
+        Nombre de collaborateurs générés par rôle.
+    clients_per_commercial, contracts_per_client, events_per_contract :
+        Moyennes des lois de Poisson utilisées (les événements ne portent
+        que sur les contrats signés).
+    seed :
+        Graine du générateur pseudo‑aléatoire.
+    batch_size :
+        Lignes insérées par transaction.
+    password :
+        Mot de passe commun (haché une seule fois).
+    progress :
+        Rappel facultatif appelé après chaque lot validé avec les
+        compteurs par table.
+
+    Returns
+    -------
+    dict
+        Lignes insérées par table et durée (``seconds``).
+    """
+    from argon2 import PasswordHasher
+
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    password_hash = PasswordHasher().hash(password)
+
+    with engine.connect() as connection:
+        roles = _role_ids(connection)
+        ids = _next_ids(connection)
+        writer = _BatchWriter(connection, batch_size, progress)
+
+        def new_user(role: str, prefix: str) -> int:
+            uid = ids["users"]
+            ids["users"] += 1
+            writer.add(User.__table__, {
+                "id": uid,
+                "employee_number": f"{prefix}{uid:06d}",
+                "first_name": rng.choice(_FIRST_NAMES),
+                "last_name": rng.choice(_LAST_NAMES),
+                "email": f"{prefix.lower()}{uid}@gen.epic-events.test",
+                "password_hash": password_hash,
+                "role_id": roles[role],
+            })
+            return uid
+
+        support_ids = [new_user("support", "S") for _ in range(supports)]
+        commercial_ids = [new_user("commercial", "C")
+                          for _ in range(commercials)]
+
+        for commercial_id in commercial_ids:
+            for _ in range(_poisson(rng, clients_per_commercial)):
+                client_id = ids["clients"]
+                ids["clients"] += 1
+                first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+                created = _EPOCH + dt.timedelta(days=rng.randint(0, 1095))
+                writer.add(Client.__table__, {
+                    "id": client_id,
+                    "full_name": f"{first} {last}",
+                    "email": f"client{client_id}@gen.epic-events.test",
+                    "phone": f"+33{rng.randint(100_000_000, 799_999_999)}",
+                    "company_name": rng.choice(_COMPANIES),
+                    "date_created": created,
+                    "commercial_id": commercial_id,
+                })
+                for _ in range(_poisson(rng, contracts_per_client)):
+                    contract_id = ids["contracts"]
+                    ids["contracts"] += 1
+                    total = round(rng.lognormvariate(9.5, 0.8), 2)
+                    signed = rng.random() < 0.7
+                    paid = rng.random() < 0.4
+                    writer.add(Contract.__table__, {
+                        "id": contract_id,
+                        "client_id": client_id,
+                        "commercial_id": commercial_id,
+                        "total_amount": total,
+                        "remaining_amount": 0.0 if paid else round(
+                            total * rng.random(), 2),
+                        "date_created": created,
+                        "is_signed": signed,
+                    })
+                    if not signed:
+                        continue
+                    for _ in range(_poisson(rng, events_per_contract)):
+                        start = created + dt.timedelta(
+                            days=rng.randint(0, 365), hours=rng.randint(8, 20))
+                        writer.add(Event.__table__, {
+                            "id": ids["events"],
+                            "contract_id": contract_id,
+                            "support_id": (rng.choice(support_ids)
+                                           if support_ids
+                                           and rng.random() < 0.85 else None),
+                            "date_start": start,
+                            "date_end": start + dt.timedelta(
+                                hours=rng.choice((4, 8, 24, 48, 72))),
+                            "location": rng.choice(_CITIES),
+                            "attendees": max(1, round(
+                                rng.lognormvariate(4.0, 0.9))),
+                            "notes": None,
+                        })
+                        ids["events"] += 1
+        writer.flush()
+
+    report: Dict[str, float] = dict(writer.counts)
+    report["seconds"] = time.perf_counter() - started
+    return report
@@ -6,21 +6,34 @@ Le module expose une seule fonction :
 
     init_db()  – supprime l’éventuel schéma existant puis recrée
                  l’ensemble des tables déclarées dans les modèles.
+
+Opération **destructive** : elle n’est lancée que sur demande explicite
+(``python -m main init``), jamais au démarrage normal de la CLI.
 """
 
+from __future__ import annotations
+
 from app.config.database import DatabaseConfig, DatabaseConnection
 from app.models import Base
+from main.migrate import stamp_latest
 
 
-def init_db() -> None:
+def init_db(conn: DatabaseConnection | None = None) -> None:
     """
     (Re)crée toutes les tables définies dans *app.models*.
 
     * Supprime le schéma existant (``DROP TABLE …``) ;
-    * Exécute les instructions ``CREATE TABLE`` générées par SQLAlchemy.
+    * Exécute les instructions ``CREATE TABLE`` générées par SQLAlchemy ;
+    * Marque le schéma comme à jour dans ``schema_version``.
+
+    Parameters
+    ----------
+    conn :
+        Connexion à utiliser ; à défaut, construite depuis le `.env`
+        (l’*engine* reste celui du registre de processus).
     """
-    cfg = DatabaseConfig()
-    conn = DatabaseConnection(cfg)
+    if conn is None:
+        conn = DatabaseConnection(DatabaseConfig())
     engine = conn.engine
 
     print("Suppression des tables existantes…")
@@ -28,5 +41,6 @@ def init_db() -> None:
 
     print("Création du schéma (tables)…")
     Base.metadata.create_all(bind=engine)
+    stamp_latest(engine)
 
     print("Tables créées avec succès.")
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Migrations du schéma SQL.
+
+Chaque migration est un triplet ``(version, description, fonction)`` ; la
+fonction reçoit une connexion SQLAlchemy ouverte dans une transaction.
+Les versions appliquées sont historisées dans la table
+``schema_version`` (cf. :class:`app.models.SchemaVersion`).
+
+Le module expose :
+
+    current_version()  – version du schéma en base (None si absent) ;
+    migrate()          – applique les migrations manquantes ;
+    stamp_latest()     – marque le schéma comme à jour (après init_db) ;
+    verify_database()  – contrôle rapide utilisé au lancement de la CLI.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import inspect, select, text
+
+from app.models import Base, SchemaVersion
+from app.models.event import Event
+from app.models.login_throttle import LoginThrottleBucket
+
+
+# --------------------------------------------------------------------------- #
+# Migrations                                                                  #
+# --------------------------------------------------------------------------- #
+def _m001_initial_schema(connection) -> None:
+    """Crée les tables manquantes (bases existantes antérieures au suivi)."""
+    Base.metadata.create_all(bind=connection, checkfirst=True)
+
+
+def _m002_event_support_period_index(connection) -> None:
+    """Index (support, début, fin) des événements : calendrier, conflits."""
+    index = next(ix for ix in Event.__table__.indexes
+                 if ix.name == "ix_events_support_period")
+    index.create(bind=connection, checkfirst=True)
+
+
+def _m003_login_throttle_double(connection) -> None:
+    """
+    Recrée ``login_throttle`` en double précision (``FLOAT`` MySQL trop
+    imprécis pour un horodatage epoch) ; seul l’état des seaux est perdu.
+    """
+    LoginThrottleBucket.__table__.drop(bind=connection, checkfirst=True)
+    LoginThrottleBucket.__table__.create(bind=connection)
+
+
+MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (1, "Schéma initial", _m001_initial_schema),
+    (2, "Index du planning des supports", _m002_event_support_period_index),
+    (3, "Seaux de connexion en double précision", _m003_login_throttle_double),
+]
+
+#: Version attendue par le code courant.
+LATEST_VERSION: int = MIGRATIONS[-1][0]
+
+
+class SchemaError(RuntimeError):
+    """Base injoignable ou schéma absent / obsolète."""
+
+
+# --------------------------------------------------------------------------- #
+# API                                                                         #
+# --------------------------------------------------------------------------- #
+def current_version(connection) -> Optional[int]:
+    """Renvoie la version la plus élevée appliquée, ou None."""
+    if not inspect(connection).has_table(SchemaVersion.__tablename__):
+        return None
+    versions = connection.execute(select(SchemaVersion.version)).scalars()
+    return max(versions, default=None)
+
+
+def _stamp(connection, version: int, description: str) -> None:
+    """Historise l’application de la migration *version*."""
+    connection.execute(
+        SchemaVersion.__table__.insert().values(
+            version=version, description=description)
+    )
+
+
+def migrate(engine) -> List[int]:
+    """
+    Applique, dans l’ordre, toutes les migrations non encore appliquées.
+
+    Returns
+    -------
+    list[int]
+        Versions appliquées pendant cet appel.
+    """
+    applied: List[int] = []
+    with engine.begin() as connection:
+        SchemaVersion.__table__.create(bind=connection, checkfirst=True)
+        start = current_version(connection) or 0
+        for version, description, upgrade in MIGRATIONS:
+            if version <= start:
+                continue
+            upgrade(connection)
+            _stamp(connection, version, description)
+            applied.append(version)
+    return applied
+
+
+def stamp_latest(engine) -> None:
+    """Marque toutes les migrations comme appliquées (schéma neuf)."""
+    with engine.begin() as connection:
+        start = current_version(connection) or 0
+        for version, description, _upgrade in MIGRATIONS:
+            if version > start:
+                _stamp(connection, version, description)
+
+
+def verify_database(engine) -> int:
+    """
+    Vérifie la connectivité puis la version du schéma, sans rien modifier.
+
+    Raises
+    ------
+    SchemaError
+        Si la base est injoignable ou si le schéma n’est pas à jour.
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            version = current_version(connection)
+    except Exception as exc:
+        raise SchemaError(f"Base de données injoignable : {exc}") from exc
+
+    if version is None:
+        raise SchemaError(
+            "Schéma absent : lancez « python -m main init » (base neuve) "
+            "ou « python -m main migrate » (base existante).")
+    if version < LATEST_VERSION:
+        raise SchemaError(
+            f"Schéma en version {version}, version {LATEST_VERSION} attendue : "
+            "lancez « python -m main migrate ».")
+    if version > LATEST_VERSION:
+        raise SchemaError(
+            f"Schéma en version {version}, plus récente que l’application "
+            f"({LATEST_VERSION}) : mettez l’application à jour.")
+    return version
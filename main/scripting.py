@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""
+Commandes non interactives (scripts, automatisation).
+
+Exemples ::
+
+    python -m main login --email ann@epic.io          # mot de passe demandé
+    python -m main clients list --mine --format json
+    python -m main contracts update 42 --remaining 0
+    python -m main events list --mine --format csv
+    python -m main export --format ndjson --gzip -o exports/
+    python -m main batch operations.jsonl --batch-size 200
+    python -m main logout
+
+``login`` vérifie les identifiants une seule fois (Argon2 + limiteur de
+débit) puis enregistre le JWT via :class:`TokenStore`.  Les commandes
+suivantes se contentent de vérifier la signature du jeton : ni saisie, ni
+hachage, ni menu — elles peuvent être appelées en boucle serrée.
+
+La lecture et l’écriture passent par :class:`DataReader` et
+:class:`DataWriter` : les règles de droits sont celles de l’interface
+interactive.  Les erreurs métier (``ValueError`` / ``PermissionError``)
+sont affichées sur *stderr* avec le code de sortie 1.
+
+Formats de sortie (``--format``) : ``table`` (défaut), ``json``, ``csv``.
+Le mot de passe peut aussi être fourni par ``EPIC_PASSWORD``.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+import click
+
+_FORMATS = click.Choice(["table", "json", "csv"])
+_DATETIME = click.DateTime(formats=["%Y-%m-%d %H:%M", "%Y-%m-%d"])
+
+
+# ------------------------------------------------------------------------- #
+# Helpers                                                                   #
+# ------------------------------------------------------------------------- #
+def _format_option(func):
+    """Ajoute l’option ``--format`` commune à toutes les commandes."""
+    return click.option("--format", "fmt", type=_FORMATS, default="table",
+                        show_default=True, help="Format de sortie.")(func)
+
+
+def _connection():
+    """Connexion BD (résolue à l’appel : remplaçable dans les tests)."""
+    from main import cli
+
+    return cli._connection()
+
+
+def _current_user(mine: bool = False) -> Dict[str, Any]:
+    """
+    Reconstruit l’utilisateur courant à partir du jeton enregistré.
+
+    Parameters
+    ----------
+    mine :
+        Ajoute ``force_filter`` (listes restreintes au périmètre du rôle).
+
+    Returns
+    -------
+    dict
+        ``{"id", "role"}`` tel qu’attendu par DataReader / DataWriter.
+    """
+    from app.authentification.auth_controller import AuthController
+    from app.authentification.token_store import TokenStore
+
+    token = TokenStore().load()
+    if token is None:
+        raise click.ClickException(
+            "Non connecté : lancez d’abord « python -m main login ».")
+    try:
+        payload = AuthController().verify_token(token)
+    except Exception as exc:
+        raise click.ClickException(str(exc)) from exc
+    return {"id": payload["user_id"], "role": payload["role"],
+            "force_filter": mine}
+
+
+@contextmanager
+def _session() -> Iterator[Tuple[Any, Any]]:
+    """Session unique pour la commande ; erreurs métier → code 1."""
+    conn = _connection()
+    with conn.create_session() as session:
+        try:
+            yield conn, session
+        except (ValueError, PermissionError) as exc:
+            session.rollback()
+            raise click.ClickException(str(exc)) from exc
+
+
+def _emit(model, entities: Iterable, fmt: str) -> None:
+    """Écrit *entities* sur la sortie standard au format *fmt*."""
+    columns = [col.name for col in model.__table__.columns
+               if col.name != "password_hash"]
+    rows = ([getattr(entity, name) for name in columns]
+            for entity in entities)
+
+    if fmt == "json":
+        click.echo(json.dumps([dict(zip(columns, row)) for row in rows],
+                              default=str, ensure_ascii=False))
+    elif fmt == "csv":
+        import csv
+
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+    else:
+        from app.views.generic_view import GenericView
+
+        GenericView().print_table(columns, rows, out=sys.stdout)
+
+
+def _user_id(session, employee_number: str | None, role: str) -> int | None:
+    """Identifiant du collaborateur *employee_number* ayant le rôle *role*."""
+    if employee_number is None:
+        return None
+    from app.controllers.reference_cache import reference_cache
+
+    user = reference_cache(session).collaborator(session, employee_number,
+                                                 role)
+    if user is None:
+        raise ValueError(f"Collaborateur {role} introuvable : "
+                         f"{employee_number}.")
+    return user.id
+
+
+def _updates(**values) -> Dict[str, Any]:
+    """Ne conserve que les options effectivement fournies."""
+    updates = {key: value for key, value in values.items()
+               if value is not None}
+    if not updates:
+        raise click.UsageError("Aucune modification demandée.")
+    return updates
+
+
+# ------------------------------------------------------------------------- #
+# Session                                                                   #
+# ------------------------------------------------------------------------- #
+@click.command()
+@click.option("--email", prompt="Email", help="Adresse du collaborateur.")
+@click.option("--password", prompt="Mot de passe", hide_input=True,
+              envvar="EPIC_PASSWORD", help="Mot de passe (ou EPIC_PASSWORD).")
+def login(email: str, password: str) -> None:
+    """Authentifie le collaborateur et enregistre son jeton."""
+    from app.authentification.auth_controller import AuthController
+    from app.authentification.login_throttle import TooManyAttemptsError
+    from app.authentification.token_store import TokenStore
+
+    auth = AuthController()
+    with _connection().create_session() as session:
+        try:
+            user = auth.authenticate_user(session, email, password)
+        except TooManyAttemptsError as exc:
+            raise click.ClickException(str(exc)) from exc
+        if user is None:
+            raise click.ClickException("Échec de l’authentification.")
+        store = TokenStore()
+        store.save(auth.generate_token(user))
+        click.echo(f"Connecté – rôle {user.role.name} "
+                   f"(jeton : {store.path}).")
+
+
+@click.command()
+def logout() -> None:
+    """Supprime le jeton enregistré."""
+    from app.authentification.token_store import TokenStore
+
+    TokenStore().clear()
+    click.echo("Déconnecté.")
+
+
+# ------------------------------------------------------------------------- #
+# Clients                                                                   #
+# ------------------------------------------------------------------------- #
+@click.group()
+def clients() -> None:
+    """Consultation et gestion des clients."""
+
+
+@clients.command("list")
+@click.option("--mine", is_flag=True, help="Uniquement mes clients.")
+@_format_option
+def clients_list(mine: bool, fmt: str) -> None:
+    """Liste les clients."""
+    from app.controllers.data_reader import DataReader
+    from app.models import Client
+
+    cur = _current_user(mine)
+    with _session() as (conn, session):
+        _emit(Client, DataReader(conn).get_all_clients(session, cur), fmt)
+
+
+@clients.command("create")
+@click.option("--name", "full_name", required=True, help="Nom complet.")
+@click.option("--email", required=True)
+@click.option("--phone")
+@click.option("--company", "company_name")
+@_format_option
+def clients_create(fmt: str, **fields) -> None:
+    """Crée un client (rattaché au commercial connecté)."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Client
+
+    cur = _current_user()
+    with _session() as (conn, session):
+        client = DataWriter(conn).create_client(
+            session, cur, commercial_id=cur["id"], **fields)
+        _emit(Client, [client], fmt)
+
+
+@clients.command("update")
+@click.argument("client_id", type=int)
+@click.option("--name", "full_name")
+@click.option("--email")
+@click.option("--phone")
+@click.option("--company", "company_name")
+@_format_option
+def clients_update(client_id: int, fmt: str, **fields) -> None:
+    """Modifie un client ; seules les options fournies sont appliquées."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Client
+
+    updates = _updates(**fields)
+    cur = _current_user()
+    with _session() as (conn, session):
+        client = DataWriter(conn).update_client(
+            session, cur, client_id, **updates)
+        _emit(Client, [client], fmt)
+
+
+# ------------------------------------------------------------------------- #
+# Contrats                                                                  #
+# ------------------------------------------------------------------------- #
+@click.group()
+def contracts() -> None:
+    """Consultation et gestion des contrats."""
+
+
+@contracts.command("list")
+@click.option("--mine", is_flag=True, help="Uniquement mes contrats.")
+@click.option("--unsigned", is_flag=True, help="Contrats non signés.")
+@click.option("--unpaid", is_flag=True, help="Contrats non soldés.")
+@_format_option
+def contracts_list(mine: bool, unsigned: bool, unpaid: bool,
+                   fmt: str) -> None:
+    """Liste les contrats."""
+    from app.controllers.data_reader import DataReader
+    from app.models import Contract
+
+    cur = _current_user(mine)
+    with _session() as (conn, session):
+        rows = DataReader(conn).get_all_contracts(session, cur)
+        if unsigned:
+            rows = [c for c in rows if not c.is_signed]
+        if unpaid:
+            rows = [c for c in rows if c.remaining_amount > 0]
+        _emit(Contract, rows, fmt)
+
+
+@contracts.command("create")
+@click.option("--client", "client_id", type=int, required=True)
+@click.option("--total", "total_amount", type=float, required=True)
+@click.option("--remaining", "remaining_amount", type=float)
+@click.option("--signed/--unsigned", "is_signed", default=False)
+@_format_option
+def contracts_create(client_id: int, total_amount: float,
+                     remaining_amount: float | None, is_signed: bool,
+                     fmt: str) -> None:
+    """Crée un contrat (restant = total par défaut)."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Contract
+
+    cur = _current_user()
+    with _session() as (conn, session):
+        contract = DataWriter(conn).create_contract(
+            session, cur, client_id, total_amount,
+            total_amount if remaining_amount is None else remaining_amount,
+            is_signed)
+        _emit(Contract, [contract], fmt)
+
+
+@contracts.command("update")
+@click.argument("contract_id", type=int)
+@click.option("--client", "client_id", type=int)
+@click.option("--total", "total_amount", type=float)
+@click.option("--remaining", "remaining_amount", type=float)
+@click.option("--signed/--unsigned", "is_signed", default=None)
+@click.option("--commercial", help="Employee number du commercial.")
+@_format_option
+def contracts_update(contract_id: int, commercial: str | None, fmt: str,
+                     **fields) -> None:
+    """Modifie un contrat ; seules les options fournies sont appliquées."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Contract
+
+    cur = _current_user()
+    with _session() as (conn, session):
+        updates = _updates(
+            commercial_id=_user_id(session, commercial, "commercial"),
+            **fields)
+        contract = DataWriter(conn).update_contract(
+            session, cur, contract_id, **updates)
+        _emit(Contract, [contract], fmt)
+
+
+# ------------------------------------------------------------------------- #
+# Événements                                                                #
+# ------------------------------------------------------------------------- #
+@click.group()
+def events() -> None:
+    """Consultation et gestion des événements."""
+
+
+@events.command("list")
+@click.option("--mine", is_flag=True, help="Uniquement mes événements.")
+@click.option("--no-support", is_flag=True,
+              help="Événements sans support assigné.")
+@_format_option
+def events_list(mine: bool, no_support: bool, fmt: str) -> None:
+    """Liste les événements."""
+    from app.controllers.data_reader import DataReader
+    from app.models import Event
+
+    cur = _current_user(mine)
+    with _session() as (conn, session):
+        rows = DataReader(conn).get_all_events(session, cur)
+        if no_support:
+            rows = [e for e in rows if e.support_id is None]
+        _emit(Event, rows, fmt)
+
+
+@events.command("create")
+@click.option("--contract", "contract_id", type=int, required=True)
+@click.option("--start", "date_start", type=_DATETIME, required=True)
+@click.option("--end", "date_end", type=_DATETIME, required=True)
+@click.option("--support", help="Employee number du support.")
+@click.option("--location")
+@click.option("--attendees", type=int)
+@click.option("--notes")
+@_format_option
+def events_create(support: str | None, fmt: str, **fields) -> None:
+    """Crée un événement sur un contrat signé."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Event
+
+    cur = _current_user()
+    with _session() as (conn, session):
+        event = DataWriter(conn).create_event(
+            session, cur,
+            support_id=_user_id(session, support, "support"), **fields)
+        _emit(Event, [event], fmt)
+
+
+@events.command("update")
+@click.argument("event_id", type=int)
+@click.option("--start", "date_start", type=_DATETIME)
+@click.option("--end", "date_end", type=_DATETIME)
+@click.option("--support", help="Employee number du support.")
+@click.option("--location")
+@click.option("--attendees", type=int)
+@click.option("--notes")
+@_format_option
+def events_update(event_id: int, support: str | None, fmt: str,
+                  **fields) -> None:
+    """Modifie un événement ; seules les options fournies sont appliquées."""
+    from app.controllers.data_writer import DataWriter
+    from app.models import Event
+
+    cur = _current_user()
+    with _session() as (conn, session):
+        updates = _updates(support_id=_user_id(session, support, "support"),
+                           **fields)
+        event = DataWriter(conn).update_event(
+            session, cur, event_id, **updates)
+        _emit(Event, [event], fmt)
+
+
+# ------------------------------------------------------------------------- #
+# Export                                                                    #
+# ------------------------------------------------------------------------- #
+@click.command()
+@click.argument("tables", nargs=-1,
+                type=click.Choice(["clients", "contracts", "events"]))
+@click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]),
+              default="csv", show_default=True)
+@click.option("--gzip", "compress", is_flag=True, help="Compression gzip.")
+@click.option("--output", "-o", default=".", show_default=True,
+              help="Dossier de destination, ou « - » (une table, stdout).")
+@click.option("--mine", is_flag=True, help="Uniquement mon périmètre.")
+@click.option("--chunk-size", default=10_000, show_default=True,
+              help="Lignes lues et écrites par bloc.")
+def export(tables: Tuple[str, ...], fmt: str, compress: bool, output: str,
+           mine: bool, chunk_size: int) -> None:
+    """Exporte clients / contrats / événements (toutes par défaut)."""
+    from app.controllers.data_exporter import TABLES, DataExporter
+
+    tables = tables or TABLES
+    cur = _current_user(mine)
+    exporter = DataExporter(_connection(), chunk_size=chunk_size)
+
+    try:
+        if output == "-":
+            if len(tables) != 1 or compress:
+                raise click.UsageError(
+                    "« -o - » : une seule table, sans --gzip.")
+            exporter.stream(cur, tables[0], sys.stdout, fmt)
+            return
+        exporter.export(
+            cur, output, tables, fmt, compress,
+            progress=lambda table, n: click.echo(f"{table:<10}: {n} lignes"))
+    except (ValueError, PermissionError) as exc:
+        raise click.ClickException(str(exc)) from exc
+
+
+# ------------------------------------------------------------------------- #
+# Lot d’opérations                                                          #
+# ------------------------------------------------------------------------- #
+@click.command()
+@click.argument("source", type=click.File("r", encoding="utf-8"))
+@click.option("--batch-size", default=100, show_default=True,
+              help="Opérations par transaction.")
+@click.option("--dry-run", is_flag=True, help="Exécute puis annule tout.")
+@click.option("--quiet", "-q", is_flag=True,
+              help="N’affiche que les lignes en échec.")
+@click.option("--json", "as_json", is_flag=True,
+              help="Résultats en JSON Lines (un objet par ligne).")
+def batch(source, batch_size: int, dry_run: bool, quiet: bool,
+          as_json: bool) -> None:
+    """Exécute un fichier JSON Lines d’opérations (« - » : stdin)."""
+    from app.controllers.batch_runner import BatchRunner
+
+    cur = _current_user()
+
+    def report(result) -> None:
+        if quiet and result.ok:
+            return
+        if as_json:
+            click.echo(json.dumps(result.as_dict(), ensure_ascii=False))
+        elif result.ok:
+            click.echo(f"ligne {result.line:>6} : OK     {result.detail}")
+        else:
+            click.echo(f"ligne {result.line:>6} : ÉCHEC  {result.detail}",
+                       err=True)
+
+    try:
+        runner = BatchRunner(_connection(), batch_size=batch_size)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--batch-size")
+    summary = runner.run(cur, source, report, dry_run=dry_run)
+    click.echo(
+        f"{summary['ok']} OK, {summary['failed']} en échec, "
+        f"{summary['commits']} commit(s) en {summary['seconds']:.2f} s "
+        f"({summary['per_second']:,.0f} op/s)"
+        + (" – annulé (--dry-run)." if dry_run else "."),
+        err=as_json)
+    if summary["failed"]:
+        raise SystemExit(1)
+
+
+COMMANDS = (login, logout, clients, contracts, events, export, batch)
@@ -63,13 +63,18 @@ def _create_contract(session, client: Client,
 # --------------------------------------------------------------------------- #
 # Fonction principale                                                         #
 # --------------------------------------------------------------------------- #
-def seed_db() -> None:
+def seed_db(conn: DatabaseConnection | None = None) -> None:
     """
     Alimente la base avec un jeu de données cohérent destiné aux tests
     et aux démonstrations.
+
+    Parameters
+    ----------
+    conn :
+        Connexion à utiliser ; à défaut, construite depuis le `.env`.
     """
-    cfg = DatabaseConfig()
-    conn = DatabaseConnection(cfg)
+    if conn is None:
+        conn = DatabaseConnection(DatabaseConfig())
     session = conn.create_session()
     auth = AuthController()
 
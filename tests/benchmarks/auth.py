@@ -0,0 +1,398 @@
+# tests/benchmarks/auth.py
+# -*- coding: utf-8 -*-
+"""
+Banc d’essai de l’authentification : Argon2, JWT et connexions complètes.
+
+Mesures (débit ``ops_per_sec`` et latences p50 / p95 / p99) :
+
+* ``argon2[…]/hash[1]`` et ``/verify[1]`` – un cœur, paramètres du
+  ``PasswordHasher`` de :class:`AuthController` (et, pour comparer, de
+  chaque ``--argon2 t=…,m=…,p=…`` proposé) ;
+* ``argon2[…]/verify[N]`` – *N* processus (``--cores``, tous les cœurs
+  par défaut) : débit agrégé d’un hôte de connexion et efficacité de la
+  mise à l’échelle (``scaling``) ;
+* ``jwt[ALG]/encode`` et ``/decode`` – :meth:`generate_token` et
+  :meth:`verify_token` ;
+* ``login/sequential`` – :meth:`LoginView.login_with_credentials_return_user`
+  de bout en bout (limiteur, requête, vérification Argon2) sur une base
+  SQLite de ``--users`` comptes ;
+* ``login/storm[T]`` – *T* threads se connectant en même temps à travers
+  **une** vue (un hôte de connexion : limiteur partagé).  Les refus du
+  limiteur sont comptés à part (``throttled``) ; les variables
+  ``LOGIN_THROTTLE_*`` permettent de le régler ou de le neutraliser.
+
+Utilisation ::
+
+    python -m tests.benchmarks.auth --seconds 5 --storm 8,32 \\
+        --argon2 t=2,m=19456,p=1 --output auth.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tests.benchmarks.harness import (
+    add_common_arguments,
+    finish,
+    percentile,
+    sqlite_connection,
+)
+
+# Mot de passe commun des comptes générés (cf. main.generate_data).
+_PASSWORD = "Generated-Password-123"
+
+
+# --------------------------------------------------------------------------- #
+# Mesure à durée fixe                                                         #
+# --------------------------------------------------------------------------- #
+def _latencies(fn: Callable[[], Any], seconds: float,
+               minimum: int = 3) -> List[float]:
+    """Appelle *fn* pendant *seconds* (au moins *minimum* fois)."""
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline or len(latencies) < minimum:
+        started = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _summary(case_id: str, latencies: List[float], elapsed: float,
+             **extra: Any) -> Dict[str, Any]:
+    return {
+        "id": case_id,
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        **extra,
+    }
+
+
+# --------------------------------------------------------------------------- #
+# Argon2                                                                      #
+# --------------------------------------------------------------------------- #
+def parse_argon2(text: str) -> Dict[str, int]:
+    """``"t=2,m=19456,p=1"`` → paramètres de ``PasswordHasher``."""
+    names = {"t": "time_cost", "m": "memory_cost", "p": "parallelism"}
+    params = {}
+    for item in text.split(","):
+        key, _, value = item.partition("=")
+        if key.strip() not in names:
+            raise ValueError(f"Paramètre Argon2 inconnu : {key}")
+        params[names[key.strip()]] = int(value)
+    return params
+
+
+def _label(params: Dict[str, int]) -> str:
+    return (f"argon2[t{params['time_cost']}-m{params['memory_cost']}"
+            f"-p{params['parallelism']}]")
+
+
+def _verify_worker(params: Dict[str, int], seconds: float,
+                   start_at: float) -> List[float]:
+    """Boucle de vérification dans un processus (cf. :func:`bench_argon2`)."""
+    from argon2 import PasswordHasher
+
+    hasher = PasswordHasher(**params)
+    digest = hasher.hash(_PASSWORD)
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+    return _latencies(lambda: hasher.verify(digest, _PASSWORD), seconds)
+
+
+def bench_argon2(params: Dict[str, int], seconds: float,
+                 cores: int) -> List[Dict[str, Any]]:
+    """Hachage / vérification sur un cœur puis sur *cores* processus."""
+    from argon2 import PasswordHasher
+
+    hasher = PasswordHasher(**params)
+    label = _label(params)
+    extra = {"memory_kib": params["memory_cost"], **params}
+
+    started = time.perf_counter()
+    hashes = _latencies(lambda: hasher.hash(_PASSWORD), seconds)
+    results = [_summary(f"{label}/hash[1]", hashes,
+                        time.perf_counter() - started, **extra)]
+
+    digest = hasher.hash(_PASSWORD)
+    started = time.perf_counter()
+    verifies = _latencies(lambda: hasher.verify(digest, _PASSWORD), seconds)
+    single = _summary(f"{label}/verify[1]", verifies,
+                      time.perf_counter() - started, **extra)
+    results.append(single)
+
+    if cores > 1:
+        start_at = time.time() + 1.0
+        with ProcessPoolExecutor(max_workers=cores) as pool:
+            outcomes = list(pool.map(_verify_worker, [params] * cores,
+                                     [seconds] * cores, [start_at] * cores))
+        every = [t for latencies in outcomes for t in latencies]
+        aggregate = sum(len(o) / sum(o) for o in outcomes)
+        result = _summary(f"{label}/verify[{cores}]", every, 0.0, **extra)
+        result["ops_per_sec"] = aggregate
+        result["per_core"] = aggregate / cores
+        result["scaling"] = aggregate / (cores * single["ops_per_sec"])
+        results.append(result)
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# JWT                                                                         #
+# --------------------------------------------------------------------------- #
+def bench_jwt(controller, seconds: float) -> List[Dict[str, Any]]:
+    """:meth:`generate_token` / :meth:`verify_token` en boucle."""
+    user = types.SimpleNamespace(id=1, email="bench@epic-events.test",
+                                 role=types.SimpleNamespace(name="gestion"))
+    label = f"jwt[{controller.jwt_algorithm}]"
+
+    started = time.perf_counter()
+    encodes = _latencies(lambda: controller.generate_token(user), seconds)
+    results = [_summary(f"{label}/encode", encodes,
+                        time.perf_counter() - started)]
+
+    token = controller.generate_token(user)
+    started = time.perf_counter()
+    decodes = _latencies(lambda: controller.verify_token(token), seconds)
+    results.append(_summary(f"{label}/decode", decodes,
+                            time.perf_counter() - started))
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# Connexions de bout en bout                                                  #
+# --------------------------------------------------------------------------- #
+def _login_database(directory: str, users: int) -> str:
+    """Base SQLite de *users* comptes partageant :data:`_PASSWORD`."""
+    from sqlalchemy import create_engine
+
+    from app.models import Base
+    from main.generate_data import generate_data
+
+    path = os.path.join(directory, "auth.db")
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine)
+        generate_data(engine, commercials=users, supports=0,
+                      clients_per_commercial=0, password=_PASSWORD)
+    finally:
+        engine.dispose()
+    return path
+
+
+class _LoginHost:
+    """
+    Une :class:`LoginView` partagée ; compte les refus du limiteur.
+
+    Les refus sont relevés au passage dans ``authenticate_user`` : la vue
+    les affiche puis renvoie None, comme un échec de mot de passe.
+    """
+
+    def __init__(self, db) -> None:
+        from app.authentification.login_throttle import TooManyAttemptsError
+        from app.views.login_view import LoginView
+
+        self.view = LoginView(db)
+        self.throttled = 0
+        self._lock = threading.Lock()
+        controller = self.view.auth_controller
+        authenticate = controller.authenticate_user
+
+        def counting(*args, **kwargs):
+            try:
+                return authenticate(*args, **kwargs)
+            except TooManyAttemptsError:
+                with self._lock:
+                    self.throttled += 1
+                raise
+
+        controller.authenticate_user = counting
+
+    def login(self, email: str) -> bool:
+        return self.view.login_with_credentials_return_user(
+            email, _PASSWORD) is not None
+
+
+def bench_logins(db, emails: List[str], seconds: float,
+                 storms: List[int]) -> List[Dict[str, Any]]:
+    """Connexions séquentielles puis tempêtes de *T* threads."""
+    results = []
+    # La vue affiche ses refus : sortie standard jetée pendant la mesure.
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        host = _LoginHost(db)
+        turn = iter(range(10 ** 9))
+        failed = 0
+
+        def one():
+            nonlocal failed
+            if not host.login(emails[next(turn) % len(emails)]):
+                failed += 1
+
+        started = time.perf_counter()
+        latencies = _latencies(one, seconds)
+        results.append(_summary(
+            "login/sequential", latencies, time.perf_counter() - started,
+            failed=failed - host.throttled, throttled=host.throttled))
+
+        for threads in storms:
+            results.append(_storm(db, emails, seconds, threads))
+    return results
+
+
+def _storm(db, emails: List[str], seconds: float,
+           threads: int) -> Dict[str, Any]:
+    host = _LoginHost(db)
+    barrier = threading.Barrier(threads + 1)
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    failures = [0] * threads
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        n = index
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            if not host.login(emails[n % len(emails)]):
+                failures[index] += 1
+            latencies[index].append(time.perf_counter() - started)
+            n += threads
+
+    pool = [threading.Thread(target=worker, args=(i,))
+            for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    every = [t for per_thread in latencies for t in per_thread]
+    failed = sum(failures)
+    result = _summary(f"login/storm[{threads}]", every, elapsed,
+                      failed=failed - host.throttled,
+                      throttled=host.throttled)
+    # Débit utile : connexions réussies seulement.
+    result["ops_per_sec"] = (len(every) - failed) / elapsed
+    return result
+
+
+def run(seconds: float = 3.0, cores: Optional[int] = None,
+        candidates: Optional[List[Dict[str, int]]] = None,
+        users: int = 50, storms: Optional[List[int]] = None,
+        skip_logins: bool = False) -> Tuple[Dict[str, Any], List[Dict]]:
+    """
+    Exécute le banc.
+
+    Parameters
+    ----------
+    seconds :
+        Durée de chaque mesure.
+    cores :
+        Processus de la mesure Argon2 parallèle (tous les cœurs ; 1 : non).
+    candidates :
+        Paramètres Argon2 à comparer à ceux de l’application.
+    users :
+        Comptes de la base de connexion.
+    storms :
+        Nombres de threads des tempêtes de connexions.
+    skip_logins :
+        Argon2 et JWT seulement (pas de base).
+
+    Returns
+    -------
+    tuple
+        Paramètres effectifs et résultats.
+    """
+    from app.authentification.auth_controller import AuthController
+
+    controller = AuthController()
+    configured = {
+        "time_cost": controller.hasher.time_cost,
+        "memory_cost": controller.hasher.memory_cost,
+        "parallelism": controller.hasher.parallelism,
+    }
+    cores = cores or os.cpu_count() or 1
+    storms = storms if storms is not None else [8, 32]
+
+    results: List[Dict[str, Any]] = []
+    for params in [configured] + list(candidates or []):
+        results += bench_argon2(params, seconds, cores)
+    results += bench_jwt(controller, seconds)
+
+    if not skip_logins:
+        workdir = tempfile.mkdtemp(prefix="epic-auth-bench-")
+        try:
+            db = sqlite_connection(_login_database(workdir, users),
+                                   DB_POOL_SIZE=str(max(storms + [5])))
+            try:
+                from sqlalchemy import select
+
+                from app.models import User
+
+                with db.create_session() as sess:
+                    emails = list(sess.scalars(
+                        select(User.email).order_by(User.id)))
+                results += bench_logins(db, emails, seconds, storms)
+            finally:
+                db.dispose()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    parameters = {
+        "seconds": seconds, "cores": cores, "argon2": configured,
+        "candidates": candidates or [], "users": users, "storms": storms,
+        "jwt_algorithm": controller.jwt_algorithm,
+        "throttle": {key: value for key, value in os.environ.items()
+                     if key.startswith("LOGIN_THROTTLE_")},
+    }
+    return parameters, results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.auth",
+        description="Banc d’essai de l’authentification (Argon2, JWT).")
+    parser.add_argument("--seconds", type=float, default=3.0,
+                        help="durée de chaque mesure (3)")
+    parser.add_argument("--cores", type=int, default=os.cpu_count(),
+                        help="processus de la mesure Argon2 parallèle")
+    parser.add_argument("--argon2", action="append", default=[],
+                        metavar="t=…,m=…,p=…",
+                        help="paramètres candidats (répétable)")
+    parser.add_argument("--users", type=int, default=50,
+                        help="comptes de la base de connexion (50)")
+    parser.add_argument("--storm", default="8,32",
+                        help="threads des tempêtes de connexions (8,32)")
+    parser.add_argument("--no-login", action="store_true",
+                        help="Argon2 et JWT seulement")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    storms = [int(n) for n in args.storm.split(",") if n.strip()]
+    parameters, results = run(
+        args.seconds, args.cores, [parse_argon2(c) for c in args.argon2],
+        args.users, storms, args.no_login)
+    for result in results:
+        if "throttled" in result:
+            sys.stderr.write(f"{result['id']:<24} {result['ops']:>6} "
+                             f"tentatives, {result['throttled']} refusées "
+                             f"par le limiteur, {result['failed']} "
+                             "échecs\n")
+    return finish(args, "auth", parameters, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+# tests/benchmarks/harness.py
+# -*- coding: utf-8 -*-
+"""
+Outillage commun aux bancs d’essai (``python -m tests.benchmarks.<banc>``).
+
+Chaque banc produit une liste de résultats – dictionnaires portant un
+identifiant ``id`` unique et des métriques numériques – puis délègue à
+:func:`finish` :
+
+* écriture d’un rapport JSON (``--output``) : environnement d’exécution,
+  paramètres du banc, résultats ;
+* comparaison avec un rapport de référence (``--baseline``) : toute
+  métrique connue qui se dégrade au‑delà de ``--tolerance`` est signalée
+  et le processus sort avec le code 1 (utilisable en CI) ;
+* ``--save-baseline`` enregistre le rapport courant comme référence.
+
+Les références dépendent de la machine : elles se génèrent sur l’hôte qui
+les compare, jamais ailleurs.
+
+Les jeux de données SQLite (:func:`build_dataset`) sont produits par
+:func:`main.generate_data.generate_data` et conservés d’un passage à
+l’autre dans ``~/.epic_events/bench``.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Sens des métriques comparées ; les autres clés sont informatives
+# (``rows_per_sec`` se déduit de ``seconds`` : le comparer ferait doublon).
+LOWER_IS_BETTER = ("seconds", "p50", "p95", "p99", "peak_bytes")
+HIGHER_IS_BETTER = ("ops_per_sec",)
+
+# En deçà, une variation de durée relève du bruit de mesure.
+_NOISE_SECONDS = 0.002
+
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+# Lignes générées par client : 1 client, ~3 contrats, ~0,7 × 3 × 2 événements.
+_ROWS_PER_CLIENT = 8.2
+_CLIENTS_PER_COMMERCIAL = 100
+
+
+# --------------------------------------------------------------------------- #
+# Mesures                                                                     #
+# --------------------------------------------------------------------------- #
+def parse_size(text: str) -> int:
+    """``"10k"`` → 10 000, ``"1M"`` → 1 000 000, ``"500"`` → 500."""
+    text = text.strip().lower().replace("_", "")
+    factor = _SUFFIXES.get(text[-1:], 1)
+    digits = text[:-1] if factor > 1 else text
+    return int(float(digits) * factor)
+
+
+def size_label(size: int) -> str:
+    """Inverse lisible de :func:`parse_size` (``1000000`` → ``"1m"``)."""
+    for suffix, factor in sorted(_SUFFIXES.items(), key=lambda kv: -kv[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return str(size)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile *q* (0–100) par interpolation linéaire."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(fn: Callable[[], int], repeat: int = 3,
+            memory: bool = True) -> Dict[str, float]:
+    """
+    Chronomètre *fn* et, à part, mesure son pic d’allocations.
+
+    Parameters
+    ----------
+    fn :
+        Opération mesurée ; renvoie le nombre de lignes traitées.
+    repeat :
+        Exécutions chronométrées (la médiane est retenue).
+    memory :
+        Exécution supplémentaire sous :mod:`tracemalloc` (qui ralentit
+        l’interpréteur, d’où une passe séparée).
+
+    Returns
+    -------
+    dict
+        ``rows``, ``seconds`` (médiane), ``min_seconds``,
+        ``rows_per_sec`` et, si *memory*, ``peak_bytes``.
+    """
+    timings = []
+    rows = 0
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        rows = fn()
+        timings.append(time.perf_counter() - started)
+
+    seconds = statistics.median(timings)
+    result = {
+        "rows": rows,
+        "seconds": seconds,
+        "min_seconds": min(timings),
+        "rows_per_sec": rows / seconds if seconds else 0.0,
+    }
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+# --------------------------------------------------------------------------- #
+# Jeux de données                                                             #
+# --------------------------------------------------------------------------- #
+def default_data_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".epic_events", "bench")
+
+
+def build_dataset(directory: str, rows: int, seed: int = 42) -> str:
+    """
+    Chemin d’une base SQLite d’environ *rows* lignes, générée au besoin.
+
+    La base est construite sous un nom temporaire puis renommée : un
+    passage interrompu ne laisse pas de jeu incomplet réutilisable.  Les
+    bancs qui écrivent travaillent sur une copie.
+    """
+    from sqlalchemy import create_engine
+
+    from app.models import Base
+    from main.generate_data import generate_data
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"bench-{size_label(rows)}-{seed}.db")
+    if os.path.exists(path):
+        return path
+
+    clients = max(1.0, rows / _ROWS_PER_CLIENT)
+    commercials = max(2, round(clients / _CLIENTS_PER_COMMERCIAL))
+    partial = path + ".partial"
+    if os.path.exists(partial):
+        os.unlink(partial)
+    engine = create_engine(f"sqlite:///{partial}")
+    try:
+        Base.metadata.create_all(engine)
+        generate_data(engine, commercials=commercials,
+                      supports=max(2, commercials // 4),
+                      clients_per_commercial=clients / commercials,
+                      contracts_per_client=3, events_per_contract=2,
+                      seed=seed, batch_size=20_000)
+    finally:
+        engine.dispose()
+    os.replace(partial, path)
+    return path
+
+
+def sqlite_connection(path: str, **settings: str):
+    """
+    ``DatabaseConnection`` SQLite sur *path*, avec les *pragmas* de
+    l’application ; *settings* complète l’environnement lu par
+    :class:`DatabaseConfig` (ex. ``DB_POOL_SIZE="16"``).
+    """
+    from app.config.database import DatabaseConfig, DatabaseConnection
+
+    env = {"DB_ENGINE": "sqlite", "DB_NAME": path, **settings}
+    saved = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        config = DatabaseConfig()
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return DatabaseConnection(config)
+
+
+# --------------------------------------------------------------------------- #
+# Rapports                                                                    #
+# --------------------------------------------------------------------------- #
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, timeout=5, check=True).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Description de l’hôte, jointe à chaque rapport."""
+    import sqlalchemy
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "revision": _git_revision(),
+    }
+
+
+def make_report(suite: str, parameters: Dict[str, Any],
+                results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "suite": suite,
+        "created": dt.datetime.now(dt.timezone.utc).isoformat(
+            timespec="seconds"),
+        "environment": environment(),
+        "parameters": parameters,
+        "results": results,
+    }
+
+
+def write_report(path: str, report: Dict[str, Any]) -> None:
+    """Écrit *report* (JSON indenté) ; ``-`` désigne la sortie standard."""
+    text = json.dumps(report, indent=2, ensure_ascii=False, sort_keys=True)
+    if path == "-":
+        print(text)
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as out:
+        out.write(text + "\n")
+    os.replace(path + ".tmp", path)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(results: Iterable[Dict[str, Any]], baseline: Dict[str, Any],
+            tolerance: float = 0.2) -> List[str]:
+    """
+    Régressions de *results* par rapport au rapport *baseline*.
+
+    Seuls les identifiants présents des deux côtés sont comparés, hors
+    lignes marquées ``"informational": True`` (affichées mais jamais
+    jugées) ; une métrique régresse lorsqu’elle se dégrade de plus de
+    *tolerance* (fraction) dans son sens défavorable.  Les durées
+    inférieures à quelques millisecondes des deux côtés sont ignorées
+    (bruit).
+
+    Returns
+    -------
+    list[str]
+        Une ligne lisible par régression (vide : aucune).
+    """
+    reference = {r["id"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        ref = reference.get(result["id"])
+        if ref is None or result.get("informational"):
+            continue
+        for key in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            now, before = result.get(key), ref.get(key)
+            if not now or not before:
+                continue
+            if key in LOWER_IS_BETTER:
+                if key != "peak_bytes" and max(now, before) < _NOISE_SECONDS:
+                    continue
+                worse = now > before * (1 + tolerance)
+            else:
+                worse = now < before / (1 + tolerance)
+            if worse:
+                regressions.append(
+                    f"{result['id']} : {key} {_fmt_value(key, before)} → "
+                    f"{_fmt_value(key, now)} ({now / before - 1:+.0%})")
+    return regressions
+
+
+# --------------------------------------------------------------------------- #
+# Ligne de commande                                                           #
+# --------------------------------------------------------------------------- #
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options partagées : sortie JSON, référence, tolérance."""
+    parser.add_argument("--output", "-o", metavar="PATH",
+                        help="rapport JSON (« - » : sortie standard)")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="rapport de référence à comparer")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre ce rapport comme référence "
+                             "(chemin --baseline)")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="dégradation tolérée (fraction, 0.2)")
+
+
+def _fmt_value(key: str, value: float) -> str:
+    if key == "peak_bytes":
+        return f"{value / 1_048_576:.1f} Mio"
+    if key in HIGHER_IS_BETTER or key == "rows_per_sec":
+        return f"{value:,.0f}/s"
+    return f"{value * 1000:.2f} ms"
+
+
+def print_results(results: List[Dict[str, Any]], out=None) -> None:
+    """Résumé tabulaire des résultats sur *out* (stderr par défaut)."""
+    out = out or sys.stderr
+    width = max((len(r["id"]) for r in results), default=10)
+    for result in results:
+        cells = [f"{_fmt_value(key, result[key]):>14}"
+                 for key in LOWER_IS_BETTER + HIGHER_IS_BETTER
+                 + ("rows_per_sec",) if key in result]
+        out.write(f"{result['id']:<{width}}  " + "  ".join(cells) + "\n")
+
+
+def finish(args: argparse.Namespace, suite: str,
+           parameters: Dict[str, Any],
+           results: List[Dict[str, Any]]) -> int:
+    """
+    Rapport, comparaison et code de sortie d’un banc.
+
+    Returns
+    -------
+    int
+        0, ou 1 si une régression est détectée par rapport à la
+        référence.
+    """
+    report = make_report(suite, parameters, results)
+    print_results(results)
+    if args.output:
+        write_report(args.output, report)
+    if not args.baseline:
+        return 0
+    if args.save_baseline:
+        write_report(args.baseline, report)
+        sys.stderr.write(f"Référence enregistrée : {args.baseline}\n")
+        return 0
+    if not os.path.exists(args.baseline):
+        sys.stderr.write(f"Référence absente : {args.baseline} "
+                         "(--save-baseline pour la créer)\n")
+        return 0
+    regressions = compare(results, load_report(args.baseline), args.tolerance)
+    for line in regressions:
+        sys.stderr.write(f"RÉGRESSION {line}\n")
+    if not regressions:
+        sys.stderr.write("Aucune régression par rapport à la référence.\n")
+    return 1 if regressions else 0
@@ -0,0 +1,270 @@
+# tests/benchmarks/readers.py
+# -*- coding: utf-8 -*-
+"""
+Banc d’essai des lectures : ``DataReader`` et ``DataReaderView``.
+
+Pour chaque taille demandée (lignes au total, ``10k``, ``100k``, ``1m``…)
+une base SQLite est générée par :func:`main.generate_data.generate_data`
+– puis conservée dans ``--data-dir`` pour les passages suivants – et les
+opérations suivantes sont mesurées (latence médiane, lignes/s, pic
+d’allocations Python) :
+
+* ``get_all_clients`` / ``get_all_contracts`` / ``get_all_events`` sans
+  filtre (gestion) puis filtrés (``force_filter`` commercial et support) ;
+* le rendu en tableau (``_print_entities``) et ``_fmt`` sur les entités
+  déjà chargées : coût d’affichage seul ;
+* les écrans complets ``display_*`` (requête + rendu), sortie jetée.
+
+Utilisation ::
+
+    python -m tests.benchmarks.readers --sizes 10k,100k,1m \\
+        --output reader.json --baseline tests/benchmarks/baselines/readers.json
+
+``--save-baseline`` fixe la référence ; les passages suivants sortent en
+erreur (code 1) si une mesure se dégrade au‑delà de ``--tolerance``.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from app.config.database import DatabaseConnection
+from app.models import Client, Contract, Event, Role, User
+from tests.benchmarks.harness import (
+    add_common_arguments,
+    build_dataset,
+    default_data_dir,
+    finish,
+    measure,
+    parse_size,
+    size_label,
+    sqlite_connection,
+)
+
+
+class _NullOutput:
+    """Sortie standard jetable (pas un terminal : pas de *pager*)."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def _first_user(db: DatabaseConnection, role: str) -> Dict[str, Any]:
+    with db.create_session() as sess:
+        uid = sess.scalar(select(func.min(User.id)).join(Role)
+                          .where(Role.name == role))
+    return {"id": uid, "role": role, "force_filter": True}
+
+
+# --------------------------------------------------------------------------- #
+# Scénarios                                                                   #
+# --------------------------------------------------------------------------- #
+def _cases(db: DatabaseConnection) -> List[Tuple[str, Callable[[], int]]]:
+    """Couples (nom, opération) ; chaque opération renvoie ses lignes."""
+    from app.controllers.data_reader import DataReader
+    from app.views.data_reader_view import DataReaderView
+    from app.views.data_writer_view import DataWriterView
+
+    reader = DataReader(db)
+    view = DataReaderView(db)
+    writer_view = DataWriterView(db)
+    users = {
+        "gestion": {"id": 0, "role": "gestion"},
+        "commercial": _first_user(db, "commercial"),
+        "support": _first_user(db, "support"),
+    }
+
+    def query(method: str, who: str):
+        def run() -> int:
+            with db.create_session() as sess:
+                return len(getattr(reader, method)(sess, users[who]))
+        return run
+
+    def query_all(method: str) -> list:
+        with db.create_session() as sess:
+            return getattr(reader, method)(sess, users["gestion"])
+
+    # Les écrans ``display_*`` ne renvoient rien : les lignes affichées
+    # sont relevées au passage dans ``_print_entities``.
+    printed: List[int] = []
+    print_entities = view._print_entities
+
+    def counting(model, entities) -> int:
+        count = print_entities(model, entities)
+        printed.append(count)
+        return count
+
+    view._print_entities = counting
+
+    def display(method: str, who: str):
+        def run() -> int:
+            printed.clear()
+            with contextlib.redirect_stdout(_NullOutput()):
+                getattr(view, method)(users[who])
+            return sum(printed)
+        return run
+
+    cases = [
+        ("get_all_clients[gestion]", query("get_all_clients", "gestion")),
+        ("get_all_contracts[gestion]", query("get_all_contracts", "gestion")),
+        ("get_all_events[gestion]", query("get_all_events", "gestion")),
+        ("get_all_clients[commercial]",
+         query("get_all_clients", "commercial")),
+        ("get_all_contracts[commercial]",
+         query("get_all_contracts", "commercial")),
+        ("get_all_events[commercial]", query("get_all_events", "commercial")),
+        ("get_all_events[support]", query("get_all_events", "support")),
+    ]
+
+    for model, method in ((Client, "get_all_clients"),
+                          (Contract, "get_all_contracts"),
+                          (Event, "get_all_events")):
+        name = model.__tablename__
+        entities = _Entities(lambda method=method: query_all(method))
+
+        def table(model=model, entities=entities) -> int:
+            with contextlib.redirect_stdout(_NullOutput()):
+                return print_entities(model, entities.items)
+
+        def fmt(entities=entities) -> int:
+            return sum(1 for entity in entities.items
+                       if writer_view._fmt(entity))
+
+        cases.append((f"render.table[{name}]", _Preloaded(entities, table)))
+        cases.append((f"render._fmt[{name}]", _Preloaded(entities, fmt)))
+
+    cases += [
+        ("display_clients_only[gestion]",
+         display("display_clients_only", "gestion")),
+        ("display_contracts_only[gestion]",
+         display("display_contracts_only", "gestion")),
+        ("display_events_only[gestion]",
+         display("display_events_only", "gestion")),
+        ("display_unsigned_contracts[commercial]",
+         display("display_unsigned_contracts", "commercial")),
+        ("display_unpaid_contracts[commercial]",
+         display("display_unpaid_contracts", "commercial")),
+    ]
+    return cases
+
+
+class _Entities:
+    """Entités d’une table, chargées à la demande puis libérées."""
+
+    def __init__(self, load: Callable[[], list]) -> None:
+        self.load = load
+        self.items: Optional[list] = None
+
+    def prepare(self) -> None:
+        if self.items is None:
+            self.items = self.load()
+
+    def release(self) -> None:
+        self.items = None
+
+
+class _Preloaded:
+    """Opération de rendu sur des entités chargées hors chronométrage."""
+
+    def __init__(self, entities: _Entities,
+                 operation: Callable[[], int]) -> None:
+        self.entities = entities
+        self.operation = operation
+
+    def __call__(self) -> int:
+        return self.operation()
+
+
+def run(sizes: List[int], repeat: int = 3, memory: bool = True,
+        data_dir: Optional[str] = None, seed: int = 42,
+        only: Optional[str] = None) -> Tuple[Dict[str, Any], List[Dict]]:
+    """
+    Exécute le banc pour chaque taille.
+
+    Parameters
+    ----------
+    sizes :
+        Nombre approximatif de lignes (toutes tables) par jeu de données.
+    repeat, memory :
+        Cf. :func:`tests.benchmarks.harness.measure`.
+    data_dir :
+        Dossier des bases générées (``~/.epic_events/bench``).
+    seed :
+        Graine du générateur.
+    only :
+        Sous‑chaîne filtrant les scénarios par nom.
+
+    Returns
+    -------
+    tuple
+        Paramètres (dont le volume réel de chaque table) et résultats.
+    """
+    data_dir = data_dir or default_data_dir()
+    parameters: Dict[str, Any] = {"repeat": repeat, "seed": seed,
+                                  "datasets": {}}
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        label = size_label(size)
+        db = sqlite_connection(build_dataset(data_dir, size, seed))
+        try:
+            with db.create_session() as sess:
+                parameters["datasets"][label] = {
+                    model.__tablename__: sess.scalar(
+                        select(func.count()).select_from(model))
+                    for model in (User, Client, Contract, Event)
+                }
+            loaded: Optional[_Entities] = None
+            for name, operation in _cases(db):
+                if only and only not in name:
+                    continue
+                if isinstance(operation, _Preloaded):
+                    if loaded is not operation.entities:
+                        if loaded is not None:
+                            loaded.release()  # une table en mémoire à la fois
+                        loaded = operation.entities
+                        loaded.prepare()
+                sys.stderr.write(f"  {label} {name}…\n")
+                result = measure(operation, repeat=repeat, memory=memory)
+                results.append({"id": f"{label}/{name}", "size": label,
+                                "case": name, **result})
+            if loaded is not None:
+                loaded.release()
+        finally:
+            db.dispose()
+    return parameters, results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.readers",
+        description="Banc d’essai des lectures (DataReader / vues).")
+    parser.add_argument("--sizes", default="10k",
+                        help="tailles séparées par des virgules "
+                             "(10k,100k,1m)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="sans passe tracemalloc (pic mémoire)")
+    parser.add_argument("--data-dir", default=default_data_dir())
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="filtre sur le nom des scénarios")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    parameters, results = run(sizes, args.repeat, not args.no_memory,
+                              args.data_dir, args.seed, args.only)
+    return finish(args, "readers", parameters, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
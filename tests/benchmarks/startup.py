@@ -0,0 +1,317 @@
+# tests/benchmarks/startup.py
+# -*- coding: utf-8 -*-
+"""
+Banc d’essai du démarrage à froid de ``python -m main``.
+
+Chaque passage lance deux interpréteurs **neufs** :
+
+1. une *sonde* (:data:`_PROBE`) qui rejoue, étape par étape, le chemin de
+   ``cli`` puis ``run`` (:mod:`main.cli`) et horodate chaque phase :
+
+   ==================  ====================================================
+   ``interpreter``     lancement de Python jusqu’à la première ligne
+   ``imports``         ``main.cli`` et ``click``
+   ``env``             lecture du ``.env`` et de la configuration BD
+   ``sentry``          ``init_sentry`` + ``SENTRY_TEST`` éventuel (ping)
+   ``observability``   métriques et profilage (``EPIC_METRICS_*`` …)
+   ``engine``          création de l’*engine* et première connexion
+   ``schema_check``    ``verify_database`` (connectivité, version)
+   ``first_query``     ``warm_reference_cache`` (rôles, annuaire)
+   ``menu``            import et construction de ``CLIInterface``
+   ==================  ====================================================
+
+   Chaque phase inclut les dépendances qu’elle importe la première
+   (SQLAlchemy dans ``engine``, ``sentry_sdk`` dans ``sentry``…) ;
+
+2. la vraie commande ``python -m main`` : le temps jusqu’au premier
+   prompt (``Choix :``) est mesuré de l’extérieur (``first_prompt``),
+   puis ``0`` est envoyé pour quitter.  L’écart avec la somme des phases
+   de la sonde (``unaccounted``) signale une étape oubliée par la sonde.
+
+La base est une base SQLite neuve au schéma à jour (``--env`` : base du
+``.env``).  ``--cold-pyc`` donne à chaque passage un cache de *bytecode*
+vide (``PYTHONPYCACHEPREFIX``) : premier lancement après installation.
+
+Budget : ``--budget-ms`` borne la médiane de ``first_prompt`` et
+``--phase-budget engine=150,sentry=50`` celle des phases ; tout
+dépassement (comme toute régression par rapport à ``--baseline``) fait
+sortir avec le code 1.
+
+Utilisation ::
+
+    python -m tests.benchmarks.startup --runs 10 --budget-ms 1500 \\
+        --output startup.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import select
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from tests.benchmarks.harness import add_common_arguments, finish, percentile
+
+PHASES = ("interpreter", "imports", "env", "sentry", "observability",
+          "engine", "schema_check", "first_query", "menu")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+_PROMPT = b"Choix"
+
+# Rejoue ``cli`` puis ``run`` (main/cli.py) : à tenir à jour avec eux.
+_PROBE = """
+import time
+marks = [("interpreter", time.time())]
+mark = lambda name: marks.append((name, time.time()))
+
+from main.cli import _connection, _sentry_self_test
+mark("imports")
+from app.config.database import DatabaseConfig
+DatabaseConfig()
+mark("env")
+from app.observability.sentry import init_sentry
+init_sentry()
+_sentry_self_test()
+mark("sentry")
+from app.observability.metrics import install_metrics_from_env
+from app.observability.profiling import install_profiling_from_env
+install_metrics_from_env()
+install_profiling_from_env()
+mark("observability")
+conn = _connection()
+conn.engine
+mark("engine")
+from main.migrate import verify_database
+verify_database(conn.engine)
+mark("schema_check")
+from app.controllers.reference_cache import warm_reference_cache
+warm_reference_cache(conn)
+mark("first_query")
+from app.views.cli_interface import CLIInterface
+CLIInterface(conn)
+mark("menu")
+
+import json, sys
+sys.__stdout__.write("\\n@@PROBE " + json.dumps(marks) + "\\n")
+"""
+
+
+# --------------------------------------------------------------------------- #
+# Préparation                                                                 #
+# --------------------------------------------------------------------------- #
+def _fresh_database(directory: str) -> str:
+    """Base SQLite neuve, schéma créé et estampillé à la dernière version."""
+    from sqlalchemy import create_engine
+
+    from app.models import Base
+    from main.migrate import stamp_latest
+
+    path = os.path.join(directory, "startup.db")
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine)
+        stamp_latest(engine)
+    finally:
+        engine.dispose()
+    return path
+
+
+def _child_env(database: Optional[str], pycache: Optional[str]) -> Dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [_ROOT, env.get("PYTHONPATH")]))
+    env["EPIC_PAGER"] = "0"
+    if database:
+        env.update(DB_ENGINE="sqlite", DB_NAME=database)
+    if pycache:
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    return env
+
+
+# --------------------------------------------------------------------------- #
+# Passages                                                                    #
+# --------------------------------------------------------------------------- #
+def probe_phases(env: Dict[str, str], timeout: float = 120.0
+                 ) -> Dict[str, float]:
+    """Durée (s) de chaque phase dans un interpréteur neuf."""
+    spawned = time.time()
+    proc = subprocess.run([sys.executable, "-c", _PROBE], cwd=_ROOT, env=env,
+                          capture_output=True, text=True, timeout=timeout)
+    line = next((ln for ln in proc.stdout.splitlines()
+                 if ln.startswith("@@PROBE ")), None)
+    if proc.returncode or line is None:
+        raise RuntimeError(f"Sonde en échec ({proc.returncode}) :\n"
+                           f"{proc.stderr[-2000:]}")
+    marks = json.loads(line[len("@@PROBE "):])
+    phases, previous = {}, spawned
+    for name, stamp in marks:
+        phases[name] = stamp - previous
+        previous = stamp
+    return phases
+
+
+def first_prompt(env: Dict[str, str], timeout: float = 120.0) -> float:
+    """
+    Temps (s) entre le lancement de ``python -m main`` et son premier
+    prompt ; la CLI est ensuite quittée (``0``).
+    """
+    started = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "main"], cwd=_ROOT,
+                            env=env, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output = b""
+    elapsed = None
+    try:
+        fd = proc.stdout.fileno()
+        while elapsed is None:
+            remaining = timeout - (time.perf_counter() - started)
+            ready, _, _ = select.select([fd], [], [], max(0.0, remaining))
+            if not ready:
+                raise RuntimeError("Pas de prompt après "
+                                   f"{timeout:.0f} s :\n{output[-2000:]!r}")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RuntimeError(
+                    "La CLI s’est arrêtée avant son premier prompt :\n"
+                    + proc.stderr.read().decode(errors="replace")[-2000:])
+            output += chunk
+            if _PROMPT in output:
+                elapsed = time.perf_counter() - started
+        proc.stdin.write(b"0\n")
+        proc.stdin.flush()
+        proc.wait(timeout=30)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            stream.close()
+    return elapsed
+
+
+def _row(case: str, samples: List[float]) -> Dict[str, Any]:
+    return {
+        "id": f"startup/{case}",
+        "case": case,
+        "runs": len(samples),
+        "seconds": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run(runs: int = 5, use_env: bool = False,
+        cold_pyc: bool = False) -> Tuple[Dict[str, Any], List[Dict]]:
+    """
+    Exécute *runs* passages à froid (sonde + vraie commande).
+
+    Returns
+    -------
+    tuple
+        Paramètres et résultats : une ligne par phase, ``probe_total``,
+        ``first_prompt`` et ``unaccounted`` (médianes, p95, extrêmes).
+    """
+    workdir = tempfile.mkdtemp(prefix="epic-startup-bench-")
+    samples: Dict[str, List[float]] = {name: [] for name in PHASES}
+    totals: List[float] = []
+    prompts: List[float] = []
+    try:
+        database = None if use_env else _fresh_database(workdir)
+        for index in range(runs):
+            pycache = None
+            if cold_pyc:
+                pycache = os.path.join(workdir, f"pycache-{index}")
+            phases = probe_phases(_child_env(database, pycache))
+            for name in PHASES:
+                samples[name].append(phases[name])
+            totals.append(sum(phases.values()))
+            if cold_pyc:
+                pycache = os.path.join(workdir, f"pycache-{index}-cli")
+            prompts.append(first_prompt(_child_env(database, pycache)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = [_row(name, values) for name, values in samples.items()]
+    results.append(_row("probe_total", totals))
+    results.append(_row("first_prompt", prompts))
+    unaccounted = _row("unaccounted", [max(0.0, p - t) for p, t
+                                       in zip(prompts, totals)])
+    # Écart informatif : affiché, mais ni budget ni comparaison.
+    unaccounted["informational"] = True
+    results.append(unaccounted)
+    parameters = {"runs": runs, "database": "env" if use_env else "sqlite",
+                  "cold_pyc": cold_pyc}
+    return parameters, results
+
+
+# --------------------------------------------------------------------------- #
+# Budget                                                                      #
+# --------------------------------------------------------------------------- #
+def parse_budgets(text: str) -> Dict[str, float]:
+    """``"engine=150,sentry=50"`` → budgets (ms) par phase."""
+    budgets = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        if name.strip() not in PHASES:
+            raise ValueError(f"Phase inconnue : {name}")
+        budgets[name.strip()] = float(value)
+    return budgets
+
+
+def check_budget(results: List[Dict[str, Any]], total_ms: Optional[float],
+                 phases_ms: Dict[str, float]) -> List[str]:
+    """Dépassements des budgets (médianes), vide si tout est respecté."""
+    budgets = dict(phases_ms)
+    if total_ms is not None:
+        budgets["first_prompt"] = total_ms
+    violations = []
+    for result in results:
+        budget = budgets.get(result["case"])
+        if budget is None or result.get("informational"):
+            continue
+        median_ms = result["seconds"] * 1000
+        if median_ms > budget:
+            violations.append(f"{result['case']} : {median_ms:.0f} ms > "
+                              f"budget {budget:.0f} ms")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.startup",
+        description="Démarrage à froid de python -m main, par phase.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--env", action="store_true",
+                        help="base du .env au lieu d’une base SQLite neuve")
+    parser.add_argument("--cold-pyc", action="store_true",
+                        help="cache de bytecode vide à chaque passage")
+    parser.add_argument("--budget-ms", type=float,
+                        help="budget de la médiane de first_prompt")
+    parser.add_argument("--phase-budget", default="",
+                        metavar="phase=ms,…", help="budgets par phase")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    phase_budgets = parse_budgets(args.phase_budget)
+    parameters, results = run(args.runs, args.env, args.cold_pyc)
+    parameters["budget_ms"] = args.budget_ms
+    parameters["phase_budget_ms"] = phase_budgets
+    status = finish(args, "startup", parameters, results)
+    violations = check_budget(results, args.budget_ms, phase_budgets)
+    for line in violations:
+        sys.stderr.write(f"BUDGET DÉPASSÉ {line}\n")
+    return 1 if violations else status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+# tests/benchmarks/write_load.py
+# -*- coding: utf-8 -*-
+"""
+Générateur de charge en écriture : contention sur ``DataWriter``.
+
+*N* travailleurs (threads ou processus) exécutent en parallèle un mélange
+pondéré d’opérations métier, chacune dans sa propre session, au nom du
+collaborateur propriétaire de la ligne visée (comme le ferait la CLI) :
+
+* ``create_client``   – un commercial crée un client ;
+* ``update_contract`` – le commercial du contrat en modifie le restant dû ;
+* ``create_event``    – le commercial d’un contrat signé crée un événement
+  pour un support tiré au sort (refusé en cas de conflit de planning) ;
+* ``update_event``    – le support assigné (à défaut, le commercial) met à
+  jour participants et notes.
+
+Pour reproduire la contention sur des **lignes chaudes**, ``--hot-rows K``
+concentre une fraction ``--hot-fraction`` des opérations sur les *K*
+premiers contrats / événements.
+
+Chaque échec est classé : ``deadlock`` (MySQL 1213), ``locked``
+(MySQL 1205 « lock wait timeout », SQLite « database is locked » – y
+compris immédiat, lorsqu’une transaction de lecture ne peut devenir
+écriture en mode WAL), ``integrity``
+(:class:`IntegrityError`), ``db_error`` (autre erreur SQL), ``rejected``
+(règle métier : :class:`ValueError` / :class:`PermissionError`) ou
+``other``.  Le rapport donne, par opération et au total : débit des
+opérations réussies, percentiles de latence, nombre et taux d’échecs de
+chaque classe.
+
+Par défaut, la charge porte sur une **copie** d’une base SQLite générée
+(``--rows``) ; ``--env`` vise la base configurée (``.env``, ex. MySQL
+local) et y écrit réellement.
+
+Utilisation ::
+
+    python -m tests.benchmarks.write_load --workers 32 --duration 20 \\
+        --hot-rows 5 --hot-fraction 0.8 --output writes.json
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tests.benchmarks.harness import (
+    add_common_arguments,
+    build_dataset,
+    default_data_dir,
+    finish,
+    parse_size,
+    percentile,
+    size_label,
+    sqlite_connection,
+)
+
+OPERATIONS = ("create_client", "update_contract", "create_event",
+              "update_event")
+DEFAULT_WEIGHTS = ("create_client=1,update_contract=3,create_event=2,"
+                   "update_event=4")
+FAILURES = ("deadlock", "locked", "integrity", "db_error", "rejected",
+            "other")
+
+_MYSQL_DEADLOCK = 1213
+_MYSQL_LOCK_WAIT_TIMEOUT = 1205
+
+
+# --------------------------------------------------------------------------- #
+# Classement des échecs                                                       #
+# --------------------------------------------------------------------------- #
+def classify(err: BaseException) -> str:
+    """Classe d’échec de *err* (cf. :data:`FAILURES`)."""
+    from sqlalchemy.exc import DBAPIError, IntegrityError
+
+    if isinstance(err, IntegrityError):
+        return "integrity"
+    if isinstance(err, DBAPIError):
+        args = getattr(err.orig, "args", ()) or (None,)
+        message = str(err.orig).lower()
+        if args[0] == _MYSQL_DEADLOCK or "deadlock" in message:
+            return "deadlock"
+        if args[0] == _MYSQL_LOCK_WAIT_TIMEOUT or "locked" in message \
+                or "lock wait timeout" in message:
+            return "locked"
+        return "db_error"
+    if isinstance(err, (ValueError, PermissionError)):
+        return "rejected"
+    return "other"
+
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """``"create_client=1,update_event=4"`` → poids par opération."""
+    weights = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Opération inconnue : {name}")
+        weights[name] = float(value)
+    return weights
+
+
+# --------------------------------------------------------------------------- #
+# Cibles                                                                      #
+# --------------------------------------------------------------------------- #
+def load_targets(db) -> Dict[str, list]:
+    """
+    Lignes visées par la charge, en données simples (transmissibles aux
+    processus) : collaborateurs, contrats et événements avec leur
+    propriétaire, triés par identifiant (les premiers sont les « chauds »).
+    """
+    from sqlalchemy import select
+
+    from app.models import Contract, Event, Role, User
+
+    with db.create_session() as sess:
+        users = sess.execute(select(User.id, Role.name).join(Role)).all()
+        contracts = [tuple(row) for row in sess.execute(
+            select(Contract.id, Contract.commercial_id, Contract.total_amount,
+                   Contract.is_signed).order_by(Contract.id))]
+        events = [tuple(row) for row in sess.execute(
+            select(Event.id, Event.support_id, Contract.commercial_id)
+            .join(Contract, Event.contract_id == Contract.id)
+            .order_by(Event.id))]
+    targets = {
+        "commercials": [uid for uid, role in users if role == "commercial"],
+        "supports": [uid for uid, role in users if role == "support"],
+        "contracts": contracts,
+        "signed": [row for row in contracts if row[3]],
+        "events": events,
+    }
+    for key, rows in targets.items():
+        if not rows:
+            raise ValueError(f"Aucune ligne « {key} » : base vide ? "
+                             "(python -m main generate)")
+    return targets
+
+
+def _pick(rows: list, spec: Dict[str, Any], rng: random.Random):
+    hot = min(spec["hot_rows"], len(rows))
+    if hot and rng.random() < spec["hot_fraction"]:
+        return rows[rng.randrange(hot)]
+    return rows[rng.randrange(len(rows))]
+
+
+# --------------------------------------------------------------------------- #
+# Opérations                                                                  #
+# --------------------------------------------------------------------------- #
+def _create_client(writer, sess, targets, spec, rng) -> None:
+    commercial = rng.choice(targets["commercials"])
+    n = rng.randrange(10 ** 9)
+    writer.create_client(sess, {"id": commercial, "role": "commercial"},
+                         f"Charge {n}", f"load{n}@bench.epic-events.test",
+                         "+33100000000", "Bench", None)
+
+
+def _update_contract(writer, sess, targets, spec, rng) -> None:
+    contract_id, commercial, total, _ = _pick(targets["contracts"], spec, rng)
+    writer.update_contract(sess, {"id": commercial, "role": "commercial"},
+                           contract_id,
+                           remaining_amount=round(total * rng.random(), 2))
+
+
+def _create_event(writer, sess, targets, spec, rng) -> None:
+    contract_id, commercial, _, _ = _pick(targets["signed"], spec, rng)
+    start = dt.datetime(2026, 1, 1) + dt.timedelta(
+        days=rng.randrange(365), hours=rng.randrange(8, 20))
+    writer.create_event(sess, {"id": commercial, "role": "commercial"},
+                        contract_id, rng.choice(targets["supports"]),
+                        start, start + dt.timedelta(hours=4),
+                        location="Paris", attendees=rng.randint(10, 500))
+
+
+def _update_event(writer, sess, targets, spec, rng) -> None:
+    event_id, support, commercial = _pick(targets["events"], spec, rng)
+    actor = ({"id": support, "role": "support"} if support
+             else {"id": commercial, "role": "commercial"})
+    writer.update_event(sess, actor, event_id,
+                        attendees=rng.randint(10, 500),
+                        notes=f"maj {rng.randrange(10 ** 6)}")
+
+
+_OPERATIONS: Dict[str, Callable] = {
+    "create_client": _create_client,
+    "update_contract": _update_contract,
+    "create_event": _create_event,
+    "update_event": _update_event,
+}
+
+
+# --------------------------------------------------------------------------- #
+# Travailleurs                                                                #
+# --------------------------------------------------------------------------- #
+def _connection(spec: Dict[str, Any]):
+    if spec["sqlite"]:
+        return sqlite_connection(spec["sqlite"],
+                                 DB_POOL_SIZE=str(spec["pool_size"]))
+    from app.config.database import DatabaseConfig, DatabaseConnection
+
+    os.environ.setdefault("DB_POOL_SIZE", str(spec["pool_size"]))
+    return DatabaseConnection(DatabaseConfig())
+
+
+def _worker(spec: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """
+    Boucle d’un travailleur (thread ou processus).
+
+    Returns
+    -------
+    dict
+        ``latencies`` (s) et ``failures`` (Counter) par opération,
+        ``ended`` : horodatage (``time.time``) de la dernière opération.
+    """
+    from app.controllers.data_writer import DataWriter
+
+    db = _connection(spec)
+    writer = DataWriter(db)
+    targets = spec["targets"]
+    rng = random.Random(spec["seed"] * 1_000 + index)
+    names = list(spec["weights"])
+    weights = [spec["weights"][name] for name in names]
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    failures: Dict[str, Counter] = {name: Counter() for name in names}
+
+    delay = spec["start_at"] - time.time()
+    if delay > 0:
+        time.sleep(delay)                  # départ simultané
+    deadline = spec["start_at"] + spec["duration"]
+    done = 0
+    while (done < spec["ops"]) if spec["ops"] else (time.time() < deadline):
+        name = rng.choices(names, weights)[0]
+        started = time.perf_counter()
+        with db.create_session() as sess:
+            try:
+                _OPERATIONS[name](writer, sess, targets, spec, rng)
+            except Exception as err:       # classé, jamais propagé
+                sess.rollback()
+                failures[name][classify(err)] += 1
+        latencies[name].append(time.perf_counter() - started)
+        done += 1
+    ended = time.time()
+    if spec["sqlite"]:
+        db.dispose()
+    return {"latencies": latencies, "failures": failures, "ended": ended}
+
+
+def _summary(case: str, label: str, latencies: List[float],
+             failures: Counter, elapsed: float) -> Dict[str, Any]:
+    attempts = len(latencies)
+    failed = sum(failures.values())
+    result = {
+        "id": f"{label}/{case}",
+        "case": case,
+        "ops": attempts,
+        "ok": attempts - failed,
+        "ops_per_sec": (attempts - failed) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "failures": {kind: failures.get(kind, 0) for kind in FAILURES},
+    }
+    for kind in FAILURES:
+        result[f"{kind}_rate"] = (failures.get(kind, 0) / attempts
+                                  if attempts else 0.0)
+    return result
+
+
+def run(workers: int = 8, processes: bool = False, duration: float = 10.0,
+        ops: int = 0, weights: Optional[Dict[str, float]] = None,
+        hot_rows: int = 0, hot_fraction: float = 0.5, rows: int = 10_000,
+        data_dir: Optional[str] = None, seed: int = 42,
+        use_env: bool = False) -> Tuple[Dict[str, Any], List[Dict]]:
+    """
+    Lance la charge et agrège les mesures des travailleurs.
+
+    Parameters
+    ----------
+    workers :
+        Nombre de travailleurs simultanés.
+    processes :
+        Processus plutôt que threads (pas de GIL partagé).
+    duration, ops :
+        Durée de la charge (s), ou – si *ops* > 0 – opérations par
+        travailleur.
+    weights :
+        Poids relatifs des opérations (:data:`DEFAULT_WEIGHTS`).
+    hot_rows, hot_fraction :
+        Lignes chaudes et part des opérations qui les visent.
+    rows, data_dir, seed :
+        Jeu SQLite généré (copié avant la charge).
+    use_env :
+        Cible la base configurée par l’environnement au lieu de SQLite.
+
+    Returns
+    -------
+    tuple
+        Paramètres effectifs et résultats (un par opération + ``all``).
+    """
+    weights = weights or parse_weights(DEFAULT_WEIGHTS)
+    workdir = None
+    spec: Dict[str, Any] = {
+        "sqlite": None, "pool_size": workers, "duration": duration,
+        "ops": ops, "weights": weights, "hot_rows": hot_rows,
+        "hot_fraction": hot_fraction, "seed": seed,
+    }
+    try:
+        if not use_env:
+            workdir = tempfile.mkdtemp(prefix="epic-write-load-")
+            spec["sqlite"] = os.path.join(workdir, "load.db")
+            shutil.copyfile(build_dataset(data_dir or default_data_dir(),
+                                          rows, seed), spec["sqlite"])
+        db = _connection(spec)
+        try:
+            spec["targets"] = load_targets(db)
+        finally:
+            if spec["sqlite"]:
+                db.dispose()
+
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        spec["start_at"] = time.time() + (1.0 if processes else 0.1)
+        with executor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_worker, [spec] * workers,
+                                     range(workers)))
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    elapsed = max(o["ended"] for o in outcomes) - spec["start_at"]
+    label = (f"{'processes' if processes else 'threads'}{workers}"
+             f"-hot{hot_rows}")
+    results = []
+    every: List[float] = []
+    total: Counter = Counter()
+    for name in weights:
+        latencies = [t for o in outcomes for t in o["latencies"][name]]
+        failures: Counter = sum((o["failures"][name] for o in outcomes),
+                                Counter())
+        every += latencies
+        total += failures
+        results.append(_summary(name, label, latencies, failures, elapsed))
+    results.append(_summary("all", label, every, total, elapsed))
+
+    parameters = {
+        "workers": workers, "mode": "processes" if processes else "threads",
+        "duration": duration, "ops_per_worker": ops, "weights": weights,
+        "hot_rows": hot_rows, "hot_fraction": hot_fraction, "seed": seed,
+        "database": "env" if use_env else f"sqlite:{size_label(rows)}",
+        "elapsed": elapsed,
+    }
+    return parameters, results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.write_load",
+        description="Charge concurrente en écriture (DataWriter).")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--processes", action="store_true",
+                        help="processus au lieu de threads")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="durée de la charge en secondes (10)")
+    parser.add_argument("--ops", type=int, default=0,
+                        help="opérations par travailleur (remplace "
+                             "--duration)")
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS,
+                        help=f"mélange d’opérations ({DEFAULT_WEIGHTS})")
+    parser.add_argument("--hot-rows", type=int, default=0,
+                        help="lignes chaudes (0 : aucune)")
+    parser.add_argument("--hot-fraction", type=float, default=0.5,
+                        help="part des opérations sur les lignes chaudes")
+    parser.add_argument("--rows", default="10k",
+                        help="taille du jeu SQLite généré (10k)")
+    parser.add_argument("--data-dir", default=default_data_dir())
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--env", action="store_true",
+                        help="base configurée (.env) au lieu d’une copie "
+                             "SQLite : les écritures y sont conservées")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.env:
+        sys.stderr.write("Attention : la charge écrit dans la base "
+                         "configurée.\n")
+    parameters, results = run(
+        args.workers, args.processes, args.duration, args.ops,
+        parse_weights(args.weights), args.hot_rows, args.hot_fraction,
+        parse_size(args.rows), args.data_dir, args.seed, args.env)
+    for result in results:
+        failures = ", ".join(f"{kind}={count}" for kind, count
+                             in result["failures"].items() if count)
+        sys.stderr.write(f"{result['id']:<40} {result['ops']:>7} ops  "
+                         f"{failures or 'aucun échec'}\n")
+    return finish(args, "write_load", parameters, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
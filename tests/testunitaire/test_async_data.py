@@ -0,0 +1,120 @@
+# tests/testunitaire/test_async_data.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – couche d’accès asynchrone.
+
+Vérifie :
+    • la dérivation de l’URL asynchrone (aiomysql / aiosqlite) ;
+    • les lectures concurrentes de :meth:`AsyncDataReader.overview` ;
+    • le partage des règles de droits et de validation avec DataWriter.
+
+Les scénarios asynchrones sont ignorés si ``aiosqlite`` ou ``greenlet``
+ne sont pas installés.
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.config.database import DatabaseConfig
+
+HAS_ASYNC_DRIVER = all(
+    importlib.util.find_spec(name) for name in ("aiosqlite", "greenlet"))
+
+GESTION = {"id": 1, "role": "gestion"}
+COMMERCIAL = {"id": 2, "role": "commercial"}
+
+
+class AsyncUrlTestCase(unittest.TestCase):
+    """URL asynchrone dérivée de la configuration synchrone."""
+
+    def _config(self, **env):
+        with patch.dict(os.environ, env):
+            return DatabaseConfig()
+
+    def test_mysql_uses_aiomysql(self):
+        cfg = self._config(DB_ENGINE="mysql+pymysql", DB_USER="u",
+                           DB_PASSWORD="p", DB_HOST="h", DB_PORT="3306",
+                           DB_NAME="epic")
+        self.assertEqual(cfg.async_database_url(),
+                         "mysql+aiomysql://u:p@h:3306/epic")
+
+    def test_sqlite_uses_aiosqlite(self):
+        cfg = self._config(DB_ENGINE="sqlite", DB_NAME="/tmp/epic.db")
+        self.assertEqual(cfg.async_database_url(),
+                         "sqlite+aiosqlite:////tmp/epic.db")
+
+    def test_unknown_dialect_rejected(self):
+        cfg = self._config(DB_ENGINE="oracle", DB_NAME="x")
+        with self.assertRaises(ValueError):
+            cfg.async_database_url()
+
+
+@unittest.skipUnless(HAS_ASYNC_DRIVER, "aiosqlite / greenlet absents")
+class AsyncControllersTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base SQLite fichier servie par aiosqlite."""
+
+    async def asyncSetUp(self):
+        from app.config.async_database import AsyncDatabaseConnection
+        from app.controllers.async_data import AsyncDataReader, AsyncDataWriter
+        from app.models import Base, Client, Role, User
+
+        self._dir = tempfile.TemporaryDirectory()
+        with patch.dict(os.environ, {
+            "DB_ENGINE": "sqlite",
+            "DB_NAME": os.path.join(self._dir.name, "async.db"),
+        }):
+            self.db = AsyncDatabaseConnection(DatabaseConfig())
+        async with self.db.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with self.db.create_session() as sess:
+            sess.add_all([Role(id=1, name="commercial"),
+                          Role(id=3, name="gestion")])
+            sess.add_all([
+                User(id=1, employee_number="G001", first_name="G",
+                     last_name="U", email="g@x.io", password_hash="h",
+                     role_id=3),
+                User(id=2, employee_number="C001", first_name="C",
+                     last_name="U", email="c@x.io", password_hash="h",
+                     role_id=1),
+            ])
+            sess.add(Client(id=1, full_name="A", email="a@x.io",
+                            commercial_id=2))
+            await sess.commit()
+
+        self.reader = AsyncDataReader(self.db)
+        self.writer = AsyncDataWriter(self.db)
+
+    async def asyncTearDown(self):
+        await self.db.dispose()
+        self._dir.cleanup()
+
+    async def test_overview_reads_concurrently(self):
+        """Trois lectures, trois sessions, un seul appel."""
+        result = await self.reader.overview(GESTION)
+        self.assertEqual(len(result["clients"]), 1)
+        self.assertEqual(result["contracts"], [])
+        self.assertEqual(result["events"], [])
+
+    async def test_writer_shares_validation(self):
+        """Les règles métier de DataWriter s’appliquent telles quelles."""
+        async with self.db.create_session() as sess:
+            with self.assertRaises(ValueError):
+                await self.writer.create_contract(sess, GESTION, 1, 100, 200)
+            with self.assertRaises(PermissionError):
+                await self.writer.delete_user(sess, COMMERCIAL, "G001")
+
+            contract = await self.writer.create_contract(
+                sess, GESTION, 1, 100, 40)
+        self.assertEqual(contract.remaining_amount, 40)
+
+        async with self.db.create_session() as sess:
+            contracts = await self.reader.get_all_contracts(sess, COMMERCIAL)
+        self.assertEqual([c.id for c in contracts], [contract.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+# tests/testunitaire/test_batch_runner.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – mode lot (:class:`BatchRunner`, ``python -m main batch``).
+
+Vérifie :
+    • qu’un lot de 300 opérations n’emprunte qu’une connexion et valide
+      une transaction toutes les ``batch_size`` opérations ;
+    • qu’une ligne en échec est annulée seule (SAVEPOINT) ;
+    • qu’une erreur emportant la transaction englobante (deadlock MySQL)
+      requalifie en échec les lignes déjà passées du lot ;
+    • qu’un collaborateur renommé dans un lot perdu ne reste pas dans
+      l’annuaire en cache ;
+    • la traduction des numéros d’employé (réaffectation de supports) ;
+    • ``--dry-run`` et le bilan de la commande.
+"""
+
+import datetime as dt
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from sqlalchemy.exc import OperationalError
+
+from app.authentification.auth_controller import AuthController
+from app.authentification.token_store import TokenStore
+from app.config.database import DatabaseConfig, DatabaseConnection
+from app.controllers.batch_runner import BatchRunner
+from app.controllers.data_writer import DataWriter
+from app.controllers.reference_cache import reference_cache
+from app.models import Base, Client, Contract, Event, Role, User
+from main.cli import cli
+
+GESTION = {"id": 1, "role": "gestion"}
+
+
+class BatchRunnerTestCase(unittest.TestCase):
+    """Base SQLite fichier : 300 contrats signés, 300 événements."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        env = {"DB_ENGINE": "sqlite",
+               "DB_NAME": os.path.join(self._dir.name, "batch.db")}
+        with patch.dict(os.environ, env):
+            self.db = DatabaseConnection(DatabaseConfig())
+        Base.metadata.create_all(self.db.engine)
+        start = dt.datetime(2025, 6, 1, 9)
+        with self.db.create_session() as sess:
+            sess.add_all([Role(id=1, name="commercial"),
+                          Role(id=2, name="support"),
+                          Role(id=3, name="gestion")])
+            for uid, number, role in ((1, "G001", 3), (2, "C001", 1),
+                                      (3, "S001", 2)):
+                sess.add(User(id=uid, employee_number=number, first_name="F",
+                              last_name="L", email=f"{number}@x.io",
+                              password_hash="h", role_id=role))
+            sess.add(Client(id=1, full_name="A", email="a@x.io",
+                            commercial_id=2))
+            for i in range(1, 301):
+                sess.add(Contract(id=i, client_id=1, commercial_id=2,
+                                  total_amount=100, remaining_amount=100,
+                                  is_signed=True))
+                day = start + dt.timedelta(days=i)   # un par jour
+                sess.add(Event(id=i, contract_id=i, date_start=day,
+                               date_end=day + dt.timedelta(hours=4)))
+            sess.commit()
+
+    def tearDown(self):
+        self.db.dispose()
+        self._dir.cleanup()
+
+    def _lines(self, op, ids, **fields):
+        return [json.dumps({"op": op, "id": i, **fields}) for i in ids]
+
+    def test_one_connection_batched_commits(self):
+        """300 opérations, lots de 100 : 3 commits, un seul emprunt."""
+        before = self.db.pool_stats()["checkouts"]
+        results = []
+        summary = BatchRunner(self.db, batch_size=100).run(
+            GESTION, self._lines("update_contract", range(1, 301),
+                                 remaining_amount=0), results.append)
+
+        self.assertEqual((summary["ok"], summary["failed"]), (300, 0))
+        self.assertEqual(summary["commits"], 3)
+        self.assertGreater(summary["per_second"], 0)
+        self.assertEqual(self.db.pool_stats()["checkouts"] - before, 1)
+        self.assertEqual(results[0].detail, "update_contract #1")
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.query(Contract).filter(
+                Contract.remaining_amount == 0).count(), 300)
+
+    def test_failed_line_is_rolled_back_alone(self):
+        """Clé étrangère invalide, JSON invalide, op inconnue : 3 échecs."""
+        lines = [
+            json.dumps({"op": "update_contract", "id": 1,
+                        "remaining_amount": 0}),
+            json.dumps({"op": "update_contract", "id": 2,
+                        "remaining_amount": 0, "client_id": 999}),
+            "{pas du json",
+            "",
+            "# commentaire",
+            json.dumps({"op": "drop_table"}),
+            json.dumps({"op": "update_contract", "id": 3,
+                        "remaining_amount": 0}),
+        ]
+        results = []
+        summary = BatchRunner(self.db).run(GESTION, lines, results.append)
+
+        self.assertEqual((summary["ok"], summary["failed"]), (2, 3))
+        self.assertEqual([r.line for r in results if not r.ok], [2, 3, 6])
+        self.assertIn("FOREIGN KEY", results[1].detail)
+        with self.db.create_session() as sess:
+            remaining = {c.id: c.remaining_amount
+                         for c in sess.query(Contract).filter(
+                             Contract.id.in_([1, 2, 3]))}
+        self.assertEqual(remaining, {1: 0, 2: 100, 3: 0})
+
+    def test_lost_outer_transaction_fails_pending_lines(self):
+        """Deadlock à la ligne 3 : lignes 1‑2 annulées, rapportées en échec."""
+        original = DataWriter.update_contract
+
+        def deadlock_on_3(writer, sess, cur, contract_id, **updates):
+            if contract_id == 3:
+                # Comme MySQL : toute la transaction est annulée.
+                sess.connection().exec_driver_sql("ROLLBACK")
+                raise OperationalError("UPDATE", {}, Exception("Deadlock"))
+            return original(writer, sess, cur, contract_id, **updates)
+
+        results = []
+        with patch.object(DataWriter, "update_contract", deadlock_on_3):
+            summary = BatchRunner(self.db).run(
+                GESTION, self._lines("update_contract", range(1, 6),
+                                     remaining_amount=0), results.append)
+
+        self.assertEqual((summary["ok"], summary["failed"]), (2, 3))
+        self.assertEqual([r.ok for r in results],
+                         [False, False, False, True, True])
+        self.assertIn("transaction englobante perdue", results[0].detail)
+        with self.db.create_session() as sess:
+            paid = sorted(c.id for c in sess.query(Contract).filter(
+                Contract.remaining_amount == 0))
+        self.assertEqual(paid, [4, 5])
+
+    def test_lost_batch_does_not_leave_renamed_collaborator_cached(self):
+        """S001 → S009, relu par le lot, puis transaction perdue."""
+
+        def deadlock(writer, sess, cur, contract_id, **updates):
+            sess.connection().exec_driver_sql("ROLLBACK")
+            raise OperationalError("UPDATE", {}, Exception("Deadlock"))
+
+        lines = [json.dumps({"op": "update_user", "id": 3,
+                             "employee_number": "S009"}),
+                 json.dumps({"op": "update_event", "id": 1,
+                             "support": "S009"}),
+                 json.dumps({"op": "update_contract", "id": 1,
+                             "remaining_amount": 0})]
+        with patch.object(DataWriter, "update_contract", deadlock):
+            summary = BatchRunner(self.db).run(GESTION, lines)
+        self.assertEqual(summary["ok"], 0)
+
+        cache = reference_cache(self.db)
+        with self.db.create_session() as sess:
+            self.assertIsNone(cache.collaborator(sess, "S009"))
+            self.assertEqual(cache.collaborator(sess, "S001").id, 3)
+
+    def test_reassign_support_by_employee_number(self):
+        """``support`` : numéro d’employé → ``support_id``."""
+        summary = BatchRunner(self.db, batch_size=50).run(
+            GESTION, self._lines("update_event", range(1, 201),
+                                 support="S001"))
+        self.assertEqual(summary["ok"], 200)
+        with self.db.create_session() as sess:
+            self.assertEqual(
+                sess.query(Event).filter_by(support_id=3).count(), 200)
+
+    def test_cli_dry_run(self):
+        """``batch --dry-run`` : bilan affiché, base inchangée."""
+        token_file = os.path.join(self._dir.name, "token")
+        with patch.dict(os.environ, {"EPIC_TOKEN_FILE": token_file,
+                                     "JWT_SECRET": "x" * 40}):
+            with self.db.create_session() as sess:
+                TokenStore().save(
+                    AuthController().generate_token(sess.get(User, 1)))
+            source = "\n".join(self._lines("update_contract", range(1, 11),
+                                           remaining_amount=0))
+            with patch("main.cli._connection", return_value=self.db):
+                result = CliRunner().invoke(
+                    cli, ["batch", "-", "--dry-run", "-q"], input=source)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("10 OK, 0 en échec", result.output)
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.query(Contract).filter(
+                Contract.remaining_amount == 0).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
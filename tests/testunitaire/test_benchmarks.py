@@ -0,0 +1,205 @@
+# tests/testunitaire/test_benchmarks.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – bancs d’essai (``tests.benchmarks``).
+
+Les bancs tournent ici sur de très petits volumes : seuls le format des
+rapports et la détection de régressions sont vérifiés, pas les chiffres.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from tests.benchmarks import auth, readers, startup, write_load
+from tests.benchmarks.harness import compare, parse_size, size_label
+
+
+class HarnessTestCase(unittest.TestCase):
+    """Tailles lisibles et comparaison à une référence."""
+
+    def test_sizes(self):
+        self.assertEqual(parse_size("10k"), 10_000)
+        self.assertEqual(parse_size("1M"), 1_000_000)
+        self.assertEqual(parse_size("2.5k"), 2_500)
+        self.assertEqual(size_label(100_000), "100k")
+        self.assertEqual(size_label(1_000_000), "1m")
+        self.assertEqual(size_label(1_500), "1500")
+
+    def test_compare_flags_only_real_regressions(self):
+        baseline = {"results": [
+            {"id": "a", "seconds": 0.100, "peak_bytes": 1000},
+            {"id": "b", "seconds": 0.0005},
+            {"id": "c", "ops_per_sec": 1000.0},
+        ]}
+        results = [
+            {"id": "a", "seconds": 0.110, "peak_bytes": 2000},   # mémoire
+            {"id": "b", "seconds": 0.0010},                      # bruit
+            {"id": "c", "ops_per_sec": 500.0},                   # débit
+            {"id": "new", "seconds": 9.0},                       # inconnu
+            {"id": "b", "seconds": 9.0, "informational": True},  # affiché
+        ]
+        regressions = compare(results, baseline, tolerance=0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("a : peak_bytes"))
+        self.assertTrue(regressions[1].startswith("c : ops_per_sec"))
+
+
+class ReaderBenchmarkTestCase(unittest.TestCase):
+    """Banc des lectures sur quelques centaines de lignes."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.data_dir = os.path.join(self._dir.name, "data")
+
+    def _main(self, *argv):
+        with redirect_stderr(StringIO()):
+            return readers.main(["--sizes", "400", "--repeat", "1",
+                                 "--data-dir", self.data_dir, *argv])
+
+    def test_report_and_baseline(self):
+        output = os.path.join(self._dir.name, "report.json")
+        baseline = os.path.join(self._dir.name, "baseline.json")
+        self.assertEqual(self._main("--output", output,
+                                    "--baseline", baseline,
+                                    "--save-baseline"), 0)
+
+        with open(output, encoding="utf-8") as fh:
+            report = json.load(fh)
+        self.assertEqual(report["suite"], "readers")
+        self.assertGreater(report["parameters"]["datasets"]["400"]["events"],
+                           0)
+        by_case = {r["case"]: r for r in report["results"]}
+        for case in ("get_all_clients[gestion]", "get_all_events[support]",
+                     "render._fmt[contracts]", "render.table[events]",
+                     "display_unpaid_contracts[commercial]"):
+            self.assertIn(case, by_case)
+        self.assertEqual(by_case["get_all_events[gestion]"]["rows"],
+                         by_case["display_events_only[gestion]"]["rows"])
+        self.assertGreater(by_case["get_all_events[gestion]"]["peak_bytes"],
+                           0)
+        self.assertEqual(os.listdir(self.data_dir), ["bench-400-42.db"])
+
+        # Référence artificiellement sobre : régression signalée.
+        with open(baseline, encoding="utf-8") as fh:
+            reference = json.load(fh)
+        for result in reference["results"]:
+            result["peak_bytes"] //= 10
+        with open(baseline, "w", encoding="utf-8") as fh:
+            json.dump(reference, fh)
+        self.assertEqual(self._main("--baseline", baseline,
+                                    "--only", "get_all_events[gestion]"), 1)
+
+
+class _MySQLError(Exception):
+    """Erreur DBAPI factice portant un code MySQL."""
+
+
+class WriteLoadTestCase(unittest.TestCase):
+    """Générateur de charge en écriture, quelques opérations."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+
+    def test_classify(self):
+        deadlock = OperationalError("UPDATE", {}, _MySQLError(
+            1213, "Deadlock found when trying to get lock"))
+        timeout = OperationalError("UPDATE", {}, _MySQLError(
+            1205, "Lock wait timeout exceeded"))
+        busy = OperationalError("UPDATE", {}, Exception("database is locked"))
+        duplicate = IntegrityError("INSERT", {}, _MySQLError(1062, "dup"))
+        self.assertEqual(write_load.classify(deadlock), "deadlock")
+        self.assertEqual(write_load.classify(timeout), "locked")
+        self.assertEqual(write_load.classify(busy), "locked")
+        self.assertEqual(write_load.classify(duplicate), "integrity")
+        self.assertEqual(write_load.classify(PermissionError()), "rejected")
+        self.assertEqual(write_load.classify(KeyError()), "other")
+        with self.assertRaises(ValueError):
+            write_load.parse_weights("drop_table=1")
+
+    def test_threads_on_hot_rows(self):
+        """4 threads × 15 opérations, toutes sur 2 lignes chaudes."""
+        parameters, results = write_load.run(
+            workers=4, ops=15, hot_rows=2, hot_fraction=1.0, rows=400,
+            data_dir=self._dir.name)
+        by_case = {r["case"]: r for r in results}
+        self.assertEqual(set(by_case), set(write_load.OPERATIONS) | {"all"})
+        total = by_case["all"]
+        self.assertEqual(total["id"], "threads4-hot2/all")
+        self.assertEqual(total["ops"], 60)
+        self.assertEqual(total["ok"] + sum(total["failures"].values()), 60)
+        self.assertGreater(total["ok"], 0)
+        # Seule la création d’événement peut être refusée (conflit de
+        # planning du support tiré au sort) : les acteurs sont les bons.
+        for case in ("create_client", "update_contract", "update_event"):
+            self.assertEqual(by_case[case]["failures"]["rejected"], 0)
+        self.assertLessEqual(total["p50"], total["p99"])
+        self.assertEqual(parameters["hot_rows"], 2)
+        # Le jeu mis en cache n’est pas modifié : la charge vise une copie.
+        self.assertEqual(os.listdir(self._dir.name), ["bench-400-42.db"])
+
+    def test_processes(self):
+        """Mode processus : mêmes agrégats."""
+        _, results = write_load.run(
+            workers=2, processes=True, ops=5, rows=400,
+            weights={"update_event": 1.0}, data_dir=self._dir.name)
+        self.assertEqual([r["case"] for r in results],
+                         ["update_event", "all"])
+        self.assertEqual(results[-1]["ops"], 10)
+
+
+class AuthBenchmarkTestCase(unittest.TestCase):
+    """Banc d’authentification, mesures minimales."""
+
+    def test_parse_argon2(self):
+        self.assertEqual(auth.parse_argon2("t=2,m=19456,p=1"),
+                         {"time_cost": 2, "memory_cost": 19456,
+                          "parallelism": 1})
+        with self.assertRaises(ValueError):
+            auth.parse_argon2("x=1")
+
+    def test_run(self):
+        cheap = {"time_cost": 1, "memory_cost": 1024, "parallelism": 1}
+        parameters, results = auth.run(seconds=0.01, cores=1,
+                                       candidates=[cheap], users=3,
+                                       storms=[2])
+        by_id = {r["id"]: r for r in results}
+        self.assertIn("argon2[t1-m1024-p1]/verify[1]", by_id)
+        self.assertIn("jwt[HS256]/decode", by_id)
+        sequential = by_id["login/sequential"]
+        self.assertGreaterEqual(sequential["ops"], 3)
+        self.assertEqual(sequential["failed"], 0)   # mot de passe correct
+        self.assertEqual(by_id["login/storm[2]"]["failed"], 0)
+        self.assertEqual(parameters["argon2"]["memory_cost"], 65536)
+
+
+class StartupBenchmarkTestCase(unittest.TestCase):
+    """Un passage à froid : sonde par phase et vraie commande."""
+
+    def test_phases_and_budget(self):
+        _, results = startup.run(runs=1)
+        by_case = {r["case"]: r for r in results}
+        for phase in startup.PHASES:
+            self.assertGreater(by_case[phase]["seconds"], 0)
+        self.assertGreater(by_case["first_prompt"]["seconds"],
+                           by_case["interpreter"]["seconds"])
+        self.assertTrue(by_case["unaccounted"]["informational"])
+        self.assertIn("seconds", by_case["unaccounted"])
+
+        self.assertEqual(startup.check_budget(results, 60_000, {}), [])
+        [violation] = startup.check_budget(
+            results, None, startup.parse_budgets("engine=0"))
+        self.assertTrue(violation.startswith("engine : "))
+        with self.assertRaises(ValueError):
+            startup.parse_budgets("warp=10")
+
+
+if __name__ == "__main__":
+    unittest.main()
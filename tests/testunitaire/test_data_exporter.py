@@ -0,0 +1,124 @@
+# tests/testunitaire/test_data_exporter.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – export en flux (:class:`DataExporter`).
+
+Vérifie :
+    • les formats CSV et NDJSON, compressés ou non ;
+    • le périmètre (``force_filter`` d’un commercial) ;
+    • l’instantané : une ligne insérée pendant l’export n’apparaît pas ;
+    • l’absence de fichier ``.part`` après un export interrompu ;
+    • une mémoire de pointe indépendante du volume exporté.
+"""
+
+import csv
+import gzip
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+from app.config.database import DatabaseConfig, DatabaseConnection
+from app.controllers.data_exporter import DataExporter
+from app.models import Base, Client, Contract
+from main.generate_data import generate_data
+
+GESTION = {"id": 999, "role": "gestion"}
+
+
+class DataExporterTestCase(unittest.TestCase):
+    """Base SQLite fichier alimentée par le générateur synthétique."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self._dir.name, "out")
+        env = {"DB_ENGINE": "sqlite",
+               "DB_NAME": os.path.join(self._dir.name, "export.db")}
+        with patch.dict(os.environ, env):
+            self.db = DatabaseConnection(DatabaseConfig())
+        Base.metadata.create_all(self.db.engine)
+        self.counts = generate_data(self.db.engine, commercials=4,
+                                    supports=2, clients_per_commercial=10)
+        self.exporter = DataExporter(self.db, chunk_size=50)
+
+    def tearDown(self):
+        self.db.dispose()
+        self._dir.cleanup()
+
+    def test_csv_and_gzip_ndjson(self):
+        """Toutes les lignes, en‑tête CSV, NDJSON compressé lisible."""
+        paths = self.exporter.export(GESTION, self.out)
+        with open(paths["contracts"], newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+        self.assertEqual(len(rows), self.counts["contracts"])
+        self.assertIn("remaining_amount", rows[0])
+
+        paths = self.exporter.export(GESTION, self.out, ["events"],
+                                     fmt="ndjson", compress=True)
+        self.assertTrue(paths["events"].endswith("events.ndjson.gz"))
+        with gzip.open(paths["events"], "rt", encoding="utf-8") as fh:
+            events = [json.loads(line) for line in fh]
+        self.assertEqual(len(events), self.counts["events"])
+        self.assertRegex(events[0]["date_start"], r"^\d{4}-\d\d-\d\dT")
+
+    def test_commercial_scope(self):
+        """``force_filter`` : uniquement les clients du commercial."""
+        with self.db.create_session() as sess:
+            commercial_id = sess.query(Client.commercial_id).first()[0]
+            expected = sess.query(Client).filter_by(
+                commercial_id=commercial_id).count()
+        cur = {"id": commercial_id, "role": "commercial",
+               "force_filter": True}
+
+        paths = self.exporter.export(cur, self.out, ["clients"])
+        with open(paths["clients"], newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+        self.assertEqual(len(rows), expected)
+        self.assertEqual({r["commercial_id"] for r in rows},
+                         {str(commercial_id)})
+
+    def test_consistent_snapshot(self):
+        """Un contrat créé après l’export des clients est ignoré."""
+        def insert_contract(table, _count):
+            if table == "clients":
+                with self.db.create_session() as sess:
+                    sess.add(Contract(client_id=1, commercial_id=1,
+                                      total_amount=1, remaining_amount=1))
+                    sess.commit()
+
+        paths = self.exporter.export(GESTION, self.out,
+                                     ["clients", "contracts"],
+                                     progress=insert_contract)
+        with open(paths["contracts"], newline="", encoding="utf-8") as fh:
+            self.assertEqual(sum(1 for _ in fh) - 1, self.counts["contracts"])
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.query(Contract).count(),
+                             self.counts["contracts"] + 1)
+
+    def test_failed_export_leaves_no_part_file(self):
+        """Erreur en cours d’écriture : rien ne reste dans la destination."""
+        with patch.object(DataExporter, "_write",
+                          side_effect=OSError("disque plein")):
+            with self.assertRaises(OSError):
+                self.exporter.export(GESTION, self.out, ["clients"])
+        self.assertEqual(os.listdir(self.out), [])
+
+    def test_memory_does_not_grow_with_volume(self):
+        """Dix fois plus de lignes : mémoire de pointe comparable."""
+        def peak():
+            tracemalloc.start()
+            self.exporter.export(GESTION, self.out, fmt="ndjson")
+            value = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return value
+
+        small = peak()
+        generate_data(self.db.engine, commercials=36, supports=0,
+                      clients_per_commercial=10, seed=7)
+        self.assertLess(peak(), small * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
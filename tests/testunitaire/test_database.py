@@ -22,8 +22,9 @@ class TestDatabaseConnection(unittest.TestCase):
         self.db_connection = DatabaseConnection(self.db_config)
 
     def tearDown(self) -> None:
-        # Ferme proprement l’engine pour libérer les ressources.
-        self.db_connection.engine.dispose()
+        # Ferme proprement l’engine (s’il a été créé) pour libérer les
+        # ressources.
+        self.db_connection.dispose()
 
     def test_session_creation(self) -> None:
         """Une session doit pouvoir être ouverte puis fermée."""
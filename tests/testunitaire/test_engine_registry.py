@@ -0,0 +1,81 @@
+# tests/testunitaire/test_engine_registry.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – registre d’engines partagé.
+
+Vérifie :
+    • qu’une même URL (et mêmes options) renvoie le même *engine* ;
+    • que deux DatabaseConnection sur la même configuration partagent
+      engine, pool et métriques, et que la mise en route n’a lieu qu’une
+      fois ;
+    • que des pragmas SQLite différents donnent deux engines ;
+    • que :func:`dispose_all` vide le registre.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.config import engine_registry
+from app.config.database import DatabaseConfig, DatabaseConnection
+
+
+class EngineRegistryTestCase(unittest.TestCase):
+    """Fichier SQLite temporaire ; registre vidé après chaque test."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "registry.db")
+        self.url = f"sqlite:///{self.path}"
+
+    def tearDown(self):
+        engine_registry.dispose_all()
+        self._dir.cleanup()
+
+    def test_same_url_same_engine(self):
+        """Mêmes URL et options : un seul engine ; options ≠ : deux."""
+        first = engine_registry.get_engine(self.url, pool_size=2)
+        self.assertIs(engine_registry.get_engine(self.url, pool_size=2), first)
+        self.assertIsNot(
+            engine_registry.get_engine(self.url, pool_size=3), first)
+
+    def test_connections_share_engine_and_warm_up_once(self):
+        """Deux connexions, un engine, une seule mise en route."""
+        env = {"DB_ENGINE": "sqlite", "DB_NAME": self.path,
+               "DB_POOL_WARMUP": "2"}
+        with patch.dict(os.environ, env):
+            first = DatabaseConnection(DatabaseConfig())
+            second = DatabaseConnection(DatabaseConfig())
+
+        self.assertIs(first.engine, second.engine)
+        self.assertIs(first.pool_metrics, second.pool_metrics)
+        self.assertEqual(first.pool_stats()["connects"], 2)
+        self.assertEqual(first.pool_stats()["checked_in"], 2)
+
+        with second.create_session() as sess:
+            sess.connection()
+        self.assertEqual(first.pool_stats()["connects"], 2)
+
+    def test_setup_settings_are_part_of_the_key(self):
+        """Même URL, pragmas différents : chaque config a son engine."""
+        env = {"DB_ENGINE": "sqlite", "DB_NAME": self.path}
+        with patch.dict(os.environ, env):
+            default = DatabaseConnection(DatabaseConfig())
+        with patch.dict(os.environ, dict(env, SQLITE_BUSY_TIMEOUT="123")):
+            patient = DatabaseConnection(DatabaseConfig())
+
+        self.assertIsNot(default.engine, patient.engine)
+        with patient.engine.connect() as conn:
+            timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        self.assertEqual(timeout, 123)
+
+    def test_dispose_all_clears_registry(self):
+        """Après :func:`dispose_all`, un nouvel engine est créé."""
+        first = engine_registry.get_engine(self.url)
+        engine_registry.dispose_all()
+        self.assertIsNot(engine_registry.get_engine(self.url), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+# tests/testunitaire/test_event_calendar.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – calendrier des événements et doubles affectations.
+
+Vérifie :
+    • la requête de chevauchement de :meth:`DataReader.get_calendar` ;
+    • son plan d’exécution (index ``ix_events_support_period``) ;
+    • le refus d’affecter un support à deux événements simultanés
+      (exception sérialisable), y compris face à un événement long ;
+    • la migration 2 (création de l’index) et le planning en CLI.
+"""
+
+import pickle
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.data_reader import DataReader
+from app.controllers.data_writer import DataWriter, PlanningConflictError
+from app.models import Base
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.event import Event
+from app.models.role import Role
+from app.models.user import User
+from app.views.data_reader_view import DataReaderView
+from app.views.data_writer_view import DataWriterView
+from main.migrate import _stamp, current_version, migrate
+
+GESTION = {"id": 1, "role": "gestion"}
+SUPPORT = {"id": 2, "role": "support"}
+
+
+class DummyDBConnection:
+    """Connexion BD factice : fournit uniquement `create_session()`."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.SessionLocal = sessionmaker(bind=engine)
+
+    def create_session(self):
+        return self.SessionLocal()
+
+
+class EventCalendarTestCase(unittest.TestCase):
+    """Deux supports, trois événements du support S001 en juin 2025."""
+
+    def setUp(self):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        self.db = DummyDBConnection(engine)
+        self.addCleanup(engine.dispose)
+        self.session = self.db.create_session()
+        self.addCleanup(self.session.close)
+
+        self.session.add_all([Role(id=1, name="commercial"),
+                              Role(id=2, name="support"),
+                              Role(id=3, name="gestion")])
+        for uid, number, role in ((1, "G001", 3), (2, "S001", 2),
+                                  (3, "S002", 2), (4, "C001", 1)):
+            self.session.add(User(id=uid, employee_number=number,
+                                  first_name="F", last_name="L",
+                                  email=f"{number}@x.io", password_hash="h",
+                                  role_id=role))
+        self.session.add(Client(id=1, full_name="A", email="a@x.io",
+                                commercial_id=4))
+        self.session.add(Contract(id=1, client_id=1, commercial_id=4,
+                                  total_amount=100, remaining_amount=0,
+                                  is_signed=True))
+        self.session.add_all([
+            # 30/05 → 02/06 : déborde sur le début de la semaine.
+            Event(id=1, contract_id=1, support_id=2,
+                  date_start=datetime(2025, 5, 30, 9),
+                  date_end=datetime(2025, 6, 2, 12)),
+            Event(id=2, contract_id=1, support_id=2,
+                  date_start=datetime(2025, 6, 4, 10),
+                  date_end=datetime(2025, 6, 4, 18)),
+            # Semaine suivante.
+            Event(id=3, contract_id=1, support_id=2,
+                  date_start=datetime(2025, 6, 10, 10),
+                  date_end=datetime(2025, 6, 10, 18)),
+            Event(id=4, contract_id=1, support_id=3,
+                  date_start=datetime(2025, 6, 4, 10),
+                  date_end=datetime(2025, 6, 4, 18)),
+        ])
+        self.session.commit()
+
+        self.reader = DataReader(self.db)
+        self.writer = DataWriter(self.db)
+        self.week = (datetime(2025, 6, 2), datetime(2025, 6, 8, 23, 59, 59))
+
+    # ------------------------------------------------------------------ #
+    # Lecture                                                            #
+    # ------------------------------------------------------------------ #
+    def test_calendar_overlap(self):
+        ids = [ev.id for ev in self.reader.get_calendar(
+            self.session, GESTION, *self.week)]
+        self.assertEqual(ids, [1, 2, 4])
+
+        ids = [ev.id for ev in self.reader.get_calendar(
+            self.session, GESTION, *self.week, support_id=2)]
+        self.assertEqual(ids, [1, 2])
+
+        own = dict(SUPPORT, id=3, force_filter=True)
+        ids = [ev.id for ev in self.reader.get_calendar(
+            self.session, own, *self.week, support_id=2)]
+        self.assertEqual(ids, [])
+
+        with self.assertRaises(ValueError):
+            self.reader.get_calendar(self.session, GESTION,
+                                     self.week[1], self.week[0])
+        with self.assertRaises(PermissionError):
+            self.reader.get_calendar(self.session, {}, *self.week)
+
+    def test_calendar_uses_support_period_index(self):
+        stmt = self.reader.calendar_query(GESTION, *self.week, support_id=2)
+        sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+        with self.db.engine.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.execute(
+                text("EXPLAIN QUERY PLAN " + sql)))
+        self.assertIn("ix_events_support_period", plan)
+
+    # ------------------------------------------------------------------ #
+    # Écriture                                                           #
+    # ------------------------------------------------------------------ #
+    def test_create_event_rejects_double_booking(self):
+        with self.assertRaises(PlanningConflictError) as ctx:
+            self.writer.create_event(
+                self.session, GESTION, 1, 2,
+                datetime(2025, 6, 4, 17), datetime(2025, 6, 4, 20))
+        self.assertEqual(ctx.exception.event_id, 2)
+        self.assertIn("#2", str(ctx.exception))
+        copy = pickle.loads(pickle.dumps(ctx.exception))
+        self.assertEqual(str(copy), str(ctx.exception))
+
+        # Autre support, ou même support le lendemain : accepté.
+        self.writer.create_event(self.session, GESTION, 1, 3,
+                                 datetime(2025, 6, 10), datetime(2025, 6, 10))
+        self.writer.create_event(self.session, GESTION, 1, 2,
+                                 datetime(2025, 6, 5), datetime(2025, 6, 5))
+        self.assertEqual(self.session.query(Event).count(), 6)
+
+    def test_update_event_rejects_double_booking(self):
+        with self.assertRaises(PlanningConflictError):
+            self.writer.update_event(self.session, GESTION, 4, support_id=2)
+        self.session.rollback()
+        with self.assertRaises(PlanningConflictError) as ctx:
+            self.writer.update_event(self.session, SUPPORT, 3,
+                                     date_start=datetime(2025, 6, 4, 8))
+        self.assertEqual(ctx.exception.event_id, 2)
+        self.session.rollback()
+
+        # L’événement ne se chevauche pas lui‑même ; retrait du support libre.
+        self.writer.update_event(self.session, SUPPORT, 2,
+                                 date_end=datetime(2025, 6, 4, 20))
+        self.writer.update_event(self.session, GESTION, 4, support_id=None)
+        self.writer.update_event(self.session, GESTION, 4, support_id=2,
+                                 date_start=datetime(2025, 6, 6, 9),
+                                 date_end=datetime(2025, 6, 6, 12))
+        self.assertEqual(self.session.get(Event, 4).support_id, 2)
+
+    def test_long_event_still_blocks_and_stays_editable(self):
+        """Aucune durée maximale : un événement de 46 jours compte."""
+        self.session.add(Event(id=5, contract_id=1, support_id=3,
+                               date_start=datetime(2025, 7, 1),
+                               date_end=datetime(2025, 8, 15)))
+        self.session.commit()
+        with self.assertRaises(PlanningConflictError) as ctx:
+            self.writer.create_event(
+                self.session, GESTION, 1, 3,
+                datetime(2025, 8, 10, 9), datetime(2025, 8, 10, 18))
+        self.assertEqual(ctx.exception.event_id, 5)
+        self.writer.update_event(self.session, GESTION, 5, notes="Salon")
+        self.assertEqual(self.session.get(Event, 5).notes, "Salon")
+
+    # ------------------------------------------------------------------ #
+    # Migration et CLI                                                   #
+    # ------------------------------------------------------------------ #
+    def test_migration_creates_index(self):
+        engine = self.db.engine
+        next(iter(Event.__table__.indexes)).drop(engine)
+        with engine.begin() as conn:
+            _stamp(conn, 1, "Schéma initial")
+
+        self.assertEqual(migrate(engine), [2, 3])
+        with engine.connect() as conn:
+            self.assertEqual(current_version(conn), 3)
+        names = [ix["name"] for ix in inspect(engine).get_indexes("events")]
+        self.assertIn("ix_events_support_period", names)
+
+    def test_cli_support_week(self):
+        writer_v = DataWriterView(self.db)
+        with patch("builtins.input", side_effect=["s001", "2025-06-05"]), \
+                redirect_stdout(StringIO()):
+            query = writer_v.ask_support_week(GESTION)
+        self.assertEqual(query, (2,) + self.week[:1]
+                         + (datetime(2025, 6, 8, 23, 59, 59, 999999),))
+
+        # Double affectation antérieure au contrôle : signalée.
+        self.session.add(Event(id=5, contract_id=1, support_id=2,
+                               date_start=datetime(2025, 6, 4, 14),
+                               date_end=datetime(2025, 6, 4, 16)))
+        self.session.commit()
+        out = StringIO()
+        with redirect_stdout(out):
+            count = DataReaderView(self.db).display_support_calendar(
+                SUPPORT, *query)
+        self.assertEqual(count, 3)
+        self.assertIn("#5", out.getvalue())
+        self.assertIn("2 événement(s) en conflit", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
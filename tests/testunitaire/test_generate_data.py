@@ -0,0 +1,90 @@
+# tests/testunitaire/test_generate_data.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – générateur de données synthétiques.
+
+Vérifie :
+    • le déterminisme (même graine → mêmes lignes) ;
+    • la cohérence des clés (contrat ↔ client ↔ commercial, événements
+      uniquement sur contrats signés) ;
+    • qu’un second passage s’ajoute sans collision d’identifiants ;
+    • qu’un seul hachage de mot de passe est calculé.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, func, select
+
+from app.models import Base, Client, Contract, Event, User
+from main.generate_data import generate_data
+
+SMALL = {"commercials": 3, "supports": 2, "clients_per_commercial": 4,
+         "contracts_per_client": 2, "events_per_contract": 2,
+         "batch_size": 7}
+
+
+class GenerateDataTestCase(unittest.TestCase):
+    """Bases SQLite mémoire ; petits volumes, petits lots."""
+
+    def _engine(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        return engine
+
+    def _rows(self, engine, model):
+        with engine.connect() as conn:
+            return conn.execute(
+                select(model.__table__).order_by(model.id)).all()
+
+    def test_same_seed_same_data(self):
+        """Deux bases, même graine : contenu identique (hors hachage)."""
+        first, second = self._engine(), self._engine()
+        generate_data(first, seed=7, **SMALL)
+        generate_data(second, seed=7, **SMALL)
+        for model in (Client, Contract, Event):
+            self.assertEqual(self._rows(first, model),
+                             self._rows(second, model))
+
+    def test_referential_consistency(self):
+        """Les lignes générées respectent les règles métier."""
+        engine = self._engine()
+        report = generate_data(engine, seed=1, **SMALL)
+        self.assertEqual(report["users"], 5)
+
+        with engine.connect() as conn:
+            mismatched = conn.scalar(
+                select(func.count()).select_from(Contract)
+                .join(Client, Contract.client_id == Client.id)
+                .where(Contract.commercial_id != Client.commercial_id))
+            unsigned_events = conn.scalar(
+                select(func.count()).select_from(Event)
+                .join(Contract, Event.contract_id == Contract.id)
+                .where(Contract.is_signed.is_(False)))
+            overpaid = conn.scalar(
+                select(func.count()).select_from(Contract)
+                .where(Contract.remaining_amount > Contract.total_amount))
+            events = conn.scalar(select(func.count()).select_from(Event))
+        self.assertEqual((mismatched, unsigned_events, overpaid), (0, 0, 0))
+        self.assertEqual(events, report["events"])
+
+    def test_second_run_appends(self):
+        """Identifiants repris après le maximum existant."""
+        engine = self._engine()
+        first = generate_data(engine, seed=1, **SMALL)
+        second = generate_data(engine, seed=2, **SMALL)
+        with engine.connect() as conn:
+            users = conn.scalar(select(func.count()).select_from(User))
+        self.assertEqual(users, first["users"] + second["users"])
+
+    def test_single_password_hash(self):
+        """Argon2 n’est sollicité qu’une fois, quel que soit le volume."""
+        with patch("argon2.PasswordHasher.hash",
+                   return_value="$argon2$fake") as hash_:
+            generate_data(self._engine(), seed=3, **SMALL)
+        hash_.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
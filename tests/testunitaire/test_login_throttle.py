@@ -0,0 +1,176 @@
+# tests/testunitaire/test_login_throttle.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – limitation du débit des connexions.
+
+Vérifie :
+    • le refus d’une tentative une fois le seau e‑mail vidé ;
+    • l’absence de tout hachage Argon2 pour une tentative refusée ;
+    • la restitution des jetons après une connexion réussie ;
+    • le partage de l’état via la table ``login_throttle`` (double
+      précision, refus si la course à la création est perdue, nouvel
+      essai après un deadlock MySQL).
+"""
+
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from app.models import Base, LoginThrottleBucket
+from app.models.role import Role
+from app.authentification.auth_controller import AuthController
+from app.authentification.login_throttle import (
+    BucketPolicy,
+    LoginThrottle,
+    SqlThrottleStore,
+    TooManyAttemptsError,
+)
+
+
+class _FakeClock:
+    """Horloge manipulable pour simuler l’écoulement du temps."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class LoginThrottleTestCase(unittest.TestCase):
+    """Scénarios de *credential stuffing* sur une base SQLite mémoire."""
+
+    # ------------------------------------------------------------------ #
+    # SET‑UP / TEAR‑DOWN                                                 #
+    # ------------------------------------------------------------------ #
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:", echo=False)
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        role = Role(name="commercial", description="Test")
+        self.session.add(role)
+        self.session.commit()
+
+        self.clock = _FakeClock()
+        self.throttle = LoginThrottle(
+            email_policy=BucketPolicy(2, 1),
+            source_policy=BucketPolicy(10, 10),
+            clock=self.clock,
+        )
+        self.auth = AuthController(throttle=self.throttle)
+        self.auth.register_user(
+            self.session, "EMP1", "Ana", "Lyse", "ana@example.com",
+            "GoodPassword", role.id,
+        )
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+        self.engine.dispose()
+
+    # ------------------------------------------------------------------ #
+    # TESTS                                                              #
+    # ------------------------------------------------------------------ #
+    def test_rejected_before_hashing(self):
+        """Au‑delà du *burst*, la tentative est refusée sans appel Argon2."""
+        for _ in range(2):
+            self.assertIsNone(self.auth.authenticate_user(
+                self.session, "ana@example.com", "bad"))
+
+        with patch.object(self.auth, "hasher") as hasher:
+            with self.assertRaises(TooManyAttemptsError) as ctx:
+                self.auth.authenticate_user(
+                    self.session, "ana@example.com", "GoodPassword")
+            hasher.verify.assert_not_called()
+        self.assertGreater(ctx.exception.retry_after, 0)
+
+        # Une minute plus tard, un jeton est de nouveau disponible.
+        self.clock.now += 60
+        self.assertIsNotNone(self.auth.authenticate_user(
+            self.session, "ana@example.com", "GoodPassword"))
+
+    def test_success_gives_tokens_back(self):
+        """Les connexions réussies ne vident pas le seau."""
+        for _ in range(5):
+            self.assertIsNotNone(self.auth.authenticate_user(
+                self.session, "ana@example.com", "GoodPassword"))
+
+    def test_source_bucket_spans_emails(self):
+        """Un balayage de comptes depuis une même source est limité."""
+        self.throttle.source_policy = BucketPolicy(3, 1)
+        for i in range(3):
+            self.auth.authenticate_user(
+                self.session, f"x{i}@example.com", "bad", source="bot")
+        with self.assertRaises(TooManyAttemptsError):
+            self.auth.authenticate_user(
+                self.session, "x9@example.com", "bad", source="bot")
+        # Une autre source n’est pas affectée.
+        self.assertIsNone(self.auth.authenticate_user(
+            self.session, "x9@example.com", "bad", source="human"))
+
+    def test_sql_store_is_shared(self):
+        """Deux limiteurs SQL partagent le même état via la table."""
+        policy = BucketPolicy(1, 1)
+        first = LoginThrottle(SqlThrottleStore(), policy, policy, self.clock)
+        second = LoginThrottle(SqlThrottleStore(), policy, policy, self.clock)
+
+        first.acquire(self.session, "ana@example.com", "host")
+        with self.assertRaises(TooManyAttemptsError):
+            second.acquire(self.session, "ana@example.com", "host")
+        self.assertEqual(
+            self.session.query(LoginThrottleBucket).count(), 2)
+
+    def test_sql_store_double_precision(self):
+        """MySQL : DOUBLE, pas FLOAT (arrondi de l’horodatage epoch)."""
+        ddl = str(CreateTable(LoginThrottleBucket.__table__).compile(
+            dialect=mysql.dialect()))
+        self.assertEqual(ddl.count("DOUBLE NOT NULL"), 2)
+        self.assertNotIn("FLOAT", ddl)
+
+    def test_sql_store_fails_closed_on_lost_race(self):
+        """Deux courses perdues : tentative refusée, pas laissée passer."""
+        policy = BucketPolicy(5, 60)
+        error = IntegrityError("INSERT", {}, Exception("duplicate"))
+        with patch.object(Session, "commit", side_effect=error):
+            wait = SqlThrottleStore().take(
+                self.engine, "email:x@example.com", policy, 1000.0)
+        self.assertEqual(wait, 1.0)
+
+    def test_sql_store_retries_after_deadlock(self):
+        """Deadlock (1213) au premier essai : relu puis décompté."""
+        policy = BucketPolicy(5, 60)
+        original = Session.commit
+        deadlock = OperationalError(
+            "INSERT", {}, Exception(1213, "Deadlock found"))
+        calls = []
+
+        def commit(sess):
+            calls.append(sess)
+            if len(calls) == 1:
+                raise deadlock
+            return original(sess)
+
+        with patch.object(Session, "commit", commit):
+            wait = SqlThrottleStore().take(
+                self.engine, "email:x@example.com", policy, 1000.0)
+        self.assertEqual((wait, len(calls)), (0.0, 2))
+        with Session(self.engine) as sess:
+            self.assertEqual(
+                sess.get(LoginThrottleBucket, "email:x@example.com").tokens,
+                4.0)
+
+        other = OperationalError("SELECT", {}, Exception(2006, "gone away"))
+        with patch.object(Session, "commit", side_effect=other), \
+                self.assertRaises(OperationalError):
+            SqlThrottleStore().take(
+                self.engine, "email:y@example.com", policy, 1000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
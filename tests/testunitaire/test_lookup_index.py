@@ -0,0 +1,177 @@
+# tests/testunitaire/test_lookup_index.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – index de recherche (:class:`LookupIndex`).
+
+Vérifie :
+    • la complétion par préfixe (casse / accents ignorés, filtre de rôle) ;
+    • les suggestions sur saisie approximative et le classement MRU ;
+    • la mise à jour de l’index aux *commits* (et pas aux *rollbacks*) ;
+    • en mode lot, seule la validation de la transaction englobante
+      compte ; un changement de numéro d’employé retire l’ancienne clé ;
+    • la suggestion « Vouliez‑vous dire » de DataWriterView ;
+    • des temps de réponse de l’ordre de la microseconde sur ~40 000
+      entités.
+"""
+
+import json
+import timeit
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.batch_runner import BatchRunner
+from app.controllers.data_writer import DataWriter
+from app.controllers.lookup_index import LookupIndex
+from app.models import Base, Client, Contract, Role, User
+from app.views.data_writer_view import DataWriterView
+from main.generate_data import generate_data
+
+GESTION = {"id": 1, "role": "gestion"}
+
+
+class _DummyDB:
+    """Connexion SQLite mémoire exposant ``create_session``."""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://")
+        self.Session = sessionmaker(bind=self.engine)
+
+    def create_session(self):
+        return self.Session()
+
+
+class LookupIndexTestCase(unittest.TestCase):
+    """Un gestionnaire, deux supports, trois clients, un contrat."""
+
+    def setUp(self):
+        self.db = _DummyDB()
+        self.addCleanup(self.db.engine.dispose)
+        Base.metadata.create_all(self.db.engine)
+        with self.db.create_session() as sess:
+            sess.add_all([Role(id=2, name="support"),
+                          Role(id=3, name="gestion")])
+            for uid, number, first, last, role in (
+                (1, "G001", "Gina", "Gestion", 3),
+                (2, "S001", "Hélène", "Dubois", 2),
+                (3, "S002", "Hugo", "Durand", 2),
+            ):
+                sess.add(User(id=uid, employee_number=number,
+                              first_name=first, last_name=last,
+                              email=f"{first.lower()}@x.io",
+                              password_hash="h", role_id=role))
+            for cid, name, company in ((1, "Kevin Casey", "Acme"),
+                                       (2, "Kévin Durand", "Globex"),
+                                       (3, "Ann Smith", None)):
+                sess.add(Client(id=cid, full_name=name, company_name=company,
+                                email=f"client{cid}@x.io", commercial_id=1))
+            sess.add(Contract(id=7, client_id=1, commercial_id=1,
+                              total_amount=10, remaining_amount=10))
+            sess.commit()
+        with self.db.create_session() as sess:
+            self.index = LookupIndex().load(sess)
+        self.addCleanup(self.index.close)
+
+    def _keys(self, entries):
+        return [e.key for e in entries]
+
+    def test_prefix_completion(self):
+        """Préfixe sur nom, prénom, numéro ; accents et casse ignorés."""
+        self.assertEqual(self._keys(self.index.complete("client", "kev")),
+                         [1, 2])
+        self.assertEqual(self._keys(self.index.complete("client", "DUR")),
+                         [2])
+        self.assertEqual(self._keys(self.index.complete("user", "hel")),
+                         ["S001"])
+        self.assertEqual(
+            self._keys(self.index.complete("user", "s", role="support")),
+            ["S001", "S002"])
+        self.assertEqual(self.index.complete("contract", "casey")[0].label,
+                         "7 – Kevin Casey")
+
+    def test_fuzzy_suggestions_and_mru(self):
+        """Faute de frappe → suggestion ; la dernière clé utilisée d’abord."""
+        self.assertEqual(self._keys(self.index.suggest("user", "Dubios")),
+                         ["S001"])
+        self.assertEqual(self.index.suggest("client", "zzzz"), [])
+
+        self.assertEqual(self._keys(self.index.complete("client", "k")),
+                         [1, 2])
+        self.index.touch("client", 2)
+        self.assertEqual(self._keys(self.index.complete("client", "k")),
+                         [2, 1])
+
+    def test_index_follows_commits(self):
+        """Création validée : indexée ; annulée : ignorée ; suppression."""
+        writer = DataWriter(self.db)
+        with self.db.create_session() as sess:
+            writer.create_client(sess, GESTION, "Zoé Zola", "zoe@x.io",
+                                 None, None, 1)
+        self.assertEqual(len(self.index.complete("client", "zola")), 1)
+
+        with self.db.create_session() as sess:
+            sess.add(Client(full_name="Yann Yole", email="y@x.io",
+                            commercial_id=1))
+            sess.flush()
+            sess.rollback()
+        self.assertEqual(self.index.complete("client", "yole"), [])
+
+        with self.db.create_session() as sess:
+            writer.delete_user(sess, GESTION, "S002")
+        self.assertEqual(self._keys(self.index.complete("user", "s")),
+                         ["S001"])
+
+    def test_batch_applies_only_committed_changes(self):
+        """Lot annulé (dry‑run) : rien d’indexé ; lot validé : indexé."""
+        line = json.dumps({"op": "create_client", "full_name": "Xavier Xu",
+                           "email": "xx@x.io", "phone": None,
+                           "company_name": None, "commercial_id": 1})
+        BatchRunner(self.db).run(GESTION, [line], dry_run=True)
+        self.assertEqual(self.index.complete("client", "xavier"), [])
+
+        BatchRunner(self.db).run(GESTION, [line])
+        self.assertEqual(len(self.index.complete("client", "xavier")), 1)
+
+    def test_renamed_employee_number_drops_old_key(self):
+        """Nouveau numéro indexé, ancien retiré."""
+        writer = DataWriter(self.db)
+        with self.db.create_session() as sess:
+            writer.update_user(sess, GESTION, 2, employee_number="S009")
+        self.assertEqual(self._keys(self.index.complete("user", "s")),
+                         ["S002", "S009"])
+
+    def test_view_did_you_mean(self):
+        """Support mal saisi : le message propose le bon numéro."""
+        view = DataWriterView(self.db)
+        with redirect_stdout(StringIO()) as out:
+            view.assign_support_cli(GESTION, event_id=1, support_emp="S01")
+        self.assertIn("Support introuvable", out.getvalue())
+        self.assertIn("Vouliez‑vous dire : S001", out.getvalue())
+
+
+class LookupIndexSpeedTestCase(unittest.TestCase):
+    """~40 000 entités générées : recherches en quelques µs."""
+
+    def test_lookups_are_fast(self):
+        db = _DummyDB()
+        self.addCleanup(db.engine.dispose)
+        Base.metadata.create_all(db.engine)
+        generate_data(db.engine, commercials=100, supports=20,
+                      clients_per_commercial=100, events_per_contract=0)
+        with db.create_session() as sess:
+            index = LookupIndex().load(sess)
+        self.addCleanup(index.close)
+        self.assertGreater(len(index), 30_000)
+
+        for call in (lambda: index.complete("client", "ali"),
+                     lambda: index.complete("user", "s0000", role="support"),
+                     lambda: index.suggest("client", "Alcie Martn")):
+            per_call = timeit.timeit(call, number=100) / 100
+            self.assertLess(per_call, 0.002)
+
+
+if __name__ == "__main__":
+    unittest.main()
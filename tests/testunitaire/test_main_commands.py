@@ -0,0 +1,86 @@
+# tests/testunitaire/test_main_commands.py
+# -*- coding: utf-8 -*-
+"""
+Tests des commandes ``python -m main`` (init / migrate / seed / run).
+
+Vérifie :
+    • que ``run`` refuse un schéma absent ou obsolète sans rien écrire ;
+    • que ``migrate`` met à niveau une base existante non versionnée ;
+    • que ``run`` lance l’interface sans réinitialiser la base.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Role
+from main.cli import cli
+from main.migrate import LATEST_VERSION, current_version, migrate
+
+
+class _DummyDB:
+    """Connexion SQLite mémoire exposant ``engine`` et ``create_session``."""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        self.Session = sessionmaker(bind=self.engine)
+
+    def create_session(self):
+        return self.Session()
+
+
+class MainCommandsTestCase(unittest.TestCase):
+    """Scénarios de lancement sur une base SQLite en mémoire."""
+
+    def setUp(self):
+        self.db = _DummyDB()
+        self.runner = CliRunner()
+        patcher = patch("main.cli._connection", return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.engine.dispose()
+
+    def test_run_refuses_missing_schema(self):
+        """Sans schéma, ``run`` échoue et ne crée aucune table."""
+        result = self.runner.invoke(cli, ["run"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Schéma absent", result.output)
+        self.assertEqual(inspect(self.db.engine).get_table_names(), [])
+
+    def test_migrate_upgrades_legacy_database(self):
+        """Une base créée avant le suivi des versions est adoptée."""
+        Base.metadata.create_all(self.db.engine)
+        Base.metadata.tables["schema_version"].drop(self.db.engine)
+        with self.db.create_session() as sess:
+            sess.add(Role(name="gestion"))
+            sess.commit()
+
+        self.assertEqual(migrate(self.db.engine), [1, 2, 3])
+        self.assertEqual(migrate(self.db.engine), [])
+        with self.db.engine.connect() as conn:
+            self.assertEqual(current_version(conn), LATEST_VERSION)
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.query(Role).count(), 1)
+
+    def test_default_command_runs_cli_without_reset(self):
+        """Sans argument, la CLI démarre sur la base existante."""
+        self.runner.invoke(cli, ["migrate"])
+        with self.db.create_session() as sess:
+            sess.add(Role(name="gestion"))
+            sess.commit()
+
+        with patch("app.views.cli_interface.CLIInterface.run") as run:
+            result = self.runner.invoke(cli, [])
+        self.assertEqual(result.exit_code, 0, result.output)
+        run.assert_called_once()
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.query(Role).count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
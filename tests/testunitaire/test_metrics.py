@@ -0,0 +1,117 @@
+# tests/testunitaire/test_metrics.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – métriques Prometheus par action.
+
+Vérifie :
+    • compteurs d’appels et histogramme par méthode de contrôleur et rôle ;
+    • compteur d’erreurs par type d’exception ;
+    • l’export *textfile* et le point ``/metrics`` HTTP ;
+    • un coût d’enregistrement négligeable (quelques µs par action).
+"""
+
+import os
+import tempfile
+import timeit
+import unittest
+import urllib.request
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.data_reader import DataReader
+from app.controllers.data_writer import DataWriter
+from app.models import Base, Client, Role, User
+from app.observability import metrics
+from app.observability.actions import (
+    Action,
+    action_scope,
+    unregister_action_observer,
+)
+from app.observability.metrics import METRICS, install_metrics
+
+GESTION = {"id": 1, "role": "gestion"}
+SUPPORT = {"id": 2, "role": "support"}
+
+
+class MetricsTestCase(unittest.TestCase):
+    """Base SQLite mémoire, un client ; collecte active."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        with self.Session() as sess:
+            sess.add(Role(id=3, name="gestion"))
+            sess.add(User(id=1, employee_number="G001", first_name="G",
+                          last_name="U", email="g@x.io", password_hash="h",
+                          role_id=3))
+            sess.add(Client(full_name="A", email="a@x.io", commercial_id=1))
+            sess.commit()
+
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.textfile = os.path.join(self._dir.name, "prom", "epic.prom")
+        METRICS.reset()
+        self.server = install_metrics(textfile=self.textfile, port=0,
+                                      interval=0)
+        self.addCleanup(self._uninstall)
+
+    def _uninstall(self):
+        self.server.shutdown()
+        self.server.server_close()
+        unregister_action_observer(metrics._MetricsObserver)
+        metrics._textfile = None
+        METRICS.reset()
+
+    def create_session(self):
+        return self.Session()
+
+    def test_calls_latency_and_errors(self):
+        """Appels comptés par rôle ; refus comptés par exception."""
+        reader, writer = DataReader(self), DataWriter(self)
+        with self.Session() as sess:
+            for _ in range(3):
+                reader.get_all_clients(sess, GESTION)
+            with self.assertRaises(PermissionError):
+                writer.create_client(sess, SUPPORT, "B", "b@x.io",
+                                     None, None, None)
+
+        text = METRICS.render()
+        labels = 'kind="controller",action="DataReader.get_all_clients",' \
+                 'role="gestion"'
+        self.assertIn(f"epic_action_calls_total{{{labels}}} 3", text)
+        self.assertIn(f'epic_action_duration_seconds_bucket'
+                      f'{{{labels},le="+Inf"}} 3', text)
+        self.assertIn(f'epic_action_duration_quantile_seconds'
+                      f'{{{labels},quantile="0.99"}}', text)
+        self.assertIn(
+            'epic_action_errors_total{kind="controller",'
+            'action="DataWriter.create_client",role="support",'
+            'exception="PermissionError"} 1', text)
+
+    def test_textfile_and_http_endpoint(self):
+        """Action racine terminée : fichier écrit ; ``/metrics`` servi."""
+        with action_scope("Vue.menu", "cli", "gestion"):
+            pass
+
+        with open(self.textfile, encoding="utf-8") as fh:
+            self.assertIn('action="Vue.menu"', fh.read())
+
+        host, port = self.server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as resp:
+            self.assertIn("version=0.0.4", resp.headers["Content-Type"])
+            self.assertIn('action="Vue.menu"', resp.read().decode())
+
+    def test_record_is_cheap(self):
+        """Enregistrer une action coûte moins de 20 µs."""
+        action = Action("DataReader.get_all_clients", "controller", "gestion")
+        action.duration = 0.002
+        per_call = timeit.timeit(lambda: METRICS.record(action),
+                                 number=20_000) / 20_000
+        self.assertLess(per_call, 20e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
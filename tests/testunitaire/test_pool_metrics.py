@@ -0,0 +1,107 @@
+# tests/testunitaire/test_pool_metrics.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – métriques du pool de connexions.
+
+Vérifie :
+    • la lecture des réglages de pool depuis l’environnement ;
+    • le suivi des emprunts / restitutions et du débordement ;
+    • la mesure de l’attente lorsqu’un pool saturé bloque un emprunt ;
+    • la précision des percentiles de :class:`LatencyHistogram`.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from app.config.database import DatabaseConfig
+from app.observability.histogram import LatencyHistogram
+from app.observability.pool_metrics import PoolMetrics
+
+
+class PoolMetricsTestCase(unittest.TestCase):
+    """Pool *QueuePool* sur un fichier SQLite temporaire."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(
+            f"sqlite:///{os.path.join(self._dir.name, 'pool.db')}",
+            pool_size=1, max_overflow=1, pool_timeout=5,
+        )
+        self.metrics = PoolMetrics(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self._dir.cleanup()
+
+    def test_pool_options_from_env(self):
+        """Les variables ``DB_POOL_*`` alimentent ``engine_options``."""
+        # DB_ENGINE explicite : indépendant du .env et du shell (SQLite
+        # ``:memory:`` n’utilise pas ces réglages).
+        env = {"DB_ENGINE": "mysql+pymysql",
+               "DB_POOL_SIZE": "12", "DB_MAX_OVERFLOW": "3",
+               "DB_POOL_RECYCLE": "280", "DB_POOL_PRE_PING": "false"}
+        with patch.dict(os.environ, env):
+            options = DatabaseConfig().engine_options()
+        self.assertEqual(options["pool_size"], 12)
+        self.assertEqual(options["max_overflow"], 3)
+        self.assertEqual(options["pool_recycle"], 280)
+        self.assertFalse(options["pool_pre_ping"])
+
+    def test_checkout_and_overflow(self):
+        """Deux emprunts simultanés : un en pool, un en débordement."""
+        first, second = self.engine.connect(), self.engine.connect()
+        stats = self.metrics.snapshot()
+        self.assertEqual(stats["checked_out"], 2)
+        self.assertEqual(stats["overflow"], 1)
+        first.close()
+        second.close()
+
+        stats = self.metrics.snapshot()
+        self.assertEqual(stats["checked_out"], 0)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["checkout_latency"]["count"], 2)
+
+    def test_wait_time_when_saturated(self):
+        """Un emprunt bloqué sur un pool plein est comptabilisé en attente."""
+        held = [self.engine.connect(), self.engine.connect()]
+
+        def borrow():
+            self.engine.connect().close()
+
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        time.sleep(0.2)
+        self.assertEqual(self.metrics.snapshot()["waiting"], 1)
+        held[0].close()
+        worker.join()
+        held[1].close()
+
+        stats = self.metrics.snapshot()
+        self.assertGreaterEqual(stats["wait_time_total_ms"], 150)
+        self.assertGreaterEqual(stats["checkout_latency"]["max_ms"], 150)
+
+    def test_instrumentation_survives_dispose(self):
+        """``engine.dispose()`` recrée le pool sans perdre la mesure."""
+        self.engine.dispose()
+        self.engine.connect().close()
+        self.assertEqual(
+            self.metrics.snapshot()["checkout_latency"]["count"], 1)
+
+    def test_histogram_percentiles(self):
+        """Les percentiles restent dans la précision des seaux (~19 %)."""
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.record(ms / 1000)
+        self.assertAlmostEqual(hist.percentile(50), 0.5, delta=0.1)
+        self.assertAlmostEqual(hist.percentile(99), 0.99, delta=0.19)
+        self.assertEqual(hist.percentile(100), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/testunitaire/test_profiling.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – profilage des actions CLI (``EPIC_PROFILE_DIR``).
+
+Vérifie :
+    • qu’une action CLI tirée au sort produit un ``.pstats`` lisible et un
+      rapport d’allocations ;
+    • que seules les actions racines de type ``cli`` sont profilées ;
+    • le respect du taux d’échantillonnage.
+"""
+
+import glob
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.observability.actions import action_scope, unregister_action_observer
+from app.observability.profiling import (
+    ActionProfiler,
+    install_profiling_from_env,
+)
+
+
+def _allocate():
+    return [bytearray(1024) for _ in range(200)]
+
+
+class ProfilingTestCase(unittest.TestCase):
+    """Profileur enregistré sur un dossier temporaire."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.directory = os.path.join(self._dir.name, "profiles")
+
+    def _install(self, profiler):
+        from app.observability.actions import register_action_observer
+
+        register_action_observer(profiler)
+        self.addCleanup(unregister_action_observer, profiler)
+        return profiler
+
+    def test_cli_action_writes_reports(self):
+        """Action de menu : ``.pstats`` + top des allocations."""
+        with patch.dict(os.environ, {"EPIC_PROFILE_DIR": self.directory,
+                                     "EPIC_PROFILE_RATE": "1",
+                                     "EPIC_PROFILE_TOP": "5"}):
+            profiler = install_profiling_from_env()
+        self.addCleanup(unregister_action_observer, profiler)
+
+        with action_scope("DataReaderView.display_contracts_only", "cli",
+                          "gestion"):
+            with action_scope("DataReader.get_all_contracts", "controller"):
+                kept = _allocate()
+        self.assertEqual(len(kept), 200)
+
+        [stats_path] = glob.glob(os.path.join(self.directory, "*.pstats"))
+        self.assertIn("DataReaderView.display_contracts_only", stats_path)
+        functions = {func for (_, _, func) in pstats.Stats(stats_path).stats}
+        self.assertIn("_allocate", functions)
+
+        with open(stats_path[:-len(".pstats")] + ".mem.txt",
+                  encoding="utf-8") as fh:
+            report = fh.read()
+        self.assertIn("rôle    : gestion", report)
+        self.assertIn("Top 5 allocations", report)
+        self.assertIn("test_profiling.py", report)
+
+    def test_only_sampled_root_cli_actions(self):
+        """Contrôleur seul, tirage perdant : aucun profil."""
+        draws = iter([0.9, 0.1])
+        profiler = self._install(ActionProfiler(
+            self.directory, rate=0.5, memory=False,
+            draw=lambda: next(draws)))
+
+        with action_scope("DataReader.get_all_clients", "controller"):
+            pass
+        with action_scope("DataReaderView.display_clients_only", "cli"):
+            pass
+        self.assertEqual(profiler.profiled, 0)
+
+        with action_scope("DataReaderView.display_clients_only", "cli"):
+            pass
+        self.assertEqual(profiler.profiled, 1)
+        self.assertEqual(
+            len(glob.glob(os.path.join(self.directory, "*.mem.txt"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
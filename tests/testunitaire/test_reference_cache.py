@@ -0,0 +1,144 @@
+# tests/testunitaire/test_reference_cache.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – cache de référence (:class:`ReferenceCache`).
+
+Vérifie :
+    • que rôles et collaborateurs sont résolus sans requête une fois le
+      cache chargé ;
+    • que les préfixes de matricule dérivent du nom du rôle (plus de
+      table codée en dur) ;
+    • l’invalidation par les écritures collaborateur de DataWriter ;
+    • le rechargement sur un numéro inconnu (collaborateur créé
+      ailleurs) ;
+    • que le rôle de l’utilisateur connecté reste lisible hors session.
+"""
+
+import unittest
+
+from argon2 import PasswordHasher
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.authentification.auth_controller import AuthController
+from app.controllers.data_writer import DataWriter
+from app.controllers.reference_cache import reference_cache
+from app.models import Base, Role, User
+
+GESTION = {"id": 1, "role": "gestion"}
+
+
+class _DummyDB:
+    """Connexion SQLite mémoire exposant ``create_session``."""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://")
+        self.Session = sessionmaker(bind=self.engine)
+
+    def create_session(self):
+        return self.Session()
+
+
+class ReferenceCacheTestCase(unittest.TestCase):
+    """Quatre rôles, un gestionnaire et un support."""
+
+    def setUp(self):
+        self.db = _DummyDB()
+        self.addCleanup(self.db.engine.dispose)
+        Base.metadata.create_all(self.db.engine)
+        with self.db.create_session() as sess:
+            sess.add_all([Role(id=1, name="commercial"),
+                          Role(id=2, name="support"),
+                          Role(id=3, name="gestion"),
+                          Role(id=4, name="marketing")])
+            sess.add_all([
+                User(id=1, employee_number="G001", first_name="Gina",
+                     last_name="Gestion", email="g@x.io",
+                     password_hash=PasswordHasher().hash("pwd"), role_id=3),
+                User(id=2, employee_number="S001", first_name="Hugo",
+                     last_name="Durand", email="s@x.io", password_hash="h",
+                     role_id=2),
+            ])
+            sess.commit()
+        self.writer = DataWriter(self.db)
+        self.statements = []
+        event.listen(self.db.engine, "before_cursor_execute",
+                     self._count)
+
+    def _count(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _create(self, sess, role_id):
+        return self.writer.create_user(
+            sess, GESTION, None, "Ann", "Lee",
+            f"ann{role_id}.{len(self.statements)}@x.io", "h", role_id)
+
+    def test_lookups_without_queries(self):
+        """Cache chargé : rôles et supports résolus sans SQL."""
+        with self.db.create_session() as sess:
+            refs = reference_cache(sess).load(sess)
+            self.statements.clear()
+
+            self.assertEqual(refs.role_name(sess, 2), "support")
+            self.assertEqual(refs.role_id(sess, "gestion"), 3)
+            self.assertEqual(refs.collaborator(sess, "S001", "support").id, 2)
+            self.assertIsNone(refs.collaborator(sess, "S001", "commercial"))
+            self.assertEqual([c.employee_number
+                              for c in refs.collaborators(sess, "support")],
+                             ["S001"])
+            self.assertEqual(refs.role_menu(sess),
+                             "1=commercial, 2=support, 3=gestion, "
+                             "4=marketing")
+        self.assertEqual(self.statements, [])
+        self.assertIs(reference_cache(self.db), refs)
+
+    def test_prefix_follows_role_name(self):
+        """Matricule : initiale du rôle, y compris pour un rôle ajouté."""
+        with self.db.create_session() as sess:
+            self.assertEqual(self._create(sess, 1).employee_number, "C001")
+            self.assertEqual(self._create(sess, 4).employee_number, "M001")
+            with self.assertRaisesRegex(ValueError, "Rôle inconnu"):
+                self._create(sess, 9)
+
+    def test_writer_mutations_invalidate(self):
+        """Création, changement de rôle, suppression : annuaire à jour."""
+        with self.db.create_session() as sess:
+            refs = reference_cache(sess)
+            created = self._create(sess, 2)
+            self.assertEqual(
+                refs.collaborator(sess, created.employee_number).role,
+                "support")
+
+            self.writer.update_user_by_employee_number(
+                sess, GESTION, "S001", role_id=1)
+            self.assertIsNone(refs.collaborator(sess, "S001", "support"))
+            self.assertEqual(refs.collaborator(sess, "S001").role,
+                             "commercial")
+
+            self.writer.delete_user(sess, GESTION, "S001")
+            self.assertIsNone(refs.collaborator(sess, "S001"))
+
+    def test_unknown_number_reloads_once(self):
+        """Collaborateur ajouté hors DataWriter : trouvé après rechargement."""
+        with self.db.create_session() as sess:
+            refs = reference_cache(sess).load(sess)
+            sess.add(User(id=3, employee_number="S002", first_name="Lou",
+                          last_name="Roy", email="l@x.io", password_hash="h",
+                          role_id=2))
+            sess.commit()
+            loads = refs.loads
+
+            self.assertEqual(refs.collaborator(sess, "S002").full_name(),
+                             "Lou Roy")
+            self.assertIsNone(refs.collaborator(sess, "X999"))
+        self.assertEqual(refs.loads, loads + 2)
+
+    def test_login_role_readable_after_close(self):
+        """Utilisateur authentifié : ``user.role.name`` hors session."""
+        with self.db.create_session() as sess:
+            user = AuthController().authenticate_user(sess, "g@x.io", "pwd")
+        self.assertEqual(user.role.name, "gestion")
+
+
+if __name__ == "__main__":
+    unittest.main()
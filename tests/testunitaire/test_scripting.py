@@ -0,0 +1,154 @@
+# tests/testunitaire/test_scripting.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – commandes non interactives (``main.scripting``).
+
+Vérifie :
+    • que ``login`` enregistre un jeton privé (``0600``) réutilisé ensuite ;
+    • les listes ``--mine`` aux formats JSON et CSV ;
+    • ``contracts update`` (modification partielle) et le refus d’un
+      contrat hors périmètre (code de sortie 1) ;
+    • ``export`` vers la sortie standard ;
+    • qu’une commande sans jeton est refusée.
+"""
+
+import csv
+import json
+import os
+import stat
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from argon2 import PasswordHasher
+from click.testing import CliRunner
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, Client, Contract, Role, User
+from main.cli import cli
+
+
+class _DummyDB:
+    """Connexion SQLite mémoire exposant ``create_session``."""
+
+    def __init__(self):
+        self.engine = create_engine(
+            "sqlite://", poolclass=StaticPool,
+            connect_args={"check_same_thread": False})
+        self.Session = sessionmaker(bind=self.engine)
+
+    def create_session(self):
+        return self.Session()
+
+
+class ScriptingTestCase(unittest.TestCase):
+    """Deux commerciaux, un client et un contrat chacun."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.token_file = os.path.join(self._dir.name, "sub", "token")
+
+        self.db = _DummyDB()
+        self.addCleanup(self.db.engine.dispose)
+        Base.metadata.create_all(self.db.engine)
+        pw_hash = PasswordHasher().hash("Secret-123")
+        with self.db.create_session() as sess:
+            sess.add(Role(id=1, name="commercial"))
+            for uid in (1, 2):
+                sess.add(User(id=uid, employee_number=f"C00{uid}",
+                              first_name="C", last_name=str(uid),
+                              email=f"c{uid}@x.io", password_hash=pw_hash,
+                              role_id=1))
+                sess.add(Client(id=uid, full_name=f"Client {uid}",
+                                email=f"client{uid}@x.io", commercial_id=uid))
+                sess.add(Contract(id=uid, client_id=uid, commercial_id=uid,
+                                  total_amount=1000, remaining_amount=400,
+                                  is_signed=True))
+            sess.commit()
+
+        for patcher in (
+            patch("main.cli._connection", return_value=self.db),
+            patch.dict(os.environ, {"EPIC_TOKEN_FILE": self.token_file}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.runner = CliRunner()
+
+    def _invoke(self, *args):
+        return self.runner.invoke(cli, list(args))
+
+    def _login(self):
+        result = self._invoke("login", "--email", "c1@x.io",
+                              "--password", "Secret-123")
+        self.assertEqual(result.exit_code, 0, result.output)
+
+    def test_login_persists_private_token(self):
+        """Jeton écrit en ``0600`` ; ``logout`` le supprime."""
+        self._login()
+        mode = stat.S_IMODE(os.stat(self.token_file).st_mode)
+        self.assertEqual(mode, 0o600)
+
+        self._invoke("logout")
+        self.assertFalse(os.path.exists(self.token_file))
+
+    def test_bad_password_is_rejected(self):
+        result = self._invoke("login", "--email", "c1@x.io",
+                              "--password", "nope")
+        self.assertEqual(result.exit_code, 1)
+        self.assertFalse(os.path.exists(self.token_file))
+
+    def test_list_mine_as_json_and_csv(self):
+        """``--mine`` restreint au commercial du jeton."""
+        self._login()
+        result = self._invoke("clients", "list", "--mine", "--format", "json")
+        self.assertEqual(result.exit_code, 0, result.output)
+        rows = json.loads(result.output)
+        self.assertEqual([r["full_name"] for r in rows], ["Client 1"])
+
+        result = self._invoke("contracts", "list", "--format", "csv")
+        rows = list(csv.DictReader(StringIO(result.output)))
+        self.assertEqual(len(rows), 2)
+        self.assertNotIn("password_hash", rows[0])
+
+    def test_update_contract(self):
+        """Seules les options fournies sont modifiées."""
+        self._login()
+        result = self._invoke("contracts", "update", "1", "--remaining", "0",
+                              "--format", "json")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(json.loads(result.output)[0]["remaining_amount"], 0)
+        with self.db.create_session() as sess:
+            contract = sess.get(Contract, 1)
+            self.assertEqual(contract.remaining_amount, 0)
+            self.assertEqual(contract.total_amount, 1000)
+
+    def test_update_foreign_contract_fails(self):
+        """Contrat d’un autre commercial : message d’erreur, code 1."""
+        self._login()
+        result = self._invoke("contracts", "update", "2", "--remaining", "0")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Contrat non autorisé", result.output)
+        with self.db.create_session() as sess:
+            self.assertEqual(sess.get(Contract, 2).remaining_amount, 400)
+
+    def test_export_to_stdout(self):
+        """``export clients -o -`` : NDJSON sur la sortie standard."""
+        self._login()
+        result = self._invoke("export", "clients", "--mine",
+                              "--format", "ndjson", "-o", "-")
+        self.assertEqual(result.exit_code, 0, result.output)
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        self.assertEqual([r["id"] for r in rows], [1])
+
+    def test_command_without_token_fails(self):
+        result = self._invoke("events", "list")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Non connecté", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# tests/testunitaire/test_session_scope.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – session unique par action CLI.
+
+Vérifie :
+    • qu’un périmètre partage une même session entre tous les appels ;
+    • qu’une action complète (vérification + recherche + écriture) ne
+      consomme qu’un seul emprunt de connexion au pool ;
+    • que hors périmètre chaque bloc garde sa propre session ;
+    • qu’aucune transaction ne reste ouverte pendant une saisie.
+"""
+
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from app.config.database import DatabaseConfig, DatabaseConnection
+from app.config.session_scope import (
+    before_prompt, request_scope, use_session)
+from app.models import Base, Client, Contract, Role, User
+from app.views.data_writer_view import DataWriterView
+
+GESTION = {"id": 1, "role": "gestion", "role_id": 3}
+
+
+class SessionScopeTestCase(unittest.TestCase):
+    """Base SQLite fichier : un gestionnaire, un commercial, un contrat."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        env = {"DB_ENGINE": "sqlite",
+               "DB_NAME": os.path.join(self._dir.name, "scope.db")}
+        with patch.dict(os.environ, env):
+            self.db = DatabaseConnection(DatabaseConfig())
+        Base.metadata.create_all(self.db.engine)
+        with self.db.create_session() as sess:
+            sess.add_all([Role(id=1, name="commercial"),
+                          Role(id=3, name="gestion")])
+            sess.add_all([
+                User(id=1, employee_number="G001", first_name="G",
+                     last_name="U", email="g@x.io", password_hash="h",
+                     role_id=3),
+                User(id=2, employee_number="C001", first_name="C",
+                     last_name="U", email="c@x.io", password_hash="h",
+                     role_id=1),
+            ])
+            sess.add(Client(id=1, full_name="A", email="a@x.io",
+                            commercial_id=1))
+            sess.add(Contract(id=1, client_id=1, commercial_id=1,
+                              total_amount=100, remaining_amount=100))
+            sess.commit()
+
+    def tearDown(self):
+        self.db.dispose()
+        self._dir.cleanup()
+
+    def test_scope_shares_one_session(self):
+        """Deux ``use_session`` dans un périmètre : même objet session."""
+        with request_scope(self.db):
+            with use_session(self.db) as first:
+                pass
+            with use_session(self.db) as second:
+                self.assertIs(first, second)
+                self.assertIsNotNone(second.get(Contract, 1))
+
+        with use_session(self.db) as a, use_session(self.db) as b:
+            self.assertIsNot(a, b)
+
+    def test_no_transaction_during_prompt(self):
+        """Lecture puis saisie : transaction close, entité toujours chargée."""
+        view = DataWriterView(self.db)
+        seen = []
+        with request_scope(self.db):
+            with use_session(self.db) as sess:
+                contract = sess.get(Contract, 1)
+                self.assertTrue(sess.in_transaction())
+
+            def answer(*_):
+                seen.append(sess.in_transaction())
+                return "C001"
+
+            with patch("builtins.input", answer):
+                view._ask("Employee Number : ")
+            self.assertEqual(seen, [False])
+            self.assertEqual(contract.__dict__["total_amount"], 100)
+
+            # Modification non envoyée : rien n’est validé à sa place.
+            contract.total_amount = 50
+            before_prompt()
+            self.assertTrue(sess.in_transaction())
+            sess.rollback()
+
+    def test_update_contract_uses_one_checkout(self):
+        """Vérif + recherche commercial + écriture : un seul emprunt."""
+        view = DataWriterView(self.db)
+        answers = iter(["1", "", "500", "", "", "C001"])
+        before = self.db.pool_stats()["checkouts"]
+
+        with patch("builtins.input", lambda *_: next(answers)), \
+                redirect_stdout(StringIO()) as out, \
+                request_scope(self.db):
+            view.update_contract_cli(GESTION)
+
+        self.assertIn("Contrat modifié", out.getvalue())
+        self.assertEqual(self.db.pool_stats()["checkouts"] - before, 1)
+        with self.db.create_session() as sess:
+            contract = sess.get(Contract, 1)
+            self.assertEqual(contract.total_amount, 500)
+            self.assertEqual(contract.commercial_id, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# tests/testunitaire/test_spool_transport.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – transport Sentry sur spool disque.
+
+Un serveur HTTP local tient lieu de Sentry.  Vérifie :
+    • qu’une capture hors ligne rend la main immédiatement et conserve
+      l’enveloppe sur disque ;
+    • le réessai après une erreur 5xx / 429 (``Retry-After``) ;
+    • l’envoi en tâche de fond via ``sentry_sdk`` une fois « en ligne » ;
+    • que ``flush`` attend un tour d’envoi commencé après l’appel ;
+    • la taille maximale du spool ;
+    • le repli sur le transport du SDK si le spool est inutilisable.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import sentry_sdk
+from sentry_sdk.envelope import Envelope
+
+from app.observability.sentry import init_sentry
+from app.observability.spool_transport import SpoolTransport
+
+
+class _StandIn:
+    """Faux Sentry : répond avec les codes de ``statuses`` puis 200."""
+
+    def __init__(self):
+        self.statuses = []
+        self.bodies = []
+        self.auth = []
+        self.received = threading.Event()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                body = self.rfile.read(length)
+                status = stand_in.statuses.pop(0) if stand_in.statuses else 200
+                if status == 200:          # avant la réponse : pas de course
+                    stand_in.bodies.append(body)
+                    stand_in.auth.append(self.headers["X-Sentry-Auth"])
+                    stand_in.received.set()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "7")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.dsn = f"http://pub@127.0.0.1:{self.server.server_port}/42"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _envelope(message="hello"):
+    envelope = Envelope()
+    envelope.add_event({"message": message, "level": "info"})
+    return envelope
+
+
+def _closed_port_dsn():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://pub@127.0.0.1:{port}/42"
+
+
+class SpoolTransportTestCase(unittest.TestCase):
+    """Spool dans un dossier temporaire."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.spool = self._dir.name
+
+    def _transport(self, dsn, **options):
+        transport = SpoolTransport({"dsn": dsn}, self.spool, **options)
+        self.addCleanup(transport.kill)
+        return transport
+
+    def _stand_in(self):
+        stand_in = _StandIn()
+        self.addCleanup(stand_in.close)
+        return stand_in
+
+    def test_offline_capture_is_immediate_and_kept(self):
+        """Hors ligne : capture sans attente, enveloppe conservée."""
+        transport = self._transport(_closed_port_dsn(), background=False)
+        started = time.perf_counter()
+        transport.capture_envelope(_envelope())
+        self.assertLess(time.perf_counter() - started, 0.05)
+        self.assertEqual(len(transport.pending()), 1)
+
+        self.assertGreater(transport.drain(), 0)
+        self.assertEqual(len(transport.pending()), 1)
+        self.assertFalse(transport.is_healthy())
+
+    def test_retry_after_server_errors(self):
+        """503 puis 429 : réessais ; ensuite envoi dans l’ordre."""
+        stand_in = self._stand_in()
+        stand_in.statuses = [503, 429]
+        transport = self._transport(stand_in.dsn, background=False,
+                                    base_delay=0.5)
+        transport.capture_envelope(_envelope("first"))
+        transport.capture_envelope(_envelope("second"))
+
+        self.assertLessEqual(transport.drain(), 0.5)
+        self.assertGreaterEqual(transport.drain(), 7)
+        self.assertIsNone(transport.drain())
+
+        self.assertEqual(transport.pending(), [])
+        self.assertEqual(transport.sent, 2)
+        self.assertIn(b'"first"', stand_in.bodies[0])
+        self.assertIn(b'"second"', stand_in.bodies[1])
+        self.assertIn("sentry_key=pub", stand_in.auth[0])
+
+    def test_rejected_envelope_is_dropped(self):
+        """400 : enveloppe refusée, supprimée sans réessai."""
+        stand_in = self._stand_in()
+        stand_in.statuses = [400]
+        transport = self._transport(stand_in.dsn, background=False)
+        transport.capture_envelope(_envelope())
+        self.assertIsNone(transport.drain())
+        self.assertEqual(transport.pending(), [])
+
+    def test_sdk_capture_is_sent_in_background(self):
+        """``capture_message`` via le SDK : reçu par le faux Sentry."""
+        stand_in = self._stand_in()
+        transport = self._transport(stand_in.dsn)
+        sentry_sdk.init(dsn=stand_in.dsn, transport=transport,
+                        default_integrations=False)
+        self.addCleanup(sentry_sdk.get_global_scope().set_client, None)
+
+        sentry_sdk.capture_message("spooled ping")
+        sentry_sdk.flush(timeout=5)
+        self.assertTrue(stand_in.received.wait(5))
+        self.assertIn(b"spooled ping", stand_in.bodies[0])
+        deadline = time.monotonic() + 5
+        while transport.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(transport.pending(), [])
+
+    def test_flush_waits_for_a_round_started_after_the_call(self):
+        """Un tour en cours lors du ``flush`` ne suffit pas."""
+        entered, release = threading.Event(), threading.Event()
+        calls = []
+
+        def drain(transport):
+            pending = len(transport.pending())
+            if not calls:                  # tour lancé au démarrage
+                entered.set()
+                release.wait(5)
+            else:
+                time.sleep(0.1)
+            calls.append(pending)          # tour terminé
+            return None
+
+        with patch.object(SpoolTransport, "drain", drain):
+            transport = self._transport(_closed_port_dsn())
+            self.assertTrue(entered.wait(5))
+            transport.capture_envelope(_envelope())
+            threading.Timer(0.1, release.set).start()
+            transport.flush(timeout=5)
+            self.assertEqual(calls, [0, 1])
+
+    def test_unusable_spool_falls_back_to_sdk_transport(self):
+        """Dossier de spool impossible à créer : pas d’exception."""
+        blocker = os.path.join(self.spool, "file")
+        open(blocker, "w").close()
+        env = {"SENTRY_DSN": "http://pub@127.0.0.1:9/42",
+               "SENTRY_SPOOL_DIR": os.path.join(blocker, "spool")}
+        self.addCleanup(sentry_sdk.get_global_scope().set_client, None)
+        with patch.dict(os.environ, env):
+            init_sentry()
+        transport = sentry_sdk.get_client().transport
+        self.assertIsNotNone(transport)
+        self.assertNotIsInstance(transport, SpoolTransport)
+        transport.kill()
+
+    def test_spool_is_bounded(self):
+        """Au‑delà de ``max_bytes`` : les plus anciennes sont abandonnées."""
+        transport = self._transport(_closed_port_dsn(), background=False,
+                                    max_bytes=600)
+        for i in range(10):
+            transport.capture_envelope(_envelope(f"message {i}" * 5))
+        pending = transport.pending()
+        self.assertLess(len(pending), 10)
+        with open(pending[-1], "rb") as fh:
+            self.assertIn(b"message 9", fh.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# tests/testunitaire/test_sql_instrumentation.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – instrumentation SQL par action.
+
+Vérifie :
+    • l’imputation des requêtes à la méthode de contrôleur *et* à l’action
+      CLI englobante ;
+    • le journal des requêtes lentes, paramètres masqués ;
+    • le budget de requêtes par action (détection d’un N+1, exception
+      sérialisable) ;
+    • l’absence de départ orphelin après une requête en échec.
+"""
+
+import pickle
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.data_reader import DataReader
+from app.models import Base, Client, Role, User
+from app.observability.actions import action_scope
+from app.observability.sql_instrumentation import (
+    SQL_STATS,
+    QueryBudgetExceeded,
+    SqlInstrumentation,
+)
+
+CURRENT = {"id": 1, "role": "gestion"}
+
+
+class SqlInstrumentationTestCase(unittest.TestCase):
+    """Base SQLite mémoire instrumentée, deux clients."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        with self.Session() as sess:
+            sess.add(Role(id=3, name="gestion"))
+            sess.add(User(id=1, employee_number="G001", first_name="G",
+                          last_name="U", email="g@x.io", password_hash="h",
+                          role_id=3))
+            sess.add_all([Client(full_name=f"C{i}", email=f"c{i}@x.io",
+                                 commercial_id=1) for i in range(2)])
+            sess.commit()
+        self.reader = DataReader(self)
+        SQL_STATS.reset()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def create_session(self):
+        return self.Session()
+
+    def test_queries_attributed_to_method_and_cli_action(self):
+        """Les requêtes remontent à la méthode et à l’action CLI."""
+        SqlInstrumentation(self.engine, slow_ms=10_000, budget=0)
+        with self.Session() as sess:
+            with action_scope("Vue.afficher", "cli", "gestion") as action:
+                clients = self.reader.get_all_clients(sess, CURRENT)
+                for client in clients:
+                    client.commercial.email     # chargement paresseux
+        self.assertEqual(action.queries, 2)
+        self.assertGreater(action.sql_time, 0)
+
+        stats = SQL_STATS.snapshot()
+        self.assertEqual(stats["DataReader.get_all_clients"]["queries"], 1)
+        self.assertEqual(stats["Vue.afficher"]["queries"], 2)
+
+    def test_slow_query_log_redacts_parameters(self):
+        """Au‑dessus du seuil, la requête est journalisée sans valeurs."""
+        SqlInstrumentation(self.engine, slow_ms=0, budget=0)
+        with self.assertLogs("epic_events.sql.slow", "WARNING") as logs:
+            with self.Session() as sess:
+                sess.query(Client).filter(
+                    Client.email == "secret@x.io").all()
+        line = logs.output[-1]
+        self.assertIn("FROM clients", line)
+        self.assertIn("(?)", line)
+        self.assertNotIn("secret@x.io", line)
+
+    def test_query_budget_exceeded(self):
+        """Un N+1 au‑delà du budget échoue bruyamment."""
+        SqlInstrumentation(self.engine, slow_ms=10_000, budget=2)
+        with self.Session() as sess:
+            with self.assertRaises(QueryBudgetExceeded) as ctx:
+                with action_scope("Vue.n_plus_un", "cli"):
+                    for client_id in (1, 2, 3):
+                        sess.query(Client).filter_by(id=client_id).all()
+        self.assertEqual(ctx.exception.action, "Vue.n_plus_un")
+        copy = pickle.loads(pickle.dumps(ctx.exception))
+        self.assertEqual(str(copy), str(ctx.exception))
+
+    def test_failed_statement_does_not_leak_start(self):
+        """Une requête en échec ne laisse pas son départ sur la connexion."""
+        SqlInstrumentation(self.engine, slow_ms=10_000, budget=0)
+        with self.engine.connect() as conn:
+            for _ in range(3):
+                with self.assertRaises(OperationalError):
+                    conn.execute(text("SELECT * FROM table_absente"))
+            conn.execute(text("SELECT 1"))
+            self.assertEqual(conn.info.get("epic_query_start"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# tests/testunitaire/test_sqlite_backend.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – moteur SQLite (``DB_ENGINE=sqlite``).
+
+Vérifie :
+    • la construction des URL fichier et mémoire ;
+    • l’application des *pragmas* sur chaque connexion ;
+    • le bon fonctionnement des ``SAVEPOINT`` (transactions imbriquées) ;
+    • le partage d’une base mémoire entre sessions.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+from app.config.database import DatabaseConfig, DatabaseConnection
+from app.models import Base, Role
+
+
+class SqliteBackendTestCase(unittest.TestCase):
+    """Base SQLite temporaire configurée par l’environnement."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "epic.db")
+        env = {"DB_ENGINE": "sqlite", "DB_NAME": self.path,
+               "SQLITE_CACHE_SIZE": "-2048"}
+        with patch.dict(os.environ, env):
+            self.config = DatabaseConfig()
+        self.db = DatabaseConnection(self.config)
+
+    def tearDown(self):
+        self.db.dispose()
+        self._dir.cleanup()
+
+    def test_file_url(self):
+        """Le chemin ``DB_NAME`` devient une URL ``sqlite:///``."""
+        self.assertEqual(self.config.sqlalchemy_database_url,
+                         f"sqlite:///{self.path}")
+        self.assertIn("pool_size", self.config.engine_options())
+
+    def test_pragmas_applied(self):
+        """WAL, synchronous=NORMAL, clés étrangères et cache réglé."""
+        with self.db.engine.connect() as conn:
+            pragma = lambda name: conn.exec_driver_sql(  # noqa: E731
+                f"PRAGMA {name}").scalar()
+            self.assertEqual(pragma("journal_mode"), "wal")
+            self.assertEqual(pragma("synchronous"), 1)
+            self.assertEqual(pragma("foreign_keys"), 1)
+            self.assertEqual(pragma("cache_size"), -2048)
+            self.assertEqual(pragma("busy_timeout"), 5000)
+
+    def test_savepoint_rollback(self):
+        """Un ``begin_nested`` annulé n’emporte pas la transaction."""
+        Base.metadata.create_all(self.db.engine)
+        with self.db.create_session() as sess:
+            sess.add(Role(name="gestion"))
+            nested = sess.begin_nested()
+            sess.add(Role(name="support"))
+            sess.flush()
+            nested.rollback()
+            sess.commit()
+        with self.db.create_session() as sess:
+            names = [r.name for r in sess.query(Role).all()]
+        self.assertEqual(names, ["gestion"])
+
+    def test_memory_database_shared(self):
+        """``:memory:`` : une seule connexion partagée, sans options de pool."""
+        with patch.dict(os.environ, {"DB_ENGINE": "sqlite",
+                                     "DB_NAME": ":memory:"}):
+            cfg = DatabaseConfig()
+        self.assertEqual(cfg.sqlalchemy_database_url, "sqlite://")
+        self.assertNotIn("pool_size", cfg.engine_options())
+
+        db = DatabaseConnection(cfg)
+        Base.metadata.create_all(db.engine)
+        with db.create_session() as sess:
+            sess.add(Role(name="commercial"))
+            sess.commit()
+        with db.engine.connect() as conn:
+            self.assertEqual(
+                conn.execute(text("SELECT COUNT(*) FROM roles")).scalar(), 1)
+        db.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+# tests/testunitaire/test_startup_budget.py
+# -*- coding: utf-8 -*-
+"""
+Tests de non‑régression du temps de démarrage (``-X importtime``).
+
+Vérifie que l’import des points d’entrée de la CLI ne charge aucune
+dépendance lourde et reste sous le budget ``STARTUP_BUDGET_MS``
+(100 ms par défaut).
+"""
+
+import os
+import unittest
+
+from app.observability.importtime import check_startup_budget
+
+_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "100"))
+
+
+class StartupBudgetTestCase(unittest.TestCase):
+    """Chaque point d’entrée est importé dans un interpréteur neuf."""
+
+    def test_cli_interface_is_light(self):
+        """Le menu principal ne tire ni Argon2, ni JWT, ni SQLAlchemy."""
+        self.assertEqual(
+            check_startup_budget("app.views.cli_interface", _BUDGET_MS), [])
+
+    def test_main_module_is_light(self):
+        """``python -m main`` n’importe rien de lourd avant ``main()``."""
+        self.assertEqual(
+            check_startup_budget("main.__main__", _BUDGET_MS), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# tests/testunitaire/test_table_renderer.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – rendu tabulaire de :class:`GenericView`.
+
+Vérifie :
+    • l’alignement (largeurs tirées de l’échantillon, troncature) ;
+    • le message « Aucune donnée. » écrit sur le flux demandé ;
+    • l’écriture par blocs (peu d’appels à ``write`` pour 100 000 lignes) ;
+    • le passage par le *pager* uniquement au‑delà de la hauteur d’écran ;
+    • l’affichage des clients par DataReaderView.
+"""
+
+import os
+import shlex
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from os import terminal_size
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Client, Role, User
+from app.views.data_reader_view import DataReaderView
+from app.views.generic_view import GenericView
+
+
+class _CountingStream(StringIO):
+    """StringIO comptant les appels à ``write``."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TableRendererTestCase(unittest.TestCase):
+    """Rendu sur flux mémoire (jamais un terminal)."""
+
+    def setUp(self):
+        self.view = GenericView()
+
+    def _lines(self, out):
+        return out.getvalue().splitlines()
+
+    def test_alignment_and_truncation(self):
+        """Colonnes alignées ; valeurs longues tronquées ; None vide."""
+        out = StringIO()
+        self.view.print_table(
+            ["id", "nom"], [(1, "a" * 60), (22, None)],
+            max_width=10, out=out)
+        header, sep, first, second = self._lines(out)
+        self.assertIn("id | nom", header)
+        self.assertEqual(sep, "---+-----------")
+        self.assertEqual(first, "1  | " + "a" * 10)
+        self.assertEqual(second.rstrip(), "22 |")
+
+    def test_empty_listing_writes_to_out(self):
+        """Liste vide : le message va sur *out*, pas sur stdout."""
+        out = StringIO()
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            count = self.view.print_table(["id"], [], out=out)
+        self.assertEqual(count, 0)
+        self.assertIn("Aucune donnée.", out.getvalue())
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_large_listing_is_chunked(self):
+        """100 000 lignes : quelques dizaines d’écritures seulement."""
+        out = _CountingStream()
+        rows = ((i, f"client {i}", i * 1.5) for i in range(100_000))
+        count = self.view.print_table(["id", "nom", "montant"], rows, out=out)
+        self.assertEqual(count, 100_000)
+        self.assertEqual(len(self._lines(out)), 100_002)
+        self.assertLess(out.writes, 60)
+
+    def test_pager_only_when_taller_than_terminal(self):
+        """Court : sortie directe ; long : tout passe par ``$PAGER``."""
+        with tempfile.TemporaryDirectory() as tmp:
+            target = os.path.join(tmp, "paged.txt")
+            pager = shlex.join([
+                sys.executable, "-c",
+                f"import sys; open({target!r}, 'w').write(sys.stdin.read())",
+            ])
+            with patch.dict(os.environ, {"PAGER": pager}), \
+                    patch("shutil.get_terminal_size",
+                          return_value=terminal_size((80, 10))):
+                short = StringIO()
+                self.view.print_table(["n"], [(i,) for i in range(3)],
+                                      out=short, pager=True)
+                self.assertFalse(os.path.exists(target))
+                self.assertEqual(len(self._lines(short)), 5)
+
+                long_ = StringIO()
+                self.view.print_table(["n"], [(i,) for i in range(50)],
+                                      out=long_, pager=True)
+            self.assertEqual(long_.getvalue(), "")
+            with open(target, encoding="utf-8") as fh:
+                self.assertEqual(len(fh.read().splitlines()), 52)
+
+
+class DataReaderViewTableTestCase(unittest.TestCase):
+    """Affichage des clients via DataReaderView."""
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.Session = sessionmaker(bind=engine)
+        with self.Session() as sess:
+            sess.add(Role(id=1, name="commercial"))
+            sess.add(User(id=1, employee_number="C001", first_name="C",
+                          last_name="U", email="c@x.io", password_hash="h",
+                          role_id=1))
+            sess.add(Client(full_name="Kevin Casey", email="kevin@x.io",
+                            commercial_id=1))
+            sess.commit()
+
+    def create_session(self):
+        return self.Session()
+
+    def test_display_clients_as_table(self):
+        out = StringIO()
+        with patch("sys.stdout", out):
+            DataReaderView(self).display_clients_only(
+                {"id": 1, "role": "commercial"})
+        lines = out.getvalue().splitlines()
+        self.assertIn("full_name", lines[0])
+        self.assertIn("Kevin Casey", lines[2])
+        self.assertEqual(len(lines), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
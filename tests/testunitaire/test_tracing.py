@@ -0,0 +1,139 @@
+# tests/testunitaire/test_tracing.py
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires – traces de performance Sentry.
+
+Vérifie :
+    • l’échantillonnage par nature d’action (lecture, écriture, échec
+      récent, décision du parent) ;
+    • qu’une action CLI devient une transaction contenant les spans des
+      méthodes de contrôleur et des requêtes SQL ;
+    • qu’une transaction non échantillonnée ne crée aucun span.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+import sentry_sdk
+from sentry_sdk.transport import Transport
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.data_reader import DataReader
+from app.controllers.data_writer import DataWriter
+from app.models import Base, Client, Role, User
+from app.observability.actions import action_scope, unregister_action_observer
+from app.observability.sentry import init_sentry
+from app.observability.tracing import TraceSampler, is_write, trace_action
+
+GESTION = {"id": 1, "role": "gestion"}
+_ENVELOPES = []
+
+
+class _CaptureTransport(Transport):
+    """Transport Sentry conservant les enveloppes en mémoire."""
+
+    def capture_envelope(self, envelope):
+        _ENVELOPES.append(envelope)
+
+
+class TraceSamplerTestCase(unittest.TestCase):
+    """Taux choisis selon le nom de l’action."""
+
+    def setUp(self):
+        self.sampler = TraceSampler(read_rate=0.01, write_rate=0.5,
+                                    error_rate=1.0)
+
+    def _rate(self, name, parent=None):
+        return self.sampler({"transaction_context": {"name": name},
+                             "parent_sampled": parent})
+
+    def test_reads_writes_and_parent(self):
+        self.assertTrue(is_write("LoginView.login_with_credentials_return_user"))
+        self.assertFalse(is_write("DataReaderView.display_clients_only"))
+        self.assertEqual(self._rate("DataReaderView.display_clients_only"),
+                         0.01)
+        self.assertEqual(self._rate("DataWriterView.update_contract_cli"), 0.5)
+        self.assertEqual(self._rate("DataReader.get_all_clients", True), 1.0)
+
+    def test_recent_failure_is_oversampled(self):
+        self.sampler.record_error("DataReaderView.display_events_only")
+        self.assertEqual(self._rate("DataReaderView.display_events_only"), 1.0)
+        self.sampler.error_window = 0
+        self.assertEqual(self._rate("DataReaderView.display_events_only"),
+                         0.01)
+
+
+class TracingTestCase(unittest.TestCase):
+    """SDK initialisé par ``init_sentry`` avec un transport mémoire."""
+
+    def setUp(self):
+        env = {"SENTRY_DSN": "https://key@example.invalid/1",
+               "SENTRY_TRACES": "1.0", "SENTRY_TRACES_READ": "0.0"}
+        real_init = sentry_sdk.init
+        with patch.dict(os.environ, env), \
+                patch("sentry_sdk.init",
+                      lambda **kw: real_init(
+                          **{**kw, "transport": _CaptureTransport})):
+            init_sentry()
+        self.addCleanup(self._shutdown)
+        _ENVELOPES.clear()
+
+        self.engine = create_engine("sqlite://")
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        with self.Session() as sess:
+            sess.add(Role(id=3, name="gestion"))
+            sess.add(User(id=1, employee_number="G001", first_name="G",
+                          last_name="U", email="g@x.io", password_hash="h",
+                          role_id=3))
+            sess.commit()
+
+    def _shutdown(self):
+        unregister_action_observer(trace_action)
+        sentry_sdk.get_client().close()
+        sentry_sdk.get_global_scope().set_client(None)
+
+    def create_session(self):
+        return self.Session()
+
+    def _transactions(self):
+        sentry_sdk.flush()
+        events = [env.get_transaction_event() for env in _ENVELOPES]
+        return [event for event in events if event]
+
+    def test_write_action_is_traced_with_spans(self):
+        """Action CLI d’écriture : transaction, spans contrôleur et SQL."""
+        writer = DataWriter(self)
+        with action_scope("DataWriterView.create_client_cli", "cli",
+                          "gestion"):
+            with self.Session() as sess:
+                writer.create_client(sess, GESTION, "A", "a@x.io",
+                                     None, None, 1)
+
+        [event] = self._transactions()
+        self.assertEqual(event["transaction"],
+                         "DataWriterView.create_client_cli")
+        self.assertEqual(event["contexts"]["trace"]["op"], "cli.action")
+        self.assertEqual(event["tags"]["role"], "gestion")
+        ops = {(span["op"], span.get("description")) for span in event["spans"]}
+        self.assertIn(("controller", "DataWriter.create_client"), ops)
+        self.assertTrue(any(op == "db" for op, _ in ops))
+
+    def test_unsampled_read_creates_nothing(self):
+        """Lecture à 0 % : aucune transaction envoyée."""
+        reader = DataReader(self)
+        with self.Session() as sess:
+            sess.add(Client(full_name="A", email="a@x.io", commercial_id=1))
+            sess.commit()
+            with action_scope("DataReaderView.display_clients_only", "cli",
+                              "gestion"):
+                self.assertEqual(len(reader.get_all_clients(sess, GESTION)),
+                                 1)
+        self.assertEqual(self._transactions(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()